@@ -6,18 +6,44 @@ from napi_python import load_addon
 # Load the native canvas addon (npm install canvas)
 canvas = load_addon("node_modules/canvas/build/Release/canvas.node")
 
+
+def draw_batch(ctx, commands):
+    """
+    Run a list of fill commands against a 2D context.
+
+    Each property set or method call crosses into the native addon, so
+    methods are bound once and fillStyle/font are only assigned when they
+    actually change between commands.
+    """
+    fill_rect = ctx.fillRect
+    fill_text = ctx.fillText
+    style = font = None
+    for command in commands:
+        if command[1] != style:
+            style = command[1]
+            ctx.fillStyle = style
+        if command[0] == "fillRect":
+            fill_rect(*command[2:])
+        else:
+            if command[2] != font:
+                font = command[2]
+                ctx.font = font
+            fill_text(*command[3:])
+
+
 # Create canvas and 2D context - same API as browser/Node.js
 c = canvas.Canvas(400, 200)
 ctx = canvas.CanvasRenderingContext2d(c)
 
-# Draw background
-ctx.fillStyle = "#1a1a2e"
-ctx.fillRect(0, 0, 400, 200)
-
-# Draw colored shapes
-for i, color in enumerate(["#ff6b6b", "#4ecdc4", "#ffe66d"]):
-    ctx.fillStyle = color
-    ctx.fillRect(20 + i * 100, 20, 80, 80)
+# Draw background and colored shapes
+draw_batch(
+    ctx,
+    [("fillRect", "#1a1a2e", 0, 0, 400, 200)]
+    + [
+        ("fillRect", color, 20 + i * 100, 20, 80, 80)
+        for i, color in enumerate(["#ff6b6b", "#4ecdc4", "#ffe66d"])
+    ],
+)
 
 # Draw circle
 ctx.beginPath()
@@ -26,16 +52,22 @@ ctx.fillStyle = "#a855f7"
 ctx.fill()
 
 # Draw text
-ctx.fillStyle = "#ffffff"
-ctx.font = "24px sans-serif"
-ctx.fillText("Hello from Python!", 20, 140)
-
-ctx.fillStyle = "#666666"
-ctx.font = "14px monospace"
-ctx.fillText("napi-python + node-canvas", 20, 170)
+draw_batch(
+    ctx,
+    [
+        ("fillText", "#ffffff", "24px sans-serif", "Hello from Python!", 20, 140),
+        ("fillText", "#666666", "14px monospace", "napi-python + node-canvas", 20, 170),
+    ],
+)
 
 # Export to PNG
+png = c.toBuffer()
+
+# Check the PNG signature on a view of the first 8 bytes (no buffer copy)
+if png.to_memoryview()[:8] != b"\x89PNG\r\n\x1a\n":
+    raise SystemExit("toBuffer() did not return PNG data")
+
 with open("examples/canvas-output.png", "wb") as f:
-    f.write(bytes(c.toBuffer()))
+    png.write_to_fd(f.fileno())
 
 print("saved canvas-output.png")
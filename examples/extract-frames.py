@@ -12,7 +12,7 @@ import asyncio
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from napi_python import load_addon
+from napi_python import PointerArray, load_addon, wait_until
 
 INPUT = os.path.join(os.path.dirname(__file__), "example.mp4")
 ADDON = os.path.join(
@@ -24,24 +24,35 @@ ADDON = os.path.join(
 async def main():
     webcodecs = load_addon(ADDON)
 
-    video_chunks = []
-    audio_chunks = []
+    # Chunks arrive as native pointers; PointerArray keeps just the addresses
+    video_chunks = PointerArray()
+    audio_chunks = PointerArray()
 
     demuxer = webcodecs.Mp4Demuxer({
-        "videoOutput": lambda c: video_chunks.append(c),
-        "audioOutput": lambda c: audio_chunks.append(c),
+        "videoOutput": video_chunks.append,
+        "audioOutput": audio_chunks.append,
         "error": lambda e: print(f"Error: {e}"),
     })
 
     await demuxer.load(INPUT)
 
     duration = demuxer.duration / 1_000_000
-    tracks = demuxer.tracks
-    video = next((t for t in tracks if "codedWidth" in t), None)
+    # demuxer.tracks builds a fresh list of dicts on every access; read it
+    # once and pick out the video and audio tracks in the same pass
+    video = audio = None
+    for track in demuxer.tracks:
+        if video is None and "codedWidth" in track:
+            video = track
+        elif audio is None and "sampleRate" in track:
+            audio = track
+
+    # Reserve room for roughly duration x frame rate chunks (plus slack)
+    # so the demux callbacks fill preallocated slots instead of growing
+    fps = (video or {}).get("frameRate") or 30
+    video_chunks.reserve(int(duration * fps * 1.1))
 
     demuxer.demux()
-    while demuxer.state == "demuxing":
-        await asyncio.sleep(0.05)
+    await wait_until(lambda: demuxer.state != "demuxing")
 
     demuxer.close()
 
@@ -49,6 +60,8 @@ async def main():
     print(f"Duration: {duration:.2f}s")
     if video:
         print(f"Resolution: {video['codedWidth']}x{video['codedHeight']}")
+    if audio:
+        print(f"Audio: {audio['sampleRate']}Hz, {audio['numberOfChannels']}ch")
     print(f"Demuxed: {len(video_chunks)} video, {len(audio_chunks)} audio chunks")
 
 
@@ -24,7 +24,7 @@ from pathlib import Path
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from napi_python import load_addon
+from napi_python import PointerArray, load_addon, wait_until
 
 # Find the webcodecs .node file
 addon_path = (
@@ -57,24 +57,18 @@ if not input_file.exists():
 async def demux_example():
     """Demonstrate MP4 demuxing capabilities."""
     
-    # Counters for received chunks
-    video_chunks = []
-    audio_chunks = []
+    # Received chunks (native pointers, stored as raw addresses)
+    video_chunks = PointerArray()
+    audio_chunks = PointerArray()
     errors = []
 
-    def on_video_chunk(chunk):
-        video_chunks.append(chunk)
-
-    def on_audio_chunk(chunk):
-        audio_chunks.append(chunk)
-
     def on_error(e):
         errors.append(str(e))
 
     print("\n=== Creating Mp4Demuxer ===")
     demuxer = webcodecs.Mp4Demuxer({
-        "videoOutput": on_video_chunk,
-        "audioOutput": on_audio_chunk,
+        "videoOutput": video_chunks.append,
+        "audioOutput": audio_chunks.append,
         "error": on_error,
     })
     print(f"Demuxer created, state: {demuxer.state}")
@@ -88,11 +82,15 @@ async def demux_example():
     duration_s = duration_us / 1_000_000 if duration_us else 0
     print(f"Duration: {duration_us} µs ({duration_s:.2f}s)")
     
+    # Single pass over the track list: print it and remember the video
+    # track for sizing the chunk storage below
     tracks = demuxer.tracks
+    video_track = None
     print(f"Tracks: {len(tracks)}")
     for i, track in enumerate(tracks):
         track_type = track.get('trackType', 'unknown')
         if 'codedWidth' in track:
+            video_track = video_track or track
             print(f"  Track {i}: {track_type} - {track['codedWidth']}x{track['codedHeight']}")
         elif 'sampleRate' in track:
             print(f"  Track {i}: {track_type} - {track['sampleRate']}Hz, {track['numberOfChannels']}ch")
@@ -106,13 +104,18 @@ async def demux_example():
     if audio_config:
         print(f"Audio: {audio_config}")
 
+    # Reserve room for roughly duration x frame rate chunks (plus slack)
+    # so the demux callbacks fill preallocated slots instead of growing
+    fps = (video_track or {}).get('frameRate') or 30
+    video_chunks.reserve(int(duration_s * fps * 1.1))
+
     print("\n=== Demuxing all packets ===")
     print("Starting demux...")
     demuxer.demux()
     
-    # Wait for demuxing to complete
-    while demuxer.state == "demuxing":
-        await asyncio.sleep(0.1)
+    # Wait for demuxing to complete (wakes as soon as the demux thread
+    # releases its callbacks, rather than on a fixed sleep)
+    await wait_until(lambda: demuxer.state != "demuxing")
     
     print(f"Final state: {demuxer.state}")
 
@@ -8,8 +8,11 @@ Usage:
     result = addon.some_function(arg1, arg2)
 """
 
-from ._runtime import Context, create_context, get_default_context, Env
+from typing import Optional
+
+from ._runtime import Context, create_context, get_default_context, Env, PointerArray
 from ._napi import napi_status, napi_valuetype
+from ._threading import wait_until
 
 __version__ = "0.1.0"
 
@@ -19,21 +22,27 @@ __all__ = [
     "create_context",
     "get_default_context",
     "Env",
+    "PointerArray",
     "napi_status",
     "napi_valuetype",
+    "wait_until",
 ]
 
 
-def load_addon(path: str):
+def load_addon(path: str, callback_batch_size: Optional[int] = None):
     """
     Load a Node-API native addon.
 
     Args:
         path: Path to the .node file
+        callback_batch_size: Max threadsafe function calls delivered per
+            event loop wakeup when native threads call back into Python
+            (256 by default). Left unset, loading an addon that is already
+            loaded keeps its current value
 
     Returns:
         A module-like object with the addon's exports
     """
     from ._loader import load_addon as _load
 
-    return _load(path)
+    return _load(path, callback_batch_size)
@@ -5,7 +5,13 @@ This module handles loading .node files (shared libraries) and
 initializing them with our NAPI implementation.
 """
 
+import array
+import asyncio
 import ctypes
+import functools
+import logging
+import math
+import queue
 from ctypes import (
     CDLL,
     CFUNCTYPE,
@@ -27,11 +33,21 @@ from ctypes import (
     sizeof,
 )
 from pathlib import Path
-from typing import Optional, Any, Dict, Callable, List
+from typing import Optional, Any, Dict, Callable, List, Tuple
 import sys
 import os
-
-from ._runtime import Context, Env, get_default_context, Reference, ReferenceOwnership
+import threading
+from collections import deque
+
+from ._runtime import (
+    Context,
+    Env,
+    get_default_context,
+    Reference,
+    ReferenceOwnership,
+    PointerArray,
+)
+from ._runtime.handle import HandleStore, Undefined
 from ._napi.types import (
     napi_status,
     napi_valuetype,
@@ -44,6 +60,58 @@ from ._napi.types import (
     Constant,
 )
 from ._napi import functions as napi_funcs
+from ._threading import notify_waiters
+
+
+# The callbacks return a status on every call and often write a constant
+# handle or value type; as plain ints these skip the enum class attribute
+# lookup and the __index__ conversion when ctypes stores them
+_OK = int(napi_status.napi_ok)
+_INVALID_ARG = int(napi_status.napi_invalid_arg)
+_STRING_EXPECTED = int(napi_status.napi_string_expected)
+_FUNCTION_EXPECTED = int(napi_status.napi_function_expected)
+_NUMBER_EXPECTED = int(napi_status.napi_number_expected)
+_GENERIC_FAILURE = int(napi_status.napi_generic_failure)
+_PENDING_EXCEPTION = int(napi_status.napi_pending_exception)
+_QUEUE_FULL = int(napi_status.napi_queue_full)
+_CLOSING = int(napi_status.napi_closing)
+_ARRAYBUFFER_EXPECTED = int(napi_status.napi_arraybuffer_expected)
+
+_UNDEFINED_HANDLE = int(Constant.UNDEFINED)
+_NULL_HANDLE = int(Constant.NULL)
+_FALSE_HANDLE = int(Constant.FALSE)
+_TRUE_HANDLE = int(Constant.TRUE)
+_GLOBAL_HANDLE = int(Constant.GLOBAL)
+_ZERO_DOUBLE_HANDLE = HandleStore.ZERO_DOUBLE
+_ONE_DOUBLE_HANDLE = HandleStore.ONE_DOUBLE
+_NAN_DOUBLE_HANDLE = HandleStore.NAN_DOUBLE
+
+_UNDEFINED_TYPE = int(napi_valuetype.napi_undefined)
+_NULL_TYPE = int(napi_valuetype.napi_null)
+_BOOLEAN_TYPE = int(napi_valuetype.napi_boolean)
+_NUMBER_TYPE = int(napi_valuetype.napi_number)
+_STRING_TYPE = int(napi_valuetype.napi_string)
+_OBJECT_TYPE = int(napi_valuetype.napi_object)
+_FUNCTION_TYPE = int(napi_valuetype.napi_function)
+
+# napi_typeof results for exact types, so the common cases skip the
+# isinstance ladder; subclasses and everything else go through it once
+_TYPEOF_BY_TYPE = {
+    type(Undefined): _UNDEFINED_TYPE,
+    type(None): _NULL_TYPE,
+    bool: _BOOLEAN_TYPE,
+    int: _NUMBER_TYPE,
+    float: _NUMBER_TYPE,
+    str: _STRING_TYPE,
+    dict: _OBJECT_TYPE,
+    list: _OBJECT_TYPE,
+    bytes: _OBJECT_TYPE,
+    bytearray: _OBJECT_TYPE,
+}
+_TYPEOF_CACHE_SIZE = 1024
+
+# Exact types napi_is_typedarray reports as typed arrays
+_TYPEDARRAY_TYPES = frozenset([bytes, bytearray, memoryview])
 
 
 class NapiError(Exception):
@@ -60,78 +128,94 @@ class ModuleExports:
     Wrapper for addon exports that allows attribute access.
     """
 
+    # Slots make self._exports a direct descriptor read in __getattr__
+    __slots__ = ("_exports", "_ctx", "_env")
+
     def __init__(self, exports: Dict[str, Any], ctx: Context, env: Env):
         object.__setattr__(self, "_exports", exports)
         object.__setattr__(self, "_ctx", ctx)
         object.__setattr__(self, "_env", env)
 
     def __getattr__(self, name: str) -> Any:
-        exports = object.__getattribute__(self, "_exports")
+        exports = self._exports
         if name in exports:
             return exports[name]
         raise AttributeError(f"Module has no attribute '{name}'")
 
+    def __getitem__(self, name: str) -> Any:
+        return self._exports[name]
+
     def __setattr__(self, name: str, value: Any) -> None:
-        exports = object.__getattribute__(self, "_exports")
-        exports[name] = value
+        self._exports[name] = value
 
     def __dir__(self):
-        exports = object.__getattribute__(self, "_exports")
-        return list(exports.keys())
+        return list(self._exports)
 
     def __repr__(self):
-        exports = object.__getattribute__(self, "_exports")
-        return f"<NapiModule exports={list(exports.keys())}>"
+        return f"<NapiModule exports={list(self._exports.keys())}>"
 
 
 # Define C function pointer types matching the shim
-FuncGetVersion = CFUNCTYPE(c_int, c_void_p, POINTER(c_uint32))
-FuncGetUndefined = CFUNCTYPE(c_int, c_void_p, POINTER(c_void_p))
-FuncGetNull = CFUNCTYPE(c_int, c_void_p, POINTER(c_void_p))
-FuncGetGlobal = CFUNCTYPE(c_int, c_void_p, POINTER(c_void_p))
-FuncGetBoolean = CFUNCTYPE(c_int, c_void_p, c_bool, POINTER(c_void_p))
-FuncCreateInt32 = CFUNCTYPE(c_int, c_void_p, c_int32, POINTER(c_void_p))
-FuncCreateUint32 = CFUNCTYPE(c_int, c_void_p, c_uint32, POINTER(c_void_p))
-FuncCreateInt64 = CFUNCTYPE(c_int, c_void_p, c_int64, POINTER(c_void_p))
-FuncCreateDouble = CFUNCTYPE(c_int, c_void_p, c_double, POINTER(c_void_p))
-FuncCreateStringUtf8 = CFUNCTYPE(c_int, c_void_p, c_char_p, c_size_t, POINTER(c_void_p))
-FuncGetValueBool = CFUNCTYPE(c_int, c_void_p, c_void_p, POINTER(c_bool))
-FuncGetValueInt32 = CFUNCTYPE(c_int, c_void_p, c_void_p, POINTER(c_int32))
-FuncGetValueUint32 = CFUNCTYPE(c_int, c_void_p, c_void_p, POINTER(c_uint32))
-FuncGetValueInt64 = CFUNCTYPE(c_int, c_void_p, c_void_p, POINTER(c_int64))
-FuncGetValueDouble = CFUNCTYPE(c_int, c_void_p, c_void_p, POINTER(c_double))
-FuncGetValueStringUtf8 = CFUNCTYPE(
-    c_int, c_void_p, c_void_p, c_void_p, c_size_t, POINTER(c_size_t)
+# napi_value (*napi_callback)(napi_env env, napi_callback_info info)
+NapiCallback = CFUNCTYPE(c_void_p, c_void_p, c_void_p)
+# void (*napi_threadsafe_function_call_js)(napi_env, napi_value, void*, void*)
+NapiThreadsafeCallJs = CFUNCTYPE(None, c_void_p, c_void_p, c_void_p, c_void_p)
+# void (*napi_finalize)(napi_env env, void* data, void* hint)
+NapiFinalize = CFUNCTYPE(None, c_void_p, c_void_p, c_void_p)
+
+# Signatures of the function table entries, as (restype, *argtypes). The
+# CFUNCTYPE prototype for an entry is only built when it is first wrapped,
+# so entries a lazily loaded table never fills in cost nothing at import
+FuncGetVersion = (c_int, c_void_p, POINTER(c_uint32))
+FuncGetUndefined = (c_int, c_void_p, POINTER(c_void_p))
+FuncGetNull = (c_int, c_void_p, POINTER(c_void_p))
+FuncGetGlobal = (c_int, c_void_p, POINTER(c_void_p))
+FuncGetBoolean = (c_int, c_void_p, c_bool, POINTER(c_void_p))
+FuncCreateInt32 = (c_int, c_void_p, c_int32, POINTER(c_void_p))
+FuncCreateUint32 = (c_int, c_void_p, c_uint32, POINTER(c_void_p))
+FuncCreateInt64 = (c_int, c_void_p, c_int64, POINTER(c_void_p))
+FuncCreateDouble = (c_int, c_void_p, c_double, POINTER(c_void_p))
+FuncCreateStringUtf8 = (c_int, c_void_p, c_void_p, c_size_t, POINTER(c_void_p))
+FuncGetValueBool = (c_int, c_void_p, c_void_p, POINTER(c_bool))
+FuncGetValueInt32 = (c_int, c_void_p, c_void_p, POINTER(c_int32))
+FuncGetValueUint32 = (c_int, c_void_p, c_void_p, POINTER(c_uint32))
+FuncGetValueInt64 = (c_int, c_void_p, c_void_p, POINTER(c_int64))
+FuncGetValueDouble = (c_int, c_void_p, c_void_p, POINTER(c_double))
+FuncGetValueStringUtf8 = (
+    c_int, c_void_p, c_void_p, c_void_p, c_size_t, c_void_p
 )
-FuncTypeof = CFUNCTYPE(c_int, c_void_p, c_void_p, POINTER(c_int))
-FuncIsArray = CFUNCTYPE(c_int, c_void_p, c_void_p, POINTER(c_bool))
-FuncIsTypedarray = CFUNCTYPE(c_int, c_void_p, c_void_p, POINTER(c_bool))
-FuncIsError = CFUNCTYPE(c_int, c_void_p, c_void_p, POINTER(c_bool))
-FuncCreateObject = CFUNCTYPE(c_int, c_void_p, POINTER(c_void_p))
-FuncCreateArray = CFUNCTYPE(c_int, c_void_p, POINTER(c_void_p))
-FuncGetArrayLength = CFUNCTYPE(c_int, c_void_p, c_void_p, POINTER(c_uint32))
-FuncGetElement = CFUNCTYPE(c_int, c_void_p, c_void_p, c_uint32, POINTER(c_void_p))
-FuncSetElement = CFUNCTYPE(c_int, c_void_p, c_void_p, c_uint32, c_void_p)
-FuncGetProperty = CFUNCTYPE(c_int, c_void_p, c_void_p, c_void_p, POINTER(c_void_p))
-FuncSetProperty = CFUNCTYPE(c_int, c_void_p, c_void_p, c_void_p, c_void_p)
-FuncGetNamedProperty = CFUNCTYPE(c_int, c_void_p, c_void_p, c_char_p, POINTER(c_void_p))
-FuncSetNamedProperty = CFUNCTYPE(c_int, c_void_p, c_void_p, c_char_p, c_void_p)
-FuncGetCbInfo = CFUNCTYPE(
+FuncTypeof = (c_int, c_void_p, c_void_p, POINTER(c_int))
+FuncIsArray = (c_int, c_void_p, c_void_p, POINTER(c_bool))
+FuncIsTypedarray = (c_int, c_void_p, c_void_p, POINTER(c_bool))
+FuncIsError = (c_int, c_void_p, c_void_p, POINTER(c_bool))
+FuncCreateObject = (c_int, c_void_p, POINTER(c_void_p))
+FuncCreateArray = (c_int, c_void_p, POINTER(c_void_p))
+FuncGetArrayLength = (c_int, c_void_p, c_void_p, POINTER(c_uint32))
+FuncGetElement = (c_int, c_void_p, c_void_p, c_uint32, POINTER(c_void_p))
+FuncSetElement = (c_int, c_void_p, c_void_p, c_uint32, c_void_p)
+FuncGetProperty = (c_int, c_void_p, c_void_p, c_void_p, POINTER(c_void_p))
+FuncSetProperty = (c_int, c_void_p, c_void_p, c_void_p, c_void_p)
+FuncGetNamedProperty = (c_int, c_void_p, c_void_p, c_char_p, POINTER(c_void_p))
+FuncSetNamedProperty = (c_int, c_void_p, c_void_p, c_char_p, c_void_p)
+# Optional out-parameters that callers commonly pass as NULL are declared as
+# plain addresses: ctypes boxes every POINTER argument into a new object on
+# each call, whether or not the callback ends up writing through it
+FuncGetCbInfo = (
     c_int,
     c_void_p,
     c_void_p,
     POINTER(c_size_t),
-    POINTER(c_void_p),
-    POINTER(c_void_p),
-    POINTER(c_void_p),
+    c_void_p,  # napi_value* argv
+    c_void_p,  # napi_value* this_arg
+    c_void_p,  # void** data
 )
-FuncCreateFunction = CFUNCTYPE(
+FuncCreateFunction = (
     c_int, c_void_p, c_char_p, c_size_t, c_void_p, c_void_p, POINTER(c_void_p)
 )
-FuncCallFunction = CFUNCTYPE(
+FuncCallFunction = (
     c_int, c_void_p, c_void_p, c_void_p, c_size_t, POINTER(c_void_p), POINTER(c_void_p)
 )
-FuncDefineClass = CFUNCTYPE(
+FuncDefineClass = (
     c_int,
     c_void_p,
     c_char_p,
@@ -142,36 +226,36 @@ FuncDefineClass = CFUNCTYPE(
     c_void_p,
     POINTER(c_void_p),
 )
-FuncCreateReference = CFUNCTYPE(c_int, c_void_p, c_void_p, c_uint32, POINTER(c_void_p))
-FuncDeleteReference = CFUNCTYPE(c_int, c_void_p, c_void_p)
-FuncGetReferenceValue = CFUNCTYPE(c_int, c_void_p, c_void_p, POINTER(c_void_p))
-FuncRefReference = CFUNCTYPE(c_int, c_void_p, c_void_p, POINTER(c_uint32))
-FuncUnrefReference = CFUNCTYPE(c_int, c_void_p, c_void_p, POINTER(c_uint32))
-FuncThrow = CFUNCTYPE(c_int, c_void_p, c_void_p)
-FuncThrowError = CFUNCTYPE(c_int, c_void_p, c_char_p, c_char_p)
-FuncCreateError = CFUNCTYPE(c_int, c_void_p, c_void_p, c_void_p, POINTER(c_void_p))
-FuncIsExceptionPending = CFUNCTYPE(c_int, c_void_p, POINTER(c_bool))
-FuncGetAndClearLastException = CFUNCTYPE(c_int, c_void_p, POINTER(c_void_p))
-FuncOpenHandleScope = CFUNCTYPE(c_int, c_void_p, POINTER(c_void_p))
-FuncCloseHandleScope = CFUNCTYPE(c_int, c_void_p, c_void_p)
-FuncCoerceToString = CFUNCTYPE(c_int, c_void_p, c_void_p, POINTER(c_void_p))
-FuncGetTypedarrayInfo = CFUNCTYPE(
+FuncCreateReference = (c_int, c_void_p, c_void_p, c_uint32, POINTER(c_void_p))
+FuncDeleteReference = (c_int, c_void_p, c_void_p)
+FuncGetReferenceValue = (c_int, c_void_p, c_void_p, POINTER(c_void_p))
+FuncRefReference = (c_int, c_void_p, c_void_p, POINTER(c_uint32))
+FuncUnrefReference = (c_int, c_void_p, c_void_p, POINTER(c_uint32))
+FuncThrow = (c_int, c_void_p, c_void_p)
+FuncThrowError = (c_int, c_void_p, c_void_p, c_void_p)
+FuncCreateError = (c_int, c_void_p, c_void_p, c_void_p, POINTER(c_void_p))
+FuncIsExceptionPending = (c_int, c_void_p, POINTER(c_bool))
+FuncGetAndClearLastException = (c_int, c_void_p, POINTER(c_void_p))
+FuncOpenHandleScope = (c_int, c_void_p, POINTER(c_void_p))
+FuncCloseHandleScope = (c_int, c_void_p, c_void_p)
+FuncCoerceToString = (c_int, c_void_p, c_void_p, POINTER(c_void_p))
+FuncGetTypedarrayInfo = (
     c_int,
     c_void_p,
     c_void_p,
-    POINTER(c_int),
-    POINTER(c_size_t),
-    POINTER(c_void_p),
-    POINTER(c_void_p),
-    POINTER(c_size_t),
+    c_void_p,  # napi_typedarray_type* type
+    c_void_p,  # size_t* length
+    c_void_p,  # void** data
+    c_void_p,  # napi_value* arraybuffer
+    c_void_p,  # size_t* byte_offset
 )
 # Promise functions
-FuncCreatePromise = CFUNCTYPE(c_int, c_void_p, POINTER(c_void_p), POINTER(c_void_p))
-FuncResolveDeferred = CFUNCTYPE(c_int, c_void_p, c_void_p, c_void_p)
-FuncRejectDeferred = CFUNCTYPE(c_int, c_void_p, c_void_p, c_void_p)
-FuncIsPromise = CFUNCTYPE(c_int, c_void_p, c_void_p, POINTER(c_bool))
+FuncCreatePromise = (c_int, c_void_p, POINTER(c_void_p), POINTER(c_void_p))
+FuncResolveDeferred = (c_int, c_void_p, c_void_p, c_void_p)
+FuncRejectDeferred = (c_int, c_void_p, c_void_p, c_void_p)
+FuncIsPromise = (c_int, c_void_p, c_void_p, POINTER(c_bool))
 # Threadsafe function
-FuncCreateTsfn = CFUNCTYPE(
+FuncCreateTsfn = (
     c_int,
     c_void_p,
     c_void_p,
@@ -185,15 +269,15 @@ FuncCreateTsfn = CFUNCTYPE(
     c_void_p,
     POINTER(c_void_p),
 )
-FuncCallTsfn = CFUNCTYPE(c_int, c_void_p, c_void_p, c_int)
-FuncAcquireTsfn = CFUNCTYPE(c_int, c_void_p)
-FuncReleaseTsfn = CFUNCTYPE(c_int, c_void_p, c_int)
+FuncCallTsfn = (c_int, c_void_p, c_void_p, c_int)
+FuncAcquireTsfn = (c_int, c_void_p)
+FuncReleaseTsfn = (c_int, c_void_p, c_int)
 # Class/wrap functions
-FuncWrap = CFUNCTYPE(
+FuncWrap = (
     c_int, c_void_p, c_void_p, c_void_p, c_void_p, c_void_p, POINTER(c_void_p)
 )
-FuncUnwrap = CFUNCTYPE(c_int, c_void_p, c_void_p, POINTER(c_void_p))
-FuncDefineClassImpl = CFUNCTYPE(
+FuncUnwrap = (c_int, c_void_p, c_void_p, POINTER(c_void_p))
+FuncDefineClassImpl = (
     c_int,
     c_void_p,
     c_char_p,
@@ -205,24 +289,24 @@ FuncDefineClassImpl = CFUNCTYPE(
     POINTER(c_void_p),
 )
 # ArrayBuffer functions
-FuncCreateArraybuffer = CFUNCTYPE(
+FuncCreateArraybuffer = (
     c_int, c_void_p, c_size_t, POINTER(c_void_p), POINTER(c_void_p)
 )
-FuncGetArraybufferInfo = CFUNCTYPE(
+FuncGetArraybufferInfo = (
     c_int, c_void_p, c_void_p, POINTER(c_void_p), POINTER(c_size_t)
 )
-FuncIsDetachedArraybuffer = CFUNCTYPE(c_int, c_void_p, c_void_p, POINTER(c_bool))
-FuncDetachArraybuffer = CFUNCTYPE(c_int, c_void_p, c_void_p)
-FuncIsArraybuffer = CFUNCTYPE(c_int, c_void_p, c_void_p, POINTER(c_bool))
+FuncIsDetachedArraybuffer = (c_int, c_void_p, c_void_p, POINTER(c_bool))
+FuncDetachArraybuffer = (c_int, c_void_p, c_void_p)
+FuncIsArraybuffer = (c_int, c_void_p, c_void_p, POINTER(c_bool))
 # TypedArray functions
-FuncCreateTypedarray = CFUNCTYPE(
+FuncCreateTypedarray = (
     c_int, c_void_p, c_int, c_size_t, c_void_p, c_size_t, POINTER(c_void_p)
 )
 # DataView functions
-FuncCreateDataview = CFUNCTYPE(
+FuncCreateDataview = (
     c_int, c_void_p, c_size_t, c_void_p, c_size_t, POINTER(c_void_p)
 )
-FuncGetDataviewInfo = CFUNCTYPE(
+FuncGetDataviewInfo = (
     c_int,
     c_void_p,
     c_void_p,
@@ -231,47 +315,51 @@ FuncGetDataviewInfo = CFUNCTYPE(
     POINTER(c_void_p),
     POINTER(c_size_t),
 )
-FuncIsDataview = CFUNCTYPE(c_int, c_void_p, c_void_p, POINTER(c_bool))
+FuncIsDataview = (c_int, c_void_p, c_void_p, POINTER(c_bool))
 # Buffer functions
-FuncCreateBuffer = CFUNCTYPE(
+FuncCreateBuffer = (
     c_int, c_void_p, c_size_t, POINTER(c_void_p), POINTER(c_void_p)
 )
-FuncCreateBufferCopy = CFUNCTYPE(
+FuncCreateBufferCopy = (
     c_int, c_void_p, c_size_t, c_void_p, POINTER(c_void_p), POINTER(c_void_p)
 )
-FuncGetBufferInfo = CFUNCTYPE(
+FuncGetBufferInfo = (
     c_int, c_void_p, c_void_p, POINTER(c_void_p), POINTER(c_size_t)
 )
-FuncIsBuffer = CFUNCTYPE(c_int, c_void_p, c_void_p, POINTER(c_bool))
+FuncIsBuffer = (c_int, c_void_p, c_void_p, POINTER(c_bool))
 # External functions
-FuncCreateExternal = CFUNCTYPE(
+FuncCreateExternal = (
     c_int, c_void_p, c_void_p, c_void_p, c_void_p, POINTER(c_void_p)
 )
-FuncGetValueExternal = CFUNCTYPE(c_int, c_void_p, c_void_p, POINTER(c_void_p))
+FuncGetValueExternal = (c_int, c_void_p, c_void_p, POINTER(c_void_p))
 # Additional error functions
-FuncThrowTypeError = CFUNCTYPE(c_int, c_void_p, c_char_p, c_char_p)
-FuncThrowRangeError = CFUNCTYPE(c_int, c_void_p, c_char_p, c_char_p)
-FuncCreateTypeError = CFUNCTYPE(c_int, c_void_p, c_void_p, c_void_p, POINTER(c_void_p))
-FuncCreateRangeError = CFUNCTYPE(c_int, c_void_p, c_void_p, c_void_p, POINTER(c_void_p))
+FuncThrowTypeError = (c_int, c_void_p, c_char_p, c_char_p)
+FuncThrowRangeError = (c_int, c_void_p, c_char_p, c_char_p)
+FuncCreateTypeError = (c_int, c_void_p, c_void_p, c_void_p, POINTER(c_void_p))
+FuncCreateRangeError = (c_int, c_void_p, c_void_p, c_void_p, POINTER(c_void_p))
 # Instance creation
-FuncNewInstance = CFUNCTYPE(
+FuncNewInstance = (
     c_int, c_void_p, c_void_p, c_size_t, POINTER(c_void_p), POINTER(c_void_p)
 )
 # Fatal exception
-FuncFatalException = CFUNCTYPE(c_int, c_void_p, c_void_p)
+FuncFatalException = (c_int, c_void_p, c_void_p)
 # Get new target
-FuncGetNewTarget = CFUNCTYPE(c_int, c_void_p, c_void_p, POINTER(c_void_p))
+FuncGetNewTarget = (c_int, c_void_p, c_void_p, POINTER(c_void_p))
 # Property checking
-FuncHasOwnProperty = CFUNCTYPE(c_int, c_void_p, c_void_p, c_void_p, POINTER(c_bool))
+FuncHasOwnProperty = (c_int, c_void_p, c_void_p, c_void_p, POINTER(c_bool))
 # Get all property names
-FuncGetAllPropertyNames = CFUNCTYPE(
+FuncGetAllPropertyNames = (
     c_int, c_void_p, c_void_p, c_int, c_int, c_int, POINTER(c_void_p)
 )
 # Get property names
-FuncGetPropertyNames = CFUNCTYPE(c_int, c_void_p, c_void_p, POINTER(c_void_p))
+FuncGetPropertyNames = (c_int, c_void_p, c_void_p, POINTER(c_void_p))
 # Instance data
-FuncSetInstanceData = CFUNCTYPE(c_int, c_void_p, c_void_p, c_void_p, c_void_p)
-FuncGetInstanceData = CFUNCTYPE(c_int, c_void_p, POINTER(c_void_p))
+FuncSetInstanceData = (c_int, c_void_p, c_void_p, c_void_p, c_void_p)
+FuncGetInstanceData = (c_int, c_void_p, POINTER(c_void_p))
+# Strict equality
+FuncStrictEquals = (c_int, c_void_p, c_void_p, c_void_p, POINTER(c_bool))
+# Lazy table loader
+FuncRequestFunction = (c_int, c_size_t)
 
 
 # Property descriptor structure (matches C struct)
@@ -288,120 +376,213 @@ class NapiPropertyDescriptor(Structure):
     ]
 
 
+# Function table entries in the C shim's field order
+_FUNCTION_SIGNATURES = [
+    ("get_version", FuncGetVersion),
+    ("get_undefined", FuncGetUndefined),
+    ("get_null", FuncGetNull),
+    ("get_global", FuncGetGlobal),
+    ("get_boolean", FuncGetBoolean),
+    ("create_int32", FuncCreateInt32),
+    ("create_uint32", FuncCreateUint32),
+    ("create_int64", FuncCreateInt64),
+    ("create_double", FuncCreateDouble),
+    ("create_string_utf8", FuncCreateStringUtf8),
+    ("get_value_bool", FuncGetValueBool),
+    ("get_value_int32", FuncGetValueInt32),
+    ("get_value_uint32", FuncGetValueUint32),
+    ("get_value_int64", FuncGetValueInt64),
+    ("get_value_double", FuncGetValueDouble),
+    ("get_value_string_utf8", FuncGetValueStringUtf8),
+    ("typeof_", FuncTypeof),
+    ("is_array", FuncIsArray),
+    ("is_typedarray", FuncIsTypedarray),
+    ("is_error", FuncIsError),
+    ("create_object", FuncCreateObject),
+    ("create_array", FuncCreateArray),
+    ("get_array_length", FuncGetArrayLength),
+    ("get_element", FuncGetElement),
+    ("set_element", FuncSetElement),
+    ("get_property", FuncGetProperty),
+    ("set_property", FuncSetProperty),
+    ("get_named_property", FuncGetNamedProperty),
+    ("set_named_property", FuncSetNamedProperty),
+    ("get_cb_info", FuncGetCbInfo),
+    ("create_function", FuncCreateFunction),
+    ("call_function", FuncCallFunction),
+    ("define_class", FuncDefineClass),
+    ("create_reference", FuncCreateReference),
+    ("delete_reference", FuncDeleteReference),
+    ("get_reference_value", FuncGetReferenceValue),
+    ("reference_ref", FuncRefReference),
+    ("reference_unref", FuncUnrefReference),
+    ("throw_", FuncThrow),
+    ("throw_error", FuncThrowError),
+    ("create_error", FuncCreateError),
+    ("is_exception_pending", FuncIsExceptionPending),
+    ("get_and_clear_last_exception", FuncGetAndClearLastException),
+    ("open_handle_scope", FuncOpenHandleScope),
+    ("close_handle_scope", FuncCloseHandleScope),
+    ("coerce_to_string", FuncCoerceToString),
+    ("get_typedarray_info", FuncGetTypedarrayInfo),
+    # Promise functions
+    ("create_promise", FuncCreatePromise),
+    ("resolve_deferred", FuncResolveDeferred),
+    ("reject_deferred", FuncRejectDeferred),
+    ("is_promise", FuncIsPromise),
+    # Threadsafe functions
+    ("create_tsfn", FuncCreateTsfn),
+    ("call_tsfn", FuncCallTsfn),
+    ("acquire_tsfn", FuncAcquireTsfn),
+    ("release_tsfn", FuncReleaseTsfn),
+    # Class/wrap functions
+    ("wrap", FuncWrap),
+    ("unwrap", FuncUnwrap),
+    ("define_class_impl", FuncDefineClassImpl),
+    # ArrayBuffer functions
+    ("create_arraybuffer", FuncCreateArraybuffer),
+    ("get_arraybuffer_info", FuncGetArraybufferInfo),
+    ("is_detached_arraybuffer", FuncIsDetachedArraybuffer),
+    ("detach_arraybuffer", FuncDetachArraybuffer),
+    ("is_arraybuffer", FuncIsArraybuffer),
+    # TypedArray functions
+    ("create_typedarray", FuncCreateTypedarray),
+    # DataView functions
+    ("create_dataview", FuncCreateDataview),
+    ("get_dataview_info", FuncGetDataviewInfo),
+    ("is_dataview", FuncIsDataview),
+    # Buffer functions
+    ("create_buffer", FuncCreateBuffer),
+    ("create_buffer_copy", FuncCreateBufferCopy),
+    ("get_buffer_info", FuncGetBufferInfo),
+    ("is_buffer", FuncIsBuffer),
+    # External functions
+    ("create_external", FuncCreateExternal),
+    ("get_value_external", FuncGetValueExternal),
+    # Additional error functions
+    ("throw_type_error", FuncThrowTypeError),
+    ("throw_range_error", FuncThrowRangeError),
+    ("create_type_error", FuncCreateTypeError),
+    ("create_range_error", FuncCreateRangeError),
+    # Instance creation
+    ("new_instance", FuncNewInstance),
+    # Fatal exception
+    ("fatal_exception", FuncFatalException),
+    # Get new target
+    ("get_new_target", FuncGetNewTarget),
+    # Property checking
+    ("has_own_property", FuncHasOwnProperty),
+    # Get all property names
+    ("get_all_property_names", FuncGetAllPropertyNames),
+    # Get property names
+    ("get_property_names", FuncGetPropertyNames),
+    # Instance data
+    ("set_instance_data", FuncSetInstanceData),
+    ("get_instance_data", FuncGetInstanceData),
+    # Strict equality
+    ("strict_equals", FuncStrictEquals),
+    # Lazy table loader
+    ("request_function", FuncRequestFunction),
+]
+
+
 class NapiPythonFunctions(Structure):
     """Function pointer table matching the C shim."""
 
-    _fields_ = [
-        ("get_version", FuncGetVersion),
-        ("get_undefined", FuncGetUndefined),
-        ("get_null", FuncGetNull),
-        ("get_global", FuncGetGlobal),
-        ("get_boolean", FuncGetBoolean),
-        ("create_int32", FuncCreateInt32),
-        ("create_uint32", FuncCreateUint32),
-        ("create_int64", FuncCreateInt64),
-        ("create_double", FuncCreateDouble),
-        ("create_string_utf8", FuncCreateStringUtf8),
-        ("get_value_bool", FuncGetValueBool),
-        ("get_value_int32", FuncGetValueInt32),
-        ("get_value_uint32", FuncGetValueUint32),
-        ("get_value_int64", FuncGetValueInt64),
-        ("get_value_double", FuncGetValueDouble),
-        ("get_value_string_utf8", FuncGetValueStringUtf8),
-        ("typeof_", FuncTypeof),
-        ("is_array", FuncIsArray),
-        ("is_typedarray", FuncIsTypedarray),
-        ("is_error", FuncIsError),
-        ("create_object", FuncCreateObject),
-        ("create_array", FuncCreateArray),
-        ("get_array_length", FuncGetArrayLength),
-        ("get_element", FuncGetElement),
-        ("set_element", FuncSetElement),
-        ("get_property", FuncGetProperty),
-        ("set_property", FuncSetProperty),
-        ("get_named_property", FuncGetNamedProperty),
-        ("set_named_property", FuncSetNamedProperty),
-        ("get_cb_info", FuncGetCbInfo),
-        ("create_function", FuncCreateFunction),
-        ("call_function", FuncCallFunction),
-        ("define_class", FuncDefineClass),
-        ("create_reference", FuncCreateReference),
-        ("delete_reference", FuncDeleteReference),
-        ("get_reference_value", FuncGetReferenceValue),
-        ("reference_ref", FuncRefReference),
-        ("reference_unref", FuncUnrefReference),
-        ("throw_", FuncThrow),
-        ("throw_error", FuncThrowError),
-        ("create_error", FuncCreateError),
-        ("is_exception_pending", FuncIsExceptionPending),
-        ("get_and_clear_last_exception", FuncGetAndClearLastException),
-        ("open_handle_scope", FuncOpenHandleScope),
-        ("close_handle_scope", FuncCloseHandleScope),
-        ("coerce_to_string", FuncCoerceToString),
-        ("get_typedarray_info", FuncGetTypedarrayInfo),
-        # Promise functions
-        ("create_promise", FuncCreatePromise),
-        ("resolve_deferred", FuncResolveDeferred),
-        ("reject_deferred", FuncRejectDeferred),
-        ("is_promise", FuncIsPromise),
-        # Threadsafe functions
-        ("create_tsfn", FuncCreateTsfn),
-        ("call_tsfn", FuncCallTsfn),
-        ("acquire_tsfn", FuncAcquireTsfn),
-        ("release_tsfn", FuncReleaseTsfn),
-        # Class/wrap functions
-        ("wrap", FuncWrap),
-        ("unwrap", FuncUnwrap),
-        ("define_class_impl", FuncDefineClassImpl),
-        # ArrayBuffer functions
-        ("create_arraybuffer", FuncCreateArraybuffer),
-        ("get_arraybuffer_info", FuncGetArraybufferInfo),
-        ("is_detached_arraybuffer", FuncIsDetachedArraybuffer),
-        ("detach_arraybuffer", FuncDetachArraybuffer),
-        ("is_arraybuffer", FuncIsArraybuffer),
-        # TypedArray functions
-        ("create_typedarray", FuncCreateTypedarray),
-        # DataView functions
-        ("create_dataview", FuncCreateDataview),
-        ("get_dataview_info", FuncGetDataviewInfo),
-        ("is_dataview", FuncIsDataview),
-        # Buffer functions
-        ("create_buffer", FuncCreateBuffer),
-        ("create_buffer_copy", FuncCreateBufferCopy),
-        ("get_buffer_info", FuncGetBufferInfo),
-        ("is_buffer", FuncIsBuffer),
-        # External functions
-        ("create_external", FuncCreateExternal),
-        ("get_value_external", FuncGetValueExternal),
-        # Additional error functions
-        ("throw_type_error", FuncThrowTypeError),
-        ("throw_range_error", FuncThrowRangeError),
-        ("create_type_error", FuncCreateTypeError),
-        ("create_range_error", FuncCreateRangeError),
-        # Instance creation
-        ("new_instance", FuncNewInstance),
-        # Fatal exception
-        ("fatal_exception", FuncFatalException),
-        # Get new target
-        ("get_new_target", FuncGetNewTarget),
-        # Property checking
-        ("has_own_property", FuncHasOwnProperty),
-        # Get all property names
-        ("get_all_property_names", FuncGetAllPropertyNames),
-        # Get property names
-        ("get_property_names", FuncGetPropertyNames),
-        # Instance data
-        ("set_instance_data", FuncSetInstanceData),
-        ("get_instance_data", FuncGetInstanceData),
-    ]
+    _fields_ = [(name, c_void_p) for name, _ in _FUNCTION_SIGNATURES]
+
 
+logger = logging.getLogger("napi_python")
 
 # Global state
 _shim_lib: Optional[CDLL] = None
+
+# Initialized addons keyed by resolved path, plus absolute paths as given
+_loaded_addons: Dict[str, "ModuleExports"] = {}
+
+# napi_create_string_utf8 reuses decoded strs shorter than this many bytes
+_SHORT_STRING_MAX = 64
+_SHORT_STRING_CACHE_SIZE = 4096
+
+# Decodes UTF-8 straight from native memory into a str, without first
+# copying the bytes into a bytes object
+_decode_utf8 = ctypes.pythonapi.PyUnicode_DecodeUTF8
+_decode_utf8.argtypes = [c_void_p, ctypes.c_ssize_t, c_char_p]
+_decode_utf8.restype = ctypes.py_object
+
+# Borrows the UTF-8 form CPython caches on the str itself, so reading the
+# same string repeatedly encodes it once and copies it straight from there
+_utf8_view = ctypes.pythonapi.PyUnicode_AsUTF8AndSize
+_utf8_view.argtypes = [ctypes.py_object, POINTER(ctypes.c_ssize_t)]
+_utf8_view.restype = c_void_p
 _func_table: Optional[NapiPythonFunctions] = None
-_callback_refs: List[Any] = []  # prevent GC of callbacks
+
+# Table entries wrapped in trampolines up front: value creation/conversion,
+# property access and calls are used by virtually every addon. With a shim
+# that exports napi_python_request_function the rest are wrapped on first use,
+# and the constant getters (get_version, get_undefined, get_null, get_global,
+# get_boolean) are left empty - that shim answers them itself. It also tags
+# small integers itself, so create_int32/uint32/int64 only reach Python for
+# out-of-range values or a NULL result and are left to load on demand
+_EAGER_FUNCTIONS = frozenset(
+    [
+        "create_double",
+        "create_string_utf8",
+        "get_value_bool",
+        "get_value_int32",
+        "get_value_uint32",
+        "get_value_int64",
+        "get_value_double",
+        "get_value_string_utf8",
+        "typeof_",
+        "is_array",
+        "create_object",
+        "create_array",
+        "get_array_length",
+        "get_element",
+        "set_element",
+        "get_property",
+        "set_property",
+        "get_named_property",
+        "set_named_property",
+        "get_cb_info",
+        "create_function",
+        "call_function",
+        "open_handle_scope",
+        "close_handle_scope",
+        "request_function",
+    ]
+)
+
+
+# Callables for native napi_callback pointers, cast once per address
+_native_callbacks: Dict[int, Any] = {}
+
+
+def _native_callback(address: int) -> Any:
+    """Get a callable for a native napi_callback function pointer."""
+    fn = _native_callbacks.get(address)
+    if fn is None:
+        fn = _native_callbacks[address] = ctypes.cast(address, NapiCallback)
+    return fn
+
+
+def _store_ptr(address: int, value: int) -> None:
+    """Write a pointer-sized value through a raw out-parameter address."""
+    c_void_p.from_address(address).value = value
+
+
+def _store_size(address: int, value: int) -> None:
+    """Write a size_t through a raw out-parameter address."""
+    c_size_t.from_address(address).value = value
 
 
+def _store_int(address: int, value: int) -> None:
+    """Write a C int through a raw out-parameter address."""
+    c_int.from_address(address).value = value
+
+
+@functools.lru_cache(maxsize=None)
 def _get_shim_path() -> Path:
     """Get path to the NAPI shim library."""
     return Path(__file__).parent / "_native" / "libnapi_shim.dylib"
@@ -409,7 +590,7 @@ def _get_shim_path() -> Path:
 
 def _init_shim() -> CDLL:
     """Initialize the NAPI shim library."""
-    global _shim_lib, _func_table
+    global _shim_lib
 
     if _shim_lib is not None:
         return _shim_lib
@@ -420,14 +601,17 @@ def _init_shim() -> CDLL:
 
     # Load the shim with RTLD_GLOBAL so its symbols are available to other libs
     _shim_lib = CDLL(str(shim_path), mode=ctypes.RTLD_GLOBAL)
+    logger.debug("Loaded NAPI shim: %s", shim_path)
 
     # Get the function to set our implementations
     set_funcs = _shim_lib.napi_python_set_functions
     set_funcs.argtypes = [POINTER(NapiPythonFunctions)]
     set_funcs.restype = None
 
-    # Create function table with our Python implementations
-    _func_table = _create_function_table()
+    # The table is built lazily at import; older shims cannot request
+    # missing entries, so fill in the rest before handing it over
+    if not hasattr(_shim_lib, "napi_python_request_function"):
+        _func_table.materialize_all()
 
     # Register with the shim
     set_funcs(byref(_func_table))
@@ -435,438 +619,466 @@ def _init_shim() -> CDLL:
     return _shim_lib
 
 
-def _create_function_table() -> NapiPythonFunctions:
-    """Create the function pointer table."""
-    global _callback_refs
+def _create_function_table(lazy: bool = False) -> NapiPythonFunctions:
+    """
+    Create the function pointer table.
 
+    If lazy is set, only the entries in _EAGER_FUNCTIONS are filled in and
+    the shim requests the others through request_function when first used.
+    """
     ctx = get_default_context()
 
-    # Helper to get env from handle
-    def get_env(env_ptr: int) -> Optional[Env]:
-        return ctx.get_env(env_ptr)
+    # Context methods used on every call, bound once so the callbacks below
+    # skip the attribute lookup on ctx. Handle reads and writes go to the
+    # methods doing the work rather than through the Context aliases
+    get_env = ctx.get_env
+    python_value_from_napi = ctx._handle_store.get
+    python_values_from_napi = ctx.python_values_from_napi
+    add_value = ctx.napi_value_from_python
+    add_values = ctx.add_values
+    open_scope = ctx.open_scope
+    close_scope = ctx.close_scope
+    get_callback_info = ctx.get_callback_info
+    get_ref = ctx.get_ref
 
     # Wrapper implementations that match C calling convention
-    @FuncGetVersion
     def get_version(env, result):
         result[0] = 9
-        return napi_status.napi_ok
+        return _OK
 
-    @FuncGetUndefined
     def get_undefined(env, result):
-        result[0] = Constant.UNDEFINED
-        return napi_status.napi_ok
+        result[0] = _UNDEFINED_HANDLE
+        return _OK
 
-    @FuncGetNull
     def get_null(env, result):
-        result[0] = Constant.NULL
-        return napi_status.napi_ok
+        result[0] = _NULL_HANDLE
+        return _OK
 
-    @FuncGetGlobal
     def get_global(env, result):
-        result[0] = Constant.GLOBAL
-        return napi_status.napi_ok
+        result[0] = _GLOBAL_HANDLE
+        return _OK
 
-    @FuncGetBoolean
     def get_boolean(env, value, result):
-        result[0] = Constant.TRUE if value else Constant.FALSE
-        return napi_status.napi_ok
+        result[0] = _TRUE_HANDLE if value else _FALSE_HANDLE
+        return _OK
 
-    @FuncCreateInt32
     def create_int32(env, value, result):
-        handle = ctx.add_value(int(value))
+        handle = add_value(int(value))
         result[0] = handle
-        return napi_status.napi_ok
+        return _OK
 
-    @FuncCreateUint32
     def create_uint32(env, value, result):
-        handle = ctx.add_value(int(value))
+        handle = add_value(int(value))
         result[0] = handle
-        return napi_status.napi_ok
+        return _OK
 
-    @FuncCreateInt64
     def create_int64(env, value, result):
-        handle = ctx.add_value(int(value))
+        handle = add_value(int(value))
         result[0] = handle
-        return napi_status.napi_ok
+        return _OK
 
-    @FuncCreateDouble
     def create_double(env, value, result):
-        handle = ctx.add_value(float(value))
-        result[0] = handle
-        return napi_status.napi_ok
+        # Integers already get tagged handles; the common doubles have
+        # permanent ones. -0.0 == 0.0, so check the sign before sharing
+        if value == 0.0 and math.copysign(1.0, value) > 0:
+            result[0] = _ZERO_DOUBLE_HANDLE
+        elif value == 1.0:
+            result[0] = _ONE_DOUBLE_HANDLE
+        elif value != value:
+            result[0] = _NAN_DOUBLE_HANDLE
+        else:
+            result[0] = add_value(float(value))
+        return _OK
+
+    # Decoded short strings keyed by their UTF-8 bytes
+    _short_strings: Dict[bytes, str] = {}
 
-    @FuncCreateStringUtf8
     def create_string_utf8(env, string, length, result):
-        if string:
-            if length == 0xFFFFFFFFFFFFFFFF or length < 0:  # NAPI_AUTO_LENGTH
-                py_str = string.decode("utf-8")
+        if not string:
+            py_str = ""
+        elif length == 0xFFFFFFFFFFFFFFFF or length < _SHORT_STRING_MAX:
+            # NUL-terminated (NAPI_AUTO_LENGTH) or short: read the bytes, as
+            # short strings (property names, states, CSS colors and fonts)
+            # repeat constantly and reuse one decoded str per distinct value
+            if length == 0xFFFFFFFFFFFFFFFF:  # NAPI_AUTO_LENGTH
+                raw = ctypes.string_at(string)
             else:
-                py_str = string[:length].decode("utf-8")
+                raw = ctypes.string_at(string, length)
+            py_str = _short_strings.get(raw)
+            if py_str is None:
+                py_str = raw.decode("utf-8")
+                if len(raw) < _SHORT_STRING_MAX:
+                    if len(_short_strings) >= _SHORT_STRING_CACHE_SIZE:
+                        _short_strings.clear()
+                    _short_strings[raw] = py_str
         else:
-            py_str = ""
-        handle = ctx.add_value(py_str)
+            py_str = _decode_utf8(string, length, None)
+        handle = add_value(py_str)
         result[0] = handle
-        return napi_status.napi_ok
+        return _OK
 
-    @FuncGetValueBool
     def get_value_bool(env, value, result):
-        py_val = ctx.python_value_from_napi(value)
+        py_val = python_value_from_napi(value)
         result[0] = bool(py_val)
-        return napi_status.napi_ok
+        return _OK
 
-    @FuncGetValueInt32
     def get_value_int32(env, value, result):
-        py_val = ctx.python_value_from_napi(value)
+        py_val = python_value_from_napi(value)
+        if type(py_val) is int:
+            # ctypes keeps the low 32 bits on store, like a C cast
+            result[0] = py_val
+            return _OK
         if py_val is None:
             result[0] = 0
-            return napi_status.napi_number_expected
+            return _NUMBER_EXPECTED
         try:
-            result[0] = int(py_val) & 0xFFFFFFFF
+            result[0] = int(py_val)
         except (TypeError, ValueError):
             result[0] = 0
-            return napi_status.napi_number_expected
-        return napi_status.napi_ok
+            return _NUMBER_EXPECTED
+        return _OK
 
-    @FuncGetValueUint32
     def get_value_uint32(env, value, result):
-        py_val = ctx.python_value_from_napi(value)
+        py_val = python_value_from_napi(value)
+        if type(py_val) is int:
+            # ctypes keeps the low 32 bits on store, like a C cast
+            result[0] = py_val
+            return _OK
         if py_val is None:
             result[0] = 0
-            return napi_status.napi_number_expected
+            return _NUMBER_EXPECTED
         try:
-            result[0] = int(py_val) & 0xFFFFFFFF
+            result[0] = int(py_val)
         except (TypeError, ValueError):
             result[0] = 0
-            return napi_status.napi_number_expected
-        return napi_status.napi_ok
+            return _NUMBER_EXPECTED
+        return _OK
 
-    @FuncGetValueInt64
     def get_value_int64(env, value, result):
-        py_val = ctx.python_value_from_napi(value)
+        py_val = python_value_from_napi(value)
         if py_val is None:
             result[0] = 0
-            return napi_status.napi_number_expected
+            return _NUMBER_EXPECTED
         try:
             result[0] = int(py_val)
         except (TypeError, ValueError):
             result[0] = 0
-            return napi_status.napi_number_expected
-        return napi_status.napi_ok
+            return _NUMBER_EXPECTED
+        return _OK
 
-    @FuncGetValueDouble
     def get_value_double(env, value, result):
-        py_val = ctx.python_value_from_napi(value)
+        py_val = python_value_from_napi(value)
         if py_val is None:
             result[0] = 0.0
-            return napi_status.napi_number_expected
+            return _NUMBER_EXPECTED
         try:
             result[0] = float(py_val)
         except (TypeError, ValueError):
             result[0] = 0.0
-            return napi_status.napi_number_expected
-        return napi_status.napi_ok
+            return _NUMBER_EXPECTED
+        return _OK
 
-    @FuncGetValueStringUtf8
     def get_value_string_utf8(env, value, buf, bufsize, result):
-        py_val = ctx.python_value_from_napi(value)
+        py_val = python_value_from_napi(value)
         if not isinstance(py_val, str):
-            return napi_status.napi_string_expected
-        encoded = py_val.encode("utf-8")
+            return _STRING_EXPECTED
+        size = ctypes.c_ssize_t()
+        data = _utf8_view(py_val, ctypes.byref(size))
+        length = size.value
 
         if not buf:
             # No buffer - just return the length
             if not result:
-                return napi_status.napi_invalid_arg
-            result[0] = len(encoded)
+                return _INVALID_ARG
+            _store_size(result, length)
         elif bufsize != 0:
             # Copy string to buffer
-            copy_len = min(len(encoded), bufsize - 1)
+            copy_len = min(length, bufsize - 1)
             if copy_len > 0:
-                ctypes.memmove(buf, encoded, copy_len)
+                ctypes.memmove(buf, data, copy_len)
             # Null terminate
             ctypes.memset(buf + copy_len, 0, 1)
             if result:
-                result[0] = copy_len
+                _store_size(result, copy_len)
         elif result:
-            result[0] = 0
+            _store_size(result, 0)
 
-        return napi_status.napi_ok
+        return _OK
 
-    @FuncTypeof
-    def typeof_(env, value, result):
-        from ._runtime.handle import Undefined
-
-        py_val = ctx.python_value_from_napi(value)
-        if py_val is Undefined:
-            result[0] = napi_valuetype.napi_undefined
-        elif py_val is None:
-            result[0] = napi_valuetype.napi_null
-        elif isinstance(py_val, bool):
-            result[0] = napi_valuetype.napi_boolean
-        elif isinstance(py_val, (int, float)):
-            result[0] = napi_valuetype.napi_number
-        elif isinstance(py_val, str):
-            result[0] = napi_valuetype.napi_string
-        elif callable(py_val):
-            result[0] = napi_valuetype.napi_function
-        else:
-            result[0] = napi_valuetype.napi_object
-        return napi_status.napi_ok
+    # napi_typeof only depends on the value's type, so the isinstance ladder
+    # runs once per type and its answer is remembered, up to a bound so
+    # classes created on the fly are not kept alive forever
+    typeof_cache = dict(_TYPEOF_BY_TYPE)
 
-    @FuncIsArray
+    def typeof_(env, value, result):
+        py_val = python_value_from_napi(value)
+        py_type = type(py_val)
+        value_type = typeof_cache.get(py_type)
+        if value_type is None:
+            if isinstance(py_val, bool):
+                value_type = _BOOLEAN_TYPE
+            elif isinstance(py_val, (int, float)):
+                value_type = _NUMBER_TYPE
+            elif isinstance(py_val, str):
+                value_type = _STRING_TYPE
+            elif callable(py_val):
+                value_type = _FUNCTION_TYPE
+            else:
+                value_type = _OBJECT_TYPE
+            if len(typeof_cache) < _TYPEOF_CACHE_SIZE:
+                typeof_cache[py_type] = value_type
+        result[0] = value_type
+        return _OK
+
+    # The is_* checks test the exact type first and only walk the MRO for
+    # subclasses
     def is_array(env, value, result):
-        py_val = ctx.python_value_from_napi(value)
-        result[0] = isinstance(py_val, list)
-        return napi_status.napi_ok
+        py_val = python_value_from_napi(value)
+        result[0] = type(py_val) is list or isinstance(py_val, list)
+        return _OK
 
-    @FuncIsTypedarray
     def is_typedarray(env, value, result):
-        from ._values.arraybuffer import TypedArray, is_typedarray as _is_typedarray
-
-        py_val = ctx.python_value_from_napi(value)
-        # Check for our TypedArray class or bytes/bytearray
-        result[0] = _is_typedarray(py_val) or isinstance(
-            py_val, (bytes, bytearray, memoryview)
+        py_val = python_value_from_napi(value)
+        # Check for our TypedArray class or bytes/bytearray/memoryview
+        result[0] = type(py_val) in _TYPEDARRAY_TYPES or isinstance(
+            py_val, (TypedArray, bytes, bytearray, memoryview)
         )
-        return napi_status.napi_ok
+        return _OK
 
-    @FuncIsError
     def is_error(env, value, result):
-        py_val = ctx.python_value_from_napi(value)
-        result[0] = isinstance(py_val, Exception)
-        return napi_status.napi_ok
+        py_val = python_value_from_napi(value)
+        # None of the types napi_typeof knows up front are exceptions
+        result[0] = type(py_val) not in _TYPEOF_BY_TYPE and isinstance(
+            py_val, Exception
+        )
+        return _OK
 
-    @FuncCreateObject
     def create_object(env, result):
-        handle = ctx.add_value({})
+        handle = add_value({})
         result[0] = handle
-        return napi_status.napi_ok
+        return _OK
 
-    @FuncCreateArray
     def create_array(env, result):
-        handle = ctx.add_value([])
+        handle = add_value([])
         result[0] = handle
-        return napi_status.napi_ok
+        return _OK
 
-    @FuncGetArrayLength
     def get_array_length(env, value, result):
-        py_val = ctx.python_value_from_napi(value)
+        py_val = python_value_from_napi(value)
         result[0] = len(py_val) if isinstance(py_val, list) else 0
-        return napi_status.napi_ok
+        return _OK
 
-    @FuncGetElement
     def get_element(env, obj, index, result):
-        py_obj = ctx.python_value_from_napi(obj)
+        py_obj = python_value_from_napi(obj)
         if isinstance(py_obj, list) and 0 <= index < len(py_obj):
-            result[0] = ctx.add_value(py_obj[index])
+            result[0] = add_value(py_obj[index])
         else:
-            result[0] = Constant.UNDEFINED
-        return napi_status.napi_ok
+            result[0] = _UNDEFINED_HANDLE
+        return _OK
 
-    @FuncSetElement
     def set_element(env, obj, index, value):
-        py_obj = ctx.python_value_from_napi(obj)
-        py_val = ctx.python_value_from_napi(value)
+        py_obj = python_value_from_napi(obj)
+        py_val = python_value_from_napi(value)
         if isinstance(py_obj, list):
             while len(py_obj) <= index:
                 py_obj.append(None)
             py_obj[index] = py_val
-        return napi_status.napi_ok
+        return _OK
 
-    @FuncGetProperty
     def get_property(env, obj, key, result):
-        py_obj = ctx.python_value_from_napi(obj)
-        py_key = ctx.python_value_from_napi(key)
+        py_obj = python_value_from_napi(obj)
+        py_key = python_value_from_napi(key)
         if isinstance(py_obj, dict):
-            result[0] = ctx.add_value(py_obj.get(py_key))
+            result[0] = add_value(py_obj.get(py_key))
         else:
-            result[0] = Constant.UNDEFINED
-        return napi_status.napi_ok
+            result[0] = _UNDEFINED_HANDLE
+        return _OK
 
-    @FuncSetProperty
     def set_property(env, obj, key, value):
-        py_obj = ctx.python_value_from_napi(obj)
-        py_key = ctx.python_value_from_napi(key)
-        py_val = ctx.python_value_from_napi(value)
+        py_obj = python_value_from_napi(obj)
+        py_key = python_value_from_napi(key)
+        py_val = python_value_from_napi(value)
         if isinstance(py_obj, dict):
             py_obj[py_key] = py_val
-        return napi_status.napi_ok
+        return _OK
+
+    # Property names keyed by their UTF-8 bytes. Addons look up the same few
+    # names over and over, so decode each once and intern it
+    _property_names: Dict[bytes, str] = {}
+
+    def decode_property_name(name: Optional[bytes]) -> str:
+        if not name:
+            return ""
+        key = sys.intern(name.decode("utf-8", errors="replace"))
+        if len(_property_names) >= _SHORT_STRING_CACHE_SIZE:
+            _property_names.clear()
+        _property_names[name] = key
+        return key
 
-    @FuncGetNamedProperty
     def get_named_property(env, obj, name, result):
-        py_obj = ctx.python_value_from_napi(obj)
-        key = name.decode("utf-8") if name else ""
+        py_obj = python_value_from_napi(obj)
+        key = _property_names.get(name) or decode_property_name(name)
         if isinstance(py_obj, dict):
             val = py_obj.get(key)
-            result[0] = ctx.add_value(val)
+            result[0] = add_value(val)
         else:
-            result[0] = Constant.UNDEFINED
-        return napi_status.napi_ok
+            result[0] = _UNDEFINED_HANDLE
+        return _OK
 
-    @FuncSetNamedProperty
     def set_named_property(env, obj, name, value):
-        py_obj = ctx.python_value_from_napi(obj)
-        key = name.decode("utf-8") if name else ""
-        py_val = ctx.python_value_from_napi(value)
+        py_obj = python_value_from_napi(obj)
+        key = _property_names.get(name) or decode_property_name(name)
+        py_val = python_value_from_napi(value)
         if isinstance(py_obj, dict):
             py_obj[key] = py_val
-        return napi_status.napi_ok
+        return _OK
 
-    @FuncGetCbInfo
     def get_cb_info(env, cbinfo, argc, argv, this_arg, data):
-        cb_info = ctx.get_callback_info(cbinfo)
+        cb_info = get_callback_info(cbinfo)
+        args = cb_info.args
         if argv and argc:
             argc_val = argc[0]
-            args = cb_info.args
-            for i in range(min(argc_val, len(args))):
-                argv[i] = ctx.add_value(args[i])
-            for i in range(len(args), argc_val):
-                argv[i] = Constant.UNDEFINED
+            if argc_val:
+                # Pad missing arguments with undefined and write the whole
+                # argv array in one slice assignment
+                handles = add_values(args[:argc_val]) if args else []
+                if len(handles) < argc_val:
+                    handles.extend([_UNDEFINED_HANDLE] * (argc_val - len(handles)))
+                (c_void_p * argc_val).from_address(argv)[:] = handles
         if argc:
-            argc[0] = len(cb_info.args)
+            argc[0] = len(args)
         if this_arg:
-            this_arg[0] = (
-                ctx.add_value(cb_info.thiz) if cb_info.thiz else Constant.UNDEFINED
+            _store_ptr(
+                this_arg,
+                add_value(cb_info.thiz) if cb_info.thiz else _UNDEFINED_HANDLE,
             )
         if data:
-            data[0] = cb_info.data
-        return napi_status.napi_ok
+            _store_ptr(data, cb_info.data)
+        return _OK
+
+    # Decoded function and class names; addons create them from a small
+    # set of constant strings, often repeatedly
+    _callback_names: Dict[Tuple[bytes, int], str] = {}
+
+    def decode_callback_name(name: Optional[bytes], length: int, default: str) -> str:
+        if not name:
+            return default
+        cache_key = (name, length)
+        decoded = _callback_names.get(cache_key)
+        if decoded is None:
+            if 0 < length < 1000:
+                decoded = name[:length].decode("utf-8", errors="replace")
+            else:
+                # Try to decode as null-terminated string
+                decoded = name.split(b"\x00")[0].decode("utf-8", errors="replace")
+            if len(_callback_names) >= _SHORT_STRING_CACHE_SIZE:
+                _callback_names.clear()
+            _callback_names[cache_key] = decoded
+        return decoded
 
-    @FuncCreateFunction
     def create_function(env_id, name, length, cb, data, result):
         """Create a JavaScript function from a native callback."""
         env_obj = get_env(env_id)
         if not env_obj:
-            return napi_status.napi_invalid_arg
+            return _INVALID_ARG
 
         # Get function name
-        try:
-            if name and length > 0 and length < 1000:
-                func_name = name[:length].decode("utf-8", errors="replace")
-            elif name:
-                # Try to decode as null-terminated string
-                func_name = name.split(b"\x00")[0].decode("utf-8", errors="replace")
-            else:
-                func_name = "anonymous"
-        except Exception:
-            func_name = "anonymous"
+        func_name = decode_callback_name(name, length, "anonymous")
 
         # Create a Python callable that wraps the native callback
         # cb is a C function pointer: napi_value (*)(napi_env, napi_callback_info)
-        native_cb = ctypes.cast(cb, CFUNCTYPE(c_void_p, c_void_p, c_void_p))
+        native_cb = _native_callback(cb)
 
         def wrapped_function(*args):
             """Python wrapper for native NAPI function."""
-            nonlocal env_obj, native_cb, data
-
-            # Open a scope for this call
-            scope = ctx.open_scope(env_obj)
+            # Open a scope for this call; scopes are pooled and come back
+            # with their callback info already reset
+            scope = open_scope(env_obj)
 
             try:
                 # Set up callback info
-                scope.callback_info.args = list(args)
-                scope.callback_info.thiz = None
-                scope.callback_info.data = data
-                scope.callback_info.fn = wrapped_function
+                info = scope.callback_info
+                info.args = args
+                info.data = data
+                info.fn = wrapped_function
 
                 # Call the native function
                 # Pass env ID and scope ID (which serves as callback_info)
-                ret = native_cb(env_obj.id, scope.id)
+                ret = native_cb(env_id, scope.id)
 
-                # Convert result back to Python
-                if ret:
-                    return ctx.python_value_from_napi(ret)
-                return None
+                # Convert result back to Python; ctypes hands a NULL
+                # napi_value over as None, which the store maps to None
+                return python_value_from_napi(ret)
 
             finally:
-                ctx.close_scope(env_obj, scope)
+                close_scope(env_obj, scope)
 
         # Set function name
         wrapped_function.__name__ = func_name
 
-        # Store reference to prevent GC
-        _callback_refs.append(wrapped_function)
-        _callback_refs.append(native_cb)
-
         # Add to handle store and return
-        handle = ctx.add_value(wrapped_function)
+        handle = add_value(wrapped_function)
         result[0] = handle
-        return napi_status.napi_ok
+        return _OK
 
-    @FuncCallFunction
     def call_function(env_id, recv, func, argc, argv, result):
         """Call a JavaScript function with receiver (this)."""
         env_obj = get_env(env_id)
         if not env_obj:
             if result:
-                result[0] = Constant.UNDEFINED
-            return napi_status.napi_invalid_arg
+                result[0] = _UNDEFINED_HANDLE
+            return _INVALID_ARG
 
         # Validate recv - emnapi requires it
         if not recv:
             if result:
-                result[0] = Constant.UNDEFINED
-            return napi_status.napi_invalid_arg
+                result[0] = _UNDEFINED_HANDLE
+            return _INVALID_ARG
 
         # Get the function
-        py_func = ctx.python_value_from_napi(func)
+        py_func = python_value_from_napi(func)
         if not func:
             if result:
-                result[0] = Constant.UNDEFINED
-            return napi_status.napi_invalid_arg
+                result[0] = _UNDEFINED_HANDLE
+            return _INVALID_ARG
         if not callable(py_func):
             if result:
-                result[0] = Constant.UNDEFINED
-            return napi_status.napi_invalid_arg
-
-        # Get receiver (this value)
-        py_recv = ctx.python_value_from_napi(recv)
+                result[0] = _UNDEFINED_HANDLE
+            return _INVALID_ARG
 
         # Validate argc/argv
         if argc > 0 and not argv:
             if result:
-                result[0] = Constant.UNDEFINED
-            return napi_status.napi_invalid_arg
+                result[0] = _UNDEFINED_HANDLE
+            return _INVALID_ARG
 
         # Get arguments
-        args = []
-        for i in range(argc):
-            arg_handle = argv[i] if argv else Constant.UNDEFINED
-            args.append(ctx.python_value_from_napi(arg_handle))
+        args = python_values_from_napi(argv[:argc]) if argc else []
 
-        # Call the function
+        # Call the function. Functions from create_function open their own
+        # callback scope, so no scope is needed around the call
         try:
-            # Check if this is a wrapped NAPI function that needs callback_info
-            if hasattr(py_func, "__name__") and py_recv is not None:
-                # For wrapped NAPI functions, we need to set up scope with thiz
-                # Check if this function was created by our create_function
-                # by checking for our wrapper signature
-                scope = ctx.open_scope(env_obj)
-                try:
-                    scope.callback_info.thiz = py_recv
-                    scope.callback_info.args = args
-                    ret = py_func(*args)
-                finally:
-                    ctx.close_scope(env_obj, scope)
-            else:
-                # Regular Python function call
-                ret = py_func(*args)
+            ret = py_func(*args)
 
             if result:
-                result[0] = ctx.add_value(ret)
+                result[0] = add_value(ret)
         except Exception as e:
             env_obj.last_exception = e
             if result:
-                result[0] = Constant.UNDEFINED
-            return napi_status.napi_pending_exception
+                result[0] = _UNDEFINED_HANDLE
+            return _PENDING_EXCEPTION
 
-        return napi_status.napi_ok
+        return _OK
 
-    # Storage for wrapped native objects (for napi_wrap/unwrap)
-    _wrap_store = {}
-    _wrap_counter = [1]
+    # Wrapped objects that carry a finalizer, as parallel columns indexed by
+    # the wrap ID stored on the object (slot 0 is unused)
+    _wrap_objects: List[Any] = [None]
+    _wrap_natives = array.array("Q", [0])
+    _wrap_finalize_cbs = array.array("Q", [0])
+    _wrap_finalize_hints = array.array("Q", [0])
+    # Native pointers for objects that do not support attribute assignment
+    _wrap_natives_by_id: Dict[int, int] = {}
 
-    @FuncDefineClass
     def define_class(
         env_id, name, length, constructor, data, prop_count, props, result
     ):
@@ -877,14 +1089,13 @@ def _create_function_table() -> NapiPythonFunctions:
             env_id, name, length, constructor, data, prop_count, props, result
         )
 
-    @FuncCreateReference
     def create_reference(env_id, value, initial_refcount, result):
         """Create a reference to a value."""
         env_obj = get_env(env_id)
         if not env_obj:
-            return napi_status.napi_invalid_arg
+            return _INVALID_ARG
 
-        py_value = ctx.python_value_from_napi(value)
+        py_value = python_value_from_napi(value)
 
         # Create a proper Reference object
         ref = Reference.create(
@@ -893,147 +1104,134 @@ def _create_function_table() -> NapiPythonFunctions:
 
         if result:
             result[0] = ref.id
-        return napi_status.napi_ok
+        return _OK
 
-    @FuncDeleteReference
     def delete_reference(env_id, ref_id):
         """Delete a reference."""
-        ref = ctx.get_ref(ref_id)
+        ref = get_ref(ref_id)
         if ref:
             ref.dispose()
-        return napi_status.napi_ok
+        return _OK
 
-    @FuncGetReferenceValue
     def get_reference_value(env_id, ref_id, result):
         """Get the value from a reference."""
-        ref = ctx.get_ref(ref_id)
+        ref = get_ref(ref_id)
         if ref:
             value = ref.get()
             if value is not None:
                 if result:
-                    result[0] = ctx.add_value(value)
-                return napi_status.napi_ok
+                    result[0] = add_value(value)
+                return _OK
         # Reference not found or value was collected
         if result:
-            result[0] = Constant.UNDEFINED
-        return napi_status.napi_ok
+            result[0] = _UNDEFINED_HANDLE
+        return _OK
 
-    @FuncRefReference
     def reference_ref(env_id, ref_id, result):
         """Increment reference count."""
-        ref = ctx.get_ref(ref_id)
+        ref = get_ref(ref_id)
         if not ref:
-            return napi_status.napi_invalid_arg
+            return _INVALID_ARG
 
         new_count = ref.ref()
         if result:
             result[0] = new_count
-        return napi_status.napi_ok
+        return _OK
 
-    @FuncUnrefReference
     def reference_unref(env_id, ref_id, result):
         """Decrement reference count."""
-        ref = ctx.get_ref(ref_id)
+        ref = get_ref(ref_id)
         if not ref:
-            return napi_status.napi_invalid_arg
+            return _INVALID_ARG
 
         new_count = ref.unref()
         if result:
             result[0] = new_count
-        return napi_status.napi_ok
+        return _OK
 
-    @FuncThrow
     def throw_(env, error):
-        return napi_status.napi_ok
+        return _OK
 
-    @FuncThrowError
     def throw_error(env, code, msg):
-        return napi_status.napi_ok
+        return _OK
 
-    @FuncCreateError
     def create_error(env_id, code_handle, msg_handle, result):
         """Create an Error object."""
         env_obj = get_env(env_id)
         if not env_obj:
             if result:
-                result[0] = Constant.UNDEFINED
-            return napi_status.napi_invalid_arg
+                result[0] = _UNDEFINED_HANDLE
+            return _INVALID_ARG
 
         # msg is required
         if not msg_handle:
             if result:
-                result[0] = Constant.UNDEFINED
-            return napi_status.napi_invalid_arg
+                result[0] = _UNDEFINED_HANDLE
+            return _INVALID_ARG
 
         try:
             # Get the message string
-            msg_value = ctx.python_value_from_napi(msg_handle)
+            msg_value = python_value_from_napi(msg_handle)
             if not isinstance(msg_value, str):
                 if result:
-                    result[0] = Constant.UNDEFINED
-                return napi_status.napi_string_expected
+                    result[0] = _UNDEFINED_HANDLE
+                return _STRING_EXPECTED
 
             # Create the error
             error = Exception(msg_value)
 
             # Add code attribute if provided
             if code_handle and code_handle != 0:
-                code_value = ctx.python_value_from_napi(code_handle)
+                code_value = python_value_from_napi(code_handle)
                 if isinstance(code_value, str):
                     error.code = code_value
 
             # Store and return the error
             if result:
-                result[0] = ctx.add_value(error)
-            return napi_status.napi_ok
+                result[0] = add_value(error)
+            return _OK
         except Exception as e:
-            print(f"[napi-python] create_error failed: {e}")
+            logger.warning("create_error failed: %s", e)
             if result:
-                result[0] = Constant.UNDEFINED
-            return napi_status.napi_generic_failure
+                result[0] = _UNDEFINED_HANDLE
+            return _GENERIC_FAILURE
 
-    @FuncIsExceptionPending
     def is_exception_pending(env, result):
         env_obj = get_env(env)
         if env_obj and env_obj.last_exception is not None:
             result[0] = True
         else:
             result[0] = False
-        return napi_status.napi_ok
+        return _OK
 
-    @FuncGetAndClearLastException
     def get_and_clear_last_exception(env, result):
         env_obj = get_env(env)
         if env_obj and env_obj.last_exception is not None:
             exc = env_obj.last_exception
             env_obj.last_exception = None
-            result[0] = ctx.add_value(exc)
+            result[0] = add_value(exc)
         else:
-            result[0] = Constant.UNDEFINED
-        return napi_status.napi_ok
+            result[0] = _UNDEFINED_HANDLE
+        return _OK
 
-    @FuncOpenHandleScope
     def open_handle_scope(env, result):
         env_obj = get_env(env)
         if env_obj:
-            scope = ctx.open_scope(env_obj)
+            scope = open_scope(env_obj)
             result[0] = scope.id
-        return napi_status.napi_ok
+        return _OK
 
-    @FuncCloseHandleScope
     def close_handle_scope(env, scope):
         env_obj = get_env(env)
         if env_obj:
-            ctx.close_scope(env_obj)
-        return napi_status.napi_ok
+            close_scope(env_obj)
+        return _OK
 
-    @FuncCoerceToString
     def coerce_to_string(env, value, result):
-        py_val = ctx.python_value_from_napi(value)
-        result[0] = ctx.add_value(str(py_val))
-        return napi_status.napi_ok
+        py_val = python_value_from_napi(value)
+        result[0] = add_value(str(py_val))
+        return _OK
 
-    @FuncGetTypedarrayInfo
     def get_typedarray_info(
         env, typedarray, type_out, length, data, arraybuffer, byte_offset
     ):
@@ -1043,122 +1241,112 @@ def _create_function_table() -> NapiPythonFunctions:
             is_typedarray as _is_typedarray,
         )
 
-        py_val = ctx.python_value_from_napi(typedarray)
+        py_val = python_value_from_napi(typedarray)
 
         # Handle our TypedArray class
         if _is_typedarray(py_val):
             if type_out:
-                type_out[0] = py_val.array_type
+                _store_int(type_out, py_val.array_type)
             if length:
-                length[0] = py_val.length
+                _store_size(length, py_val.length)
             if data:
-                data[0] = py_val.data_ptr
+                _store_ptr(data, py_val.data_ptr)
             if arraybuffer:
-                arraybuffer[0] = ctx.add_value(py_val.buffer)
+                _store_ptr(arraybuffer, add_value(py_val.buffer))
             if byte_offset:
-                byte_offset[0] = py_val.byte_offset
-            return napi_status.napi_ok
+                _store_size(byte_offset, py_val.byte_offset)
+            return _OK
 
         # Handle DataView
         if isinstance(py_val, DataView):
             if type_out:
-                return napi_status.napi_generic_failure  # DataView has no type
+                return _GENERIC_FAILURE  # DataView has no type
             if length:
-                length[0] = py_val.byte_length
+                _store_size(length, py_val.byte_length)
             if data:
-                data[0] = py_val.data_ptr
+                _store_ptr(data, py_val.data_ptr)
             if arraybuffer:
-                arraybuffer[0] = ctx.add_value(py_val.buffer)
+                _store_ptr(arraybuffer, add_value(py_val.buffer))
             if byte_offset:
-                byte_offset[0] = py_val.byte_offset
-            return napi_status.napi_ok
-
-        # Legacy: handle bytes/bytearray as Uint8Array
-        if isinstance(py_val, (bytes, bytearray)):
+                _store_size(byte_offset, py_val.byte_offset)
+            return _OK
+
+        # Legacy: handle bytes/bytearray/memoryview as Uint8Array
+        if isinstance(py_val, (bytes, bytearray, memoryview)):
+            view = memoryview(py_val)
+            if not view.c_contiguous:
+                return _INVALID_ARG
             if type_out:
-                type_out[0] = 1  # napi_uint8_array
+                _store_int(type_out, 1)  # napi_uint8_array
             if length:
-                length[0] = len(py_val)
+                _store_size(length, view.nbytes)
             if data:
-                # Create a ctypes buffer from the bytes
-                if isinstance(py_val, bytes):
-                    buf = ctypes.create_string_buffer(py_val, len(py_val))
-                else:
-                    buf = (ctypes.c_uint8 * len(py_val)).from_buffer(py_val)
-                data[0] = ctypes.addressof(buf)
-                # Keep reference to prevent GC
-                _callback_refs.append(buf)
+                _store_ptr(data, ctx.get_buffer_address(py_val))
             if arraybuffer:
-                arraybuffer[0] = typedarray  # Return same handle
+                _store_ptr(arraybuffer, typedarray)  # Return same handle
             if byte_offset:
-                byte_offset[0] = 0
-            return napi_status.napi_ok
+                _store_size(byte_offset, 0)
+            return _OK
 
-        return napi_status.napi_arraybuffer_expected
+        return _ARRAYBUFFER_EXPECTED
 
     # =========================================================================
     # Class / Wrap Functions
     # =========================================================================
 
-    @FuncWrap
     def wrap(env_id, js_object, native_object, finalize_cb, finalize_hint, result):
         """Associate a native pointer with a JavaScript object."""
         env_obj = get_env(env_id)
         if not env_obj:
             if result:
                 result[0] = 0
-            return napi_status.napi_ok  # Be lenient
+            return _OK  # Be lenient
 
         # Handle None/0 handles gracefully
         if js_object is None or js_object == 0:
             if result:
                 result[0] = 0
-            return napi_status.napi_ok
+            return _OK
 
         try:
-            py_obj = ctx.python_value_from_napi(js_object)
+            py_obj = python_value_from_napi(js_object)
         except Exception:
             if result:
                 result[0] = 0
-            return napi_status.napi_ok
+            return _OK
 
         if py_obj is None:
             if result:
                 result[0] = 0
-            return napi_status.napi_ok  # Be lenient
+            return _OK  # Be lenient
 
         # Store the native pointer on the object
         try:
             py_obj.__napi_native__ = native_object
             py_obj.__napi_weak_ref_id__ = None
             if finalize_cb:
-                py_obj.__napi_weak_ref_id__ = _wrap_counter[0]
-                _wrap_counter[0] += 1
-                _wrap_store[py_obj.__napi_weak_ref_id__] = {
-                    "obj": py_obj,
-                    "native": native_object,
-                    "finalize_cb": finalize_cb,
-                    "finalize_hint": finalize_hint,
-                }
+                py_obj.__napi_weak_ref_id__ = len(_wrap_objects)
+                _wrap_objects.append(py_obj)
+                _wrap_natives.append(native_object or 0)
+                _wrap_finalize_cbs.append(finalize_cb)
+                _wrap_finalize_hints.append(finalize_hint or 0)
         except AttributeError:
             # Object doesn't support attribute assignment, store in dict
-            obj_id = id(py_obj)
-            _wrap_store[obj_id] = native_object
+            _wrap_natives_by_id[id(py_obj)] = native_object
 
         if result:
             result[0] = 0  # No reference created
-        return napi_status.napi_ok
+        return _OK
 
-    @FuncUnwrap
     def unwrap(env_id, js_object, result):
         """Get the native pointer from a JavaScript object."""
         env_obj = get_env(env_id)
         if not env_obj:
-            return napi_status.napi_invalid_arg
+            return _INVALID_ARG
 
-        py_obj = ctx.python_value_from_napi(js_object)
+        py_obj = python_value_from_napi(js_object)
         if py_obj is None:
-            return napi_status.napi_invalid_arg
+            return _INVALID_ARG
 
         # Try to get the native pointer
         try:
@@ -1166,96 +1354,102 @@ def _create_function_table() -> NapiPythonFunctions:
             if native_ptr is not None:
                 if result:
                     result[0] = native_ptr
-                return napi_status.napi_ok
+                return _OK
         except AttributeError:
             pass
 
         # Try the dict fallback
-        obj_id = id(py_obj)
-        native_ptr = _wrap_store.get(obj_id)
+        native_ptr = _wrap_natives_by_id.get(id(py_obj))
         if native_ptr is not None:
             if result:
                 result[0] = native_ptr
-            return napi_status.napi_ok
+            return _OK
 
         if result:
             result[0] = 0
-        return napi_status.napi_invalid_arg
+        return _INVALID_ARG
 
-    @FuncDefineClassImpl
     def define_class_impl(
         env_id, name, length, constructor_cb, data, prop_count, props, result
     ):
         """Define a JavaScript class with constructor and methods."""
         env_obj = get_env(env_id)
         if not env_obj:
-            return napi_status.napi_invalid_arg
+            return _INVALID_ARG
 
         # Get class name
-        try:
-            if name and length > 0 and length < 1000:
-                class_name = name[:length].decode("utf-8", errors="replace")
-            elif name:
-                class_name = name.split(b"\x00")[0].decode("utf-8", errors="replace")
-            else:
-                class_name = "NapiClass"
-        except Exception:
-            class_name = "NapiClass"
+        class_name = decode_callback_name(name, length, "NapiClass")
 
         # Cast constructor callback
-        native_ctor = ctypes.cast(
-            constructor_cb, CFUNCTYPE(c_void_p, c_void_p, c_void_p)
-        )
-        _callback_refs.append(native_ctor)
+        native_ctor = _native_callback(constructor_cb)
 
-        # Create the wrapper class
-        class NapiClassInstance:
-            """Instance of a NAPI-defined class."""
+        def __init__(self, *args):
+            """Call the native constructor."""
+            # Open a scope for this call
+            scope = open_scope(env_obj)
+            try:
+                # Set up callback info
+                info = scope.callback_info
+                info.args = args
+                info.thiz = self
+                info.data = data
+                info.fn = NapiClassInstance
+                info.new_target = type(self)
 
-            __napi_native__ = None
-            __napi_class_name__ = class_name
+                # Call the native constructor
+                ret = native_ctor(env_id, scope.id)
 
-            def __init__(self, *args):
-                """Call the native constructor."""
-                # Open a scope for this call
-                scope = ctx.open_scope(env_obj)
-                try:
-                    # Set up callback info
-                    scope.callback_info.args = list(args)
-                    scope.callback_info.thiz = self
-                    scope.callback_info.data = data
-                    scope.callback_info.fn = self.__init__
-                    scope.callback_info.new_target = type(self)
+                # The constructor typically calls napi_wrap to associate native data
+            finally:
+                close_scope(env_obj, scope)
+
+        def __repr__(self):
+            return f"<{self.__napi_class_name__} instance>"
+
+        # Class namespace; the class is created once all properties are read,
+        # instead of being mutated one setattr at a time
+        members: Dict[str, Any] = {
+            "__doc__": "Instance of a NAPI-defined class.",
+            "__napi_native__": None,
+            "__napi_class_name__": class_name,
+            "__init__": __init__,
+            "__repr__": __repr__,
+        }
 
-                    # Call the native constructor
-                    ret = native_ctor(env_obj.id, scope.id)
+        def make_invoker(cb, pdata):
+            """
+            Wrap a native method, getter or setter. A property calls fget
+            with (self) and fset with (self, value), so one signature covers
+            methods and accessors alike.
+            """
 
-                    # The constructor typically calls napi_wrap to associate native data
+            def invoke(self, *args):
+                scope = open_scope(env_obj)
+                try:
+                    info = scope.callback_info
+                    info.args = args
+                    info.thiz = self
+                    info.data = pdata
+                    return python_value_from_napi(cb(env_id, scope.id))
                 finally:
-                    ctx.close_scope(env_obj, scope)
-
-            def __repr__(self):
-                return f"<{self.__napi_class_name__} instance>"
+                    close_scope(env_obj, scope)
 
-        # Set class name
-        NapiClassInstance.__name__ = class_name
-        NapiClassInstance.__qualname__ = class_name
+            return invoke
 
         # Process properties (methods, getters, setters)
         if prop_count > 0 and props:
-            # Calculate property descriptor size
-            prop_size = ctypes.sizeof(NapiPropertyDescriptor)
-
-            for i in range(prop_count):
-                # Read property descriptor
-                prop_ptr = props + (i * prop_size)
-                prop_desc = NapiPropertyDescriptor.from_address(prop_ptr)
+            # View the whole descriptor block as one array, in place
+            descriptors = (NapiPropertyDescriptor * prop_count).from_address(props)
 
+            for prop_desc in descriptors:
                 # Get property name
-                if prop_desc.utf8name:
-                    prop_name = prop_desc.utf8name.decode("utf-8", errors="replace")
+                utf8name = prop_desc.utf8name
+                if utf8name:
+                    prop_name = _property_names.get(utf8name) or decode_property_name(
+                        utf8name
+                    )
                 elif prop_desc.name:
-                    prop_name = str(ctx.python_value_from_napi(prop_desc.name))
+                    prop_name = str(python_value_from_napi(prop_desc.name))
                 else:
                     continue
 
@@ -1265,34 +1459,15 @@ def _create_function_table() -> NapiPythonFunctions:
 
                 # Handle method
                 if prop_desc.method:
-                    method_cb = ctypes.cast(
-                        prop_desc.method, CFUNCTYPE(c_void_p, c_void_p, c_void_p)
+                    method_func = make_invoker(
+                        _native_callback(prop_desc.method), prop_data
                     )
-                    _callback_refs.append(method_cb)
-
-                    def make_method(cb, pdata):
-                        def method(self, *args):
-                            scope = ctx.open_scope(env_obj)
-                            try:
-                                scope.callback_info.args = list(args)
-                                scope.callback_info.thiz = self
-                                scope.callback_info.data = pdata
-                                ret = cb(env_obj.id, scope.id)
-                                if ret:
-                                    return ctx.python_value_from_napi(ret)
-                                return None
-                            finally:
-                                ctx.close_scope(env_obj, scope)
-
-                        return method
-
-                    method_func = make_method(method_cb, prop_data)
                     method_func.__name__ = prop_name
 
                     if is_static:
-                        setattr(NapiClassInstance, prop_name, staticmethod(method_func))
+                        members[prop_name] = staticmethod(method_func)
                     else:
-                        setattr(NapiClassInstance, prop_name, method_func)
+                        members[prop_name] = method_func
 
                 # Handle getter/setter
                 elif prop_desc.getter or prop_desc.setter:
@@ -1300,118 +1475,72 @@ def _create_function_table() -> NapiPythonFunctions:
                     fset = None
 
                     if prop_desc.getter:
-                        getter_cb = ctypes.cast(
-                            prop_desc.getter, CFUNCTYPE(c_void_p, c_void_p, c_void_p)
+                        fget = make_invoker(
+                            _native_callback(prop_desc.getter), prop_data
                         )
-                        _callback_refs.append(getter_cb)
-
-                        def make_getter(cb, pdata):
-                            def getter(self):
-                                scope = ctx.open_scope(env_obj)
-                                try:
-                                    scope.callback_info.args = []
-                                    scope.callback_info.thiz = self
-                                    scope.callback_info.data = pdata
-                                    ret = cb(env_obj.id, scope.id)
-                                    if ret:
-                                        return ctx.python_value_from_napi(ret)
-                                    return None
-                                finally:
-                                    ctx.close_scope(env_obj, scope)
-
-                            return getter
-
-                        fget = make_getter(getter_cb, prop_data)
 
                     if prop_desc.setter:
-                        setter_cb = ctypes.cast(
-                            prop_desc.setter, CFUNCTYPE(c_void_p, c_void_p, c_void_p)
+                        fset = make_invoker(
+                            _native_callback(prop_desc.setter), prop_data
                         )
-                        _callback_refs.append(setter_cb)
-
-                        def make_setter(cb, pdata):
-                            def setter(self, value):
-                                scope = ctx.open_scope(env_obj)
-                                try:
-                                    scope.callback_info.args = [value]
-                                    scope.callback_info.thiz = self
-                                    scope.callback_info.data = pdata
-                                    cb(env_obj.id, scope.id)
-                                finally:
-                                    ctx.close_scope(env_obj, scope)
-
-                            return setter
 
-                        fset = make_setter(setter_cb, prop_data)
-
-                    setattr(NapiClassInstance, prop_name, property(fget, fset))
+                    members[prop_name] = property(fget, fset)
 
                 # Handle value
                 elif prop_desc.value:
-                    value = ctx.python_value_from_napi(prop_desc.value)
-                    setattr(NapiClassInstance, prop_name, value)
+                    members[prop_name] = python_value_from_napi(prop_desc.value)
 
-        # Keep reference to prevent GC
-        _callback_refs.append(NapiClassInstance)
+        # Create the wrapper class
+        NapiClassInstance = type(class_name, (), members)
 
         # Return the class as a handle
         if result:
-            result[0] = ctx.add_value(NapiClassInstance)
+            result[0] = add_value(NapiClassInstance)
 
-        return napi_status.napi_ok
+        return _OK
 
     # =========================================================================
     # Promise Functions
     # =========================================================================
 
-    @FuncCreatePromise
     def create_promise(env_id, deferred_out, promise_out):
         """Create a promise and deferred pair."""
-        import asyncio
-
         env_obj = get_env(env_id)
         if not env_obj:
-            return napi_status.napi_invalid_arg
+            return _INVALID_ARG
 
         # Create an asyncio Future
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            # No event loop, create one
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
+        loop = env_obj.get_event_loop()
         future = loop.create_future()
 
         # Store the deferred (future + loop) and get an ID
         deferred_id = ctx.store_deferred({"future": future, "loop": loop})
 
         # Store the future as a value and get a handle
-        promise_handle = ctx.add_value(future)
+        promise_handle = add_value(future)
 
         if deferred_out:
             deferred_out[0] = deferred_id
         if promise_out:
             promise_out[0] = promise_handle
 
-        return napi_status.napi_ok
+        return _OK
 
-    @FuncResolveDeferred
     def resolve_deferred(env_id, deferred_id, resolution):
         """Resolve a deferred promise."""
         env_obj = get_env(env_id)
         if not env_obj:
-            return napi_status.napi_invalid_arg
+            return _INVALID_ARG
 
         deferred = ctx.get_deferred(deferred_id)
         if not deferred:
-            return napi_status.napi_invalid_arg
+            return _INVALID_ARG
 
         future = deferred["future"]
         loop = deferred["loop"]
 
         # Get the Python value for resolution
-        py_value = ctx.python_value_from_napi(resolution)
+        py_value = python_value_from_napi(resolution)
 
         # Resolve the future (thread-safe)
         if not future.done():
@@ -1420,24 +1549,23 @@ def _create_function_table() -> NapiPythonFunctions:
         # Clean up
         ctx.delete_deferred(deferred_id)
 
-        return napi_status.napi_ok
+        return _OK
 
-    @FuncRejectDeferred
     def reject_deferred(env_id, deferred_id, rejection):
         """Reject a deferred promise."""
         env_obj = get_env(env_id)
         if not env_obj:
-            return napi_status.napi_invalid_arg
+            return _INVALID_ARG
 
         deferred = ctx.get_deferred(deferred_id)
         if not deferred:
-            return napi_status.napi_invalid_arg
+            return _INVALID_ARG
 
         future = deferred["future"]
         loop = deferred["loop"]
 
         # Get the Python value for rejection
-        py_value = ctx.python_value_from_napi(rejection)
+        py_value = python_value_from_napi(rejection)
 
         # Convert to exception if needed
         if isinstance(py_value, Exception):
@@ -1452,29 +1580,40 @@ def _create_function_table() -> NapiPythonFunctions:
         # Clean up
         ctx.delete_deferred(deferred_id)
 
-        return napi_status.napi_ok
+        return _OK
 
-    @FuncIsPromise
     def is_promise(env_id, value, result):
         """Check if a value is a promise (asyncio.Future)."""
-        import asyncio
-
         if not result:
-            return napi_status.napi_invalid_arg
+            return _INVALID_ARG
 
-        py_value = ctx.python_value_from_napi(value)
+        py_value = python_value_from_napi(value)
         result[0] = isinstance(py_value, asyncio.Future)
-        return napi_status.napi_ok
+        return _OK
 
     # =========================================================================
     # Threadsafe Function Support
     # =========================================================================
 
     # Storage for threadsafe functions
-    _tsfn_store = {}
-    _tsfn_counter = [1]  # Use list to allow modification in nested function
+    # TSFN data indexed by slot (slot 0 unused, so no TSFN is NULL); released
+    # slots are recycled through the freelist. A tsfn_id carries its slot in
+    # the low 32 bits and the slot's generation above them, so a handle kept
+    # past its release never reaches the TSFN that reuses the slot
+    _tsfn_slots: List[Any] = [None]
+    _tsfn_generations: List[int] = [0]
+    _tsfn_free: List[int] = []
+
+    def _get_tsfn(tsfn_id):
+        """Look up a live TSFN by id; NULL, foreign and stale ids give None."""
+        if tsfn_id:
+            slot = tsfn_id & 0xFFFFFFFF
+            if slot < len(_tsfn_slots):
+                tsfn_data = _tsfn_slots[slot]
+                if tsfn_data is not None and tsfn_data["id"] == tsfn_id:
+                    return tsfn_data
+        return None
 
-    @FuncCreateTsfn
     def create_tsfn(
         env_id,
         func,
@@ -1489,174 +1628,106 @@ def _create_function_table() -> NapiPythonFunctions:
         result,
     ):
         """Create a threadsafe function."""
-        import asyncio
-        import threading
-        import queue
-
         env_obj = get_env(env_id)
         if not env_obj:
-            return napi_status.napi_invalid_arg
+            return _INVALID_ARG
 
-        # Get or create event loop
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        loop = env_obj.get_event_loop()
 
         # Create the threadsafe function data
-        tsfn_id = _tsfn_counter[0]
-        _tsfn_counter[0] += 1
+        if _tsfn_free:
+            slot = _tsfn_free.pop()
+        else:
+            slot = len(_tsfn_slots)
+            _tsfn_slots.append(None)
+            _tsfn_generations.append(0)
+        tsfn_id = (_tsfn_generations[slot] << 32) | slot
 
         # Cast call_js_cb to a callable
         if call_js_cb:
-            CallJsCb = CFUNCTYPE(None, c_void_p, c_void_p, c_void_p, c_void_p)
-            js_cb = ctypes.cast(call_js_cb, CallJsCb)
+            js_cb = ctypes.cast(call_js_cb, NapiThreadsafeCallJs)
         else:
             js_cb = None
 
-        # Store the function as a persistent reference to prevent it from
-        # being overwritten when scopes are closed
-        func_ref = None
+        # Keep the function itself rather than its handle, which stops being
+        # valid when the creating scope closes; tsfn_data owns it until the
+        # TSFN is finalized
         func_value = None
         if func is not None and func != 0:
             try:
-                func_value = ctx.python_value_from_napi(func)
-                if func_value is not None:
-                    # Create a reference to preserve the function
-                    func_ref = _wrap_counter[0]
-                    _wrap_counter[0] += 1
-                    _wrap_store[func_ref] = {"value": func_value, "refcount": 1}
-                    pass  # Stored func as persistent ref
+                func_value = python_value_from_napi(func)
             except Exception:
-                pass  # Failed to store func
+                pass  # Failed to resolve func
+
+        # A PointerArray.append callback takes raw addresses directly, so
+        # the fallback delivery below can skip the External wrapper
+        pointer_sink = getattr(func_value, "__self__", None)
+        if not (
+            isinstance(pointer_sink, PointerArray)
+            and func_value == pointer_sink.append
+        ):
+            pointer_sink = None
 
         tsfn_data = {
             "id": tsfn_id,
             "env_id": env_id,
             "func": func,
-            "func_ref": func_ref,  # Persistent reference to the function
             "func_value": func_value,  # Direct reference to prevent GC
+            "pointer_sink": pointer_sink,
             "context": context,
             "call_js_cb": js_cb,
             "loop": loop,
-            "queue": queue.Queue(maxsize=max_queue_size if max_queue_size > 0 else 0),
+            # TSFNs are created on the thread that runs their loop
+            "loop_thread_id": threading.get_ident(),
+            # Only a bounded queue needs Queue's lock and condition; an
+            # unbounded one is a deque, whose append/popleft are atomic
+            "queue": queue.Queue(max_queue_size) if max_queue_size > 0 else deque(),
             "max_queue_size": max_queue_size,
             "thread_count": initial_thread_count,
             "is_closing": False,  # Proper closing state
             "closed": False,
             "finalize_data": thread_finalize_data,
             "finalize_cb": thread_finalize_cb,
+            "batch_size": max(1, env_obj.callback_batch_size),
+            "drain_scheduled": False,
+            "finalize_pending": False,
+            # Guards the drain_scheduled/finalize_pending handoff between a
+            # releasing thread and the drain running on the loop thread
+            "drain_lock": threading.Lock(),
         }
 
-        # Debug: print(f"[napi-python] create_tsfn: id={tsfn_id}, func={func}, func_ref={func_ref}")
-        _tsfn_store[tsfn_id] = tsfn_data
-        _callback_refs.append(tsfn_data)
-        if js_cb:
-            _callback_refs.append(js_cb)
+        # TSFNs are always created on the JS thread, so remember it here
+        # rather than guessing from whichever thread calls first
+        if getattr(ctx, "_main_thread_id", None) is None:
+            ctx._main_thread_id = threading.current_thread().ident
+
+        logger.debug("create_tsfn: id=%s, func=%s", tsfn_id, func)
+        _tsfn_slots[slot] = tsfn_data
 
         if result:
             result[0] = tsfn_id
 
-        return napi_status.napi_ok
+        return _OK
 
-    @FuncCallTsfn
     def call_tsfn(tsfn_id, data, is_blocking):
         """Call a threadsafe function."""
-        import asyncio
-        import threading
-
-        tsfn_data = _tsfn_store.get(tsfn_id)
+        tsfn_data = _get_tsfn(tsfn_id)
         if not tsfn_data:
-            return napi_status.napi_invalid_arg
+            return _INVALID_ARG
 
         # Check closing state
         if tsfn_data.get("is_closing", False) or tsfn_data["closed"]:
             if tsfn_data["thread_count"] == 0:
-                return napi_status.napi_invalid_arg
+                return _INVALID_ARG
             else:
                 tsfn_data["thread_count"] -= 1
-                return napi_status.napi_closing
+                return _CLOSING
 
-        env_id = tsfn_data["env_id"]
-        func = tsfn_data["func"]
-        context = tsfn_data["context"]
-        call_js_cb = tsfn_data["call_js_cb"]
         loop = tsfn_data["loop"]
 
-        def dispatch():
-            """Execute the callback on the main thread."""
-            env_obj = get_env(env_id)
-            if not env_obj:
-                return
-
-            # Open a scope for this callback
-            scope = ctx.open_scope(env_obj)
-            try:
-                if call_js_cb:
-                    # Get the function from our persistent reference
-                    func_value = tsfn_data.get("func_value")
-                    func_ref = tsfn_data.get("func_ref")
-
-                    if func_value is not None and func_ref is not None:
-                        # Store the callback in the handle store at a high index
-                        # that won't get erased by scope management
-                        persistent_handle = 0x10000000 + func_ref
-                        ctx._handle_store._values.extend(
-                            [None]
-                            * max(
-                                0,
-                                persistent_handle + 1 - len(ctx._handle_store._values),
-                            )
-                        )
-                        ctx._handle_store._values[persistent_handle] = func_value
-                        js_callback = persistent_handle
-                    elif func_value is not None:
-                        js_callback = ctx.add_value(func_value)
-                    else:
-                        js_callback = 0
-
-                    # Track if native callback triggers any NAPI value creation
-                    initial_value_count = len(ctx._handle_store._values)
-
-                    # Call the native JS callback: (env, js_callback, context, data)
-                    try:
-                        call_js_cb(env_id, js_callback, context, data)
-                    except Exception as exc:
-                        import traceback
-
-                        print(
-                            f"[napi-python] call_js_cb exception in TSFN dispatch: {exc}"
-                        )
-                        traceback.print_exc()
-                        # Native callback may fail, continue with workaround
-
-                    # Check if native callback created any new values
-                    new_value_count = len(ctx._handle_store._values)
-                    native_created_value = new_value_count > initial_value_count
-
-                    # If native callback didn't call back into NAPI (common when not in Node.js),
-                    # call the Python callback directly with data pointer as an External
-                    if (
-                        not native_created_value
-                        and func_value is not None
-                        and callable(func_value)
-                    ):
-                        # Create an External value wrapping the native data pointer
-                        # This allows advanced users to access the raw data if needed
-                        try:
-                            external = ctx.create_external(data)
-                            func_value(external)
-                        except Exception:
-                            pass  # Callback exceptions are silently ignored
-            except Exception:
-                pass  # TSFN dispatch errors are silently ignored
-            finally:
-                ctx.close_scope(env_obj, scope)
-
         # Check if we're on the main thread
         main_thread_id = getattr(ctx, "_main_thread_id", None)
-        current_thread_id = threading.current_thread().ident
+        current_thread_id = threading.get_ident()
 
         if main_thread_id is None:
             # First call - assume this is the main thread
@@ -1665,46 +1736,176 @@ def _create_function_table() -> NapiPythonFunctions:
 
         if is_blocking == 1:
             # Blocking mode - always dispatch immediately
-            dispatch()
+            _dispatch_tsfn(tsfn_data, data)
         elif current_thread_id == main_thread_id:
             # We're on the main thread - dispatch immediately
-            dispatch()
+            _dispatch_tsfn(tsfn_data, data)
+        elif loop.is_running():
+            # We're on a background thread with non-blocking mode and the
+            # event loop is alive: queue the call and let the loop drain
+            # queued calls in batches, so a burst of calls costs one wakeup.
+            # Only the raw data pointer is queued - the worker thread holds
+            # the GIL just long enough to enqueue it
+            # Enqueue and schedule under the lock release_tsfn checks, so a
+            # release either sees this drain scheduled and defers finalize
+            # to it, or closes first and the call is refused here
+            pending = tsfn_data["queue"]
+            with tsfn_data["drain_lock"]:
+                if tsfn_data["closed"]:
+                    return _CLOSING
+                if tsfn_data["max_queue_size"] > 0:
+                    try:
+                        pending.put_nowait(data)
+                    except queue.Full:
+                        return _QUEUE_FULL
+                else:
+                    pending.append(data)
+                if not tsfn_data["drain_scheduled"]:
+                    tsfn_data["drain_scheduled"] = True
+                    # Both enqueue on the same ready queue, so ordering holds;
+                    # on the loop's own thread skip the self-pipe wakeup
+                    if current_thread_id == tsfn_data["loop_thread_id"]:
+                        loop.call_soon(_drain_tsfn, tsfn_data)
+                    else:
+                        loop.call_soon_threadsafe(_drain_tsfn, tsfn_data)
         else:
-            # We're on a background thread with non-blocking mode
-            # For webcodecs and similar libs, we still need to dispatch
-            # immediately because the asyncio event loop won't process
-            # queued callbacks until awaited
-            #
-            # TODO: Consider using a proper queue and async processing
-            # For now, dispatch directly (native code handles thread safety)
-            dispatch()
-
-        return napi_status.napi_ok
-
-    @FuncAcquireTsfn
+            # We're on a background thread with non-blocking mode but
+            # nothing is running the event loop, so queued calls would
+            # never be delivered - dispatch directly instead
+            _dispatch_tsfn(tsfn_data, data)
+
+        return _OK
+
+    def _dispatch_tsfn(tsfn_data, data):
+        """Execute one threadsafe function call on the JS thread."""
+        env_id = tsfn_data["env_id"]
+        context = tsfn_data["context"]
+        call_js_cb = tsfn_data["call_js_cb"]
+
+        env_obj = get_env(env_id)
+        if not env_obj:
+            return
+
+        # Open a scope for this callback
+        scope = open_scope(env_obj)
+        try:
+            if call_js_cb:
+                # The function's handle only has to outlive this call, so
+                # it goes in the scope opened for it
+                func_value = tsfn_data.get("func_value")
+                js_callback = add_value(func_value) if func_value is not None else 0
+
+                # Track if native callback triggers any NAPI value creation
+                initial_value_count = len(ctx._handle_store._values)
+
+                # Call the native JS callback: (env, js_callback, context, data)
+                try:
+                    call_js_cb(env_id, js_callback, context, data)
+                except Exception:
+                    logger.exception("call_js_cb exception in TSFN dispatch")
+                    # Native callback may fail, continue with workaround
+
+                # Check if native callback created any new values
+                new_value_count = len(ctx._handle_store._values)
+                native_created_value = new_value_count > initial_value_count
+
+                # If native callback didn't call back into NAPI (common when not in Node.js),
+                # call the Python callback directly with data pointer as an External
+                if (
+                    not native_created_value
+                    and func_value is not None
+                    and callable(func_value)
+                ):
+                    # Create an External value wrapping the native data pointer
+                    # This allows advanced users to access the raw data if needed
+                    try:
+                        pointer_sink = tsfn_data["pointer_sink"]
+                        if pointer_sink is not None:
+                            pointer_sink.append(data)
+                        else:
+                            external = ctx.create_external(data)
+                            func_value(external)
+                    except Exception:
+                        pass  # Callback exceptions are silently ignored
+        except Exception:
+            pass  # TSFN dispatch errors are silently ignored
+        finally:
+            close_scope(env_obj, scope)
+
+    def _drain_tsfn(tsfn_data):
+        """Deliver up to one batch of queued calls on the event loop thread."""
+        # The whole batch runs inside this one loop callback, i.e. under a
+        # single GIL hold on the loop thread
+        pending = tsfn_data["queue"]
+        bounded = tsfn_data["max_queue_size"] > 0
+        take = pending.get_nowait if bounded else pending.popleft
+        for _ in range(tsfn_data["batch_size"]):
+            try:
+                data = take()
+            except (queue.Empty, IndexError):
+                break
+            _dispatch_tsfn(tsfn_data, data)
+
+        # State flips usually ride on a delivered call (e.g. the last chunk),
+        # so let waiting coroutines re-check right after each batch
+        notify_waiters()
+
+        # Clear the flag before re-checking so a call queued concurrently
+        # either sees the flag cleared or is picked up by the check below.
+        # Under the lock, a concurrent release either sets finalize_pending
+        # before this check or sees drain_scheduled cleared and finalizes
+        finalize = False
+        with tsfn_data["drain_lock"]:
+            tsfn_data["drain_scheduled"] = False
+            if pending.qsize() if bounded else pending:
+                tsfn_data["drain_scheduled"] = True
+                tsfn_data["loop"].call_soon(_drain_tsfn, tsfn_data)
+            elif tsfn_data["finalize_pending"]:
+                tsfn_data["finalize_pending"] = False
+                finalize = True
+        if finalize:
+            _finalize_tsfn(tsfn_data)
+
+    def _finalize_tsfn(tsfn_data):
+        """Call the thread finalize callback of a closed threadsafe function."""
+        finalize_cb = tsfn_data.get("finalize_cb")
+        finalize_data = tsfn_data.get("finalize_data")
+        context = tsfn_data.get("context")
+
+        if finalize_cb:
+            try:
+                finalize_func = ctypes.cast(finalize_cb, NapiFinalize)
+                env_id = tsfn_data["env_id"]
+                finalize_func(env_id, finalize_data, context)
+            except Exception as e:
+                logger.warning("TSFN finalize error: %s", e)
+
+        # Native work behind this TSFN is done; let coroutines waiting on
+        # addon state re-check it right away
+        notify_waiters()
+
     def acquire_tsfn(tsfn_id):
         """Acquire a threadsafe function (increment thread count)."""
-        tsfn_data = _tsfn_store.get(tsfn_id)
+        tsfn_data = _get_tsfn(tsfn_id)
         if not tsfn_data:
-            return napi_status.napi_invalid_arg
+            return _INVALID_ARG
 
         # Check if closing
         if tsfn_data.get("is_closing", False):
-            return napi_status.napi_closing
+            return _CLOSING
 
         tsfn_data["thread_count"] += 1
-        return napi_status.napi_ok
+        return _OK
 
-    @FuncReleaseTsfn
     def release_tsfn(tsfn_id, mode):
         """Release a threadsafe function."""
-        tsfn_data = _tsfn_store.get(tsfn_id)
+        tsfn_data = _get_tsfn(tsfn_id)
         if not tsfn_data:
-            return napi_status.napi_ok
+            return _OK
 
         # Check thread count
         if tsfn_data["thread_count"] == 0:
-            return napi_status.napi_invalid_arg
+            return _INVALID_ARG
 
         tsfn_data["thread_count"] -= 1
 
@@ -1716,27 +1917,25 @@ def _create_function_table() -> NapiPythonFunctions:
                 is_closing_value = 1 if mode == 1 else 0
                 tsfn_data["is_closing"] = bool(is_closing_value)
 
-                # Mark as closed
-                tsfn_data["closed"] = True
-
-                # Call finalize callback if provided
-                finalize_cb = tsfn_data.get("finalize_cb")
-                finalize_data = tsfn_data.get("finalize_data")
-                context = tsfn_data.get("context")
-
-                if finalize_cb:
-                    try:
-                        FinalizeCb = CFUNCTYPE(None, c_void_p, c_void_p, c_void_p)
-                        finalize_func = ctypes.cast(finalize_cb, FinalizeCb)
-                        env_id = tsfn_data["env_id"]
-                        finalize_func(env_id, finalize_data, context)
-                    except Exception as e:
-                        print(f"[napi-python] TSFN finalize error: {e}")
-
-                # Remove from store
-                _tsfn_store.pop(tsfn_id, None)
-
-        return napi_status.napi_ok
+                # Call finalize callback once queued calls are delivered;
+                # a scheduled drain takes it over. Closing and the check
+                # happen under the lock, so neither the drain nor a
+                # producer enqueueing a call can slip in between
+                with tsfn_data["drain_lock"]:
+                    tsfn_data["closed"] = True
+                    deferred = tsfn_data["drain_scheduled"]
+                    if deferred:
+                        tsfn_data["finalize_pending"] = True
+                if not deferred:
+                    _finalize_tsfn(tsfn_data)
+
+                # Free the slot for the next TSFN under a new generation
+                slot = tsfn_id & 0xFFFFFFFF
+                _tsfn_slots[slot] = None
+                _tsfn_generations[slot] = (_tsfn_generations[slot] + 1) & 0x7FFFFFFF
+                _tsfn_free.append(slot)
+
+        return _OK
 
     # =============================================================================
     # ArrayBuffer Functions
@@ -1752,134 +1951,124 @@ def _create_function_table() -> NapiPythonFunctions:
     )
     from ._napi.types import napi_typedarray_type
 
-    @FuncCreateArraybuffer
     def create_arraybuffer(env, byte_length, data, result):
         try:
             arraybuffer = ArrayBuffer(byte_length)
             if data:
                 data[0] = arraybuffer.data_ptr
-            handle = ctx.add_value(arraybuffer)
+            handle = add_value(arraybuffer)
             result[0] = handle
-            return napi_status.napi_ok
+            return _OK
         except Exception:
-            return napi_status.napi_generic_failure
+            return _GENERIC_FAILURE
 
-    @FuncGetArraybufferInfo
     def get_arraybuffer_info(env, arraybuffer_handle, data, byte_length):
         try:
-            py_val = ctx.python_value_from_napi(arraybuffer_handle)
+            py_val = python_value_from_napi(arraybuffer_handle)
             if not _is_arraybuffer(py_val):
-                return napi_status.napi_invalid_arg
+                return _INVALID_ARG
             if data:
                 data[0] = py_val.data_ptr
             if byte_length:
                 byte_length[0] = py_val.byte_length
-            return napi_status.napi_ok
+            return _OK
         except Exception:
-            return napi_status.napi_generic_failure
+            return _GENERIC_FAILURE
 
-    @FuncIsDetachedArraybuffer
     def is_detached_arraybuffer(env, arraybuffer_handle, result):
         try:
-            py_val = ctx.python_value_from_napi(arraybuffer_handle)
+            py_val = python_value_from_napi(arraybuffer_handle)
             if _is_arraybuffer(py_val):
                 result[0] = py_val.detached
             else:
                 result[0] = False
-            return napi_status.napi_ok
+            return _OK
         except Exception:
-            return napi_status.napi_generic_failure
+            return _GENERIC_FAILURE
 
-    @FuncDetachArraybuffer
     def detach_arraybuffer(env, arraybuffer_handle):
         try:
-            py_val = ctx.python_value_from_napi(arraybuffer_handle)
+            py_val = python_value_from_napi(arraybuffer_handle)
             if not _is_arraybuffer(py_val):
-                return napi_status.napi_arraybuffer_expected
+                return _ARRAYBUFFER_EXPECTED
             py_val.detach()
-            return napi_status.napi_ok
+            return _OK
         except Exception:
-            return napi_status.napi_generic_failure
+            return _GENERIC_FAILURE
 
-    @FuncIsArraybuffer
     def is_arraybuffer(env, value, result):
         try:
-            py_val = ctx.python_value_from_napi(value)
+            py_val = python_value_from_napi(value)
             result[0] = _is_arraybuffer(py_val)
-            return napi_status.napi_ok
+            return _OK
         except Exception:
-            return napi_status.napi_generic_failure
+            return _GENERIC_FAILURE
 
     # =============================================================================
     # TypedArray Functions
     # =============================================================================
 
-    @FuncCreateTypedarray
     def create_typedarray(
         env, array_type, length, arraybuffer_handle, byte_offset, result
     ):
         try:
-            buffer = ctx.python_value_from_napi(arraybuffer_handle)
+            buffer = python_value_from_napi(arraybuffer_handle)
             if not _is_arraybuffer(buffer):
-                return napi_status.napi_invalid_arg
+                return _INVALID_ARG
             typedarray = TypedArray(array_type, buffer, byte_offset, length)
-            handle = ctx.add_value(typedarray)
+            handle = add_value(typedarray)
             result[0] = handle
-            return napi_status.napi_ok
+            return _OK
         except Exception:
-            return napi_status.napi_generic_failure
+            return _GENERIC_FAILURE
 
     # =============================================================================
     # DataView Functions
     # =============================================================================
 
-    @FuncCreateDataview
     def create_dataview(env, byte_length, arraybuffer_handle, byte_offset, result):
         try:
-            buffer = ctx.python_value_from_napi(arraybuffer_handle)
+            buffer = python_value_from_napi(arraybuffer_handle)
             if not _is_arraybuffer(buffer):
-                return napi_status.napi_invalid_arg
+                return _INVALID_ARG
             dataview = DataView(buffer, byte_offset, byte_length)
-            handle = ctx.add_value(dataview)
+            handle = add_value(dataview)
             result[0] = handle
-            return napi_status.napi_ok
+            return _OK
         except Exception:
-            return napi_status.napi_generic_failure
+            return _GENERIC_FAILURE
 
-    @FuncGetDataviewInfo
     def get_dataview_info(
         env, dataview_handle, byte_length, data, arraybuffer, byte_offset
     ):
         try:
-            py_val = ctx.python_value_from_napi(dataview_handle)
+            py_val = python_value_from_napi(dataview_handle)
             if not _is_dataview(py_val):
-                return napi_status.napi_invalid_arg
+                return _INVALID_ARG
             if byte_length:
                 byte_length[0] = py_val.byte_length
             if data:
                 data[0] = py_val.data_ptr
             if arraybuffer:
-                arraybuffer[0] = ctx.add_value(py_val.buffer)
+                arraybuffer[0] = add_value(py_val.buffer)
             if byte_offset:
                 byte_offset[0] = py_val.byte_offset
-            return napi_status.napi_ok
+            return _OK
         except Exception:
-            return napi_status.napi_generic_failure
+            return _GENERIC_FAILURE
 
-    @FuncIsDataview
     def is_dataview(env, value, result):
         try:
-            py_val = ctx.python_value_from_napi(value)
+            py_val = python_value_from_napi(value)
             result[0] = _is_dataview(py_val)
-            return napi_status.napi_ok
+            return _OK
         except Exception:
-            return napi_status.napi_generic_failure
+            return _GENERIC_FAILURE
 
     # =============================================================================
     # Buffer Functions
     # =============================================================================
 
-    @FuncCreateBuffer
     def create_buffer(env, size, data, result):
         try:
             arraybuffer = ArrayBuffer(size)
@@ -1888,13 +2077,12 @@ def _create_function_table() -> NapiPythonFunctions:
             )
             if data:
                 data[0] = arraybuffer.data_ptr
-            handle = ctx.add_value(buffer)
+            handle = add_value(buffer)
             result[0] = handle
-            return napi_status.napi_ok
+            return _OK
         except Exception:
-            return napi_status.napi_generic_failure
+            return _GENERIC_FAILURE
 
-    @FuncCreateBufferCopy
     def create_buffer_copy(env, length, source_data, result_data, result):
         from ctypes import memmove
 
@@ -1907,192 +2095,176 @@ def _create_function_table() -> NapiPythonFunctions:
             )
             if result_data:
                 result_data[0] = arraybuffer.data_ptr
-            handle = ctx.add_value(buffer)
+            handle = add_value(buffer)
             result[0] = handle
-            return napi_status.napi_ok
+            return _OK
         except Exception:
-            return napi_status.napi_generic_failure
+            return _GENERIC_FAILURE
 
-    @FuncGetBufferInfo
     def get_buffer_info(env, buffer_handle, data, length):
         from ctypes import c_uint8, addressof
 
         try:
-            py_val = ctx.python_value_from_napi(buffer_handle)
+            py_val = python_value_from_napi(buffer_handle)
             if _is_typedarray(py_val):
                 if data:
                     data[0] = py_val.data_ptr
                 if length:
                     length[0] = py_val.length
-                return napi_status.napi_ok
+                return _OK
             if _is_dataview(py_val):
                 if data:
                     data[0] = py_val.data_ptr
                 if length:
                     length[0] = py_val.byte_length
-                return napi_status.napi_ok
-            # Handle Python bytes/bytearray
-            if isinstance(py_val, (bytes, bytearray)):
-                # Need to convert to a stable buffer
-                # Store it as an ArrayBuffer for this call
-                buf = ArrayBuffer.from_data(py_val)
-                # Store reference to prevent GC
-                ctx._temp_buffers = getattr(ctx, "_temp_buffers", [])
-                ctx._temp_buffers.append(buf)
+                return _OK
+            # Handle Python bytes/bytearray/memoryview
+            if isinstance(py_val, (bytes, bytearray, memoryview)):
+                view = memoryview(py_val)
+                if not view.c_contiguous:
+                    return _INVALID_ARG
                 if data:
-                    data[0] = buf.data_ptr
+                    data[0] = ctx.get_buffer_address(py_val)
                 if length:
-                    length[0] = len(py_val)
-                return napi_status.napi_ok
-            return napi_status.napi_invalid_arg
+                    length[0] = view.nbytes
+                return _OK
+            return _INVALID_ARG
         except Exception:
-            return napi_status.napi_generic_failure
+            return _GENERIC_FAILURE
 
-    @FuncIsBuffer
     def is_buffer(env, value, result):
         try:
-            py_val = ctx.python_value_from_napi(value)
+            py_val = python_value_from_napi(value)
             result[0] = isinstance(py_val, (bytes, bytearray, TypedArray))
-            return napi_status.napi_ok
+            return _OK
         except Exception:
-            return napi_status.napi_generic_failure
+            return _GENERIC_FAILURE
 
     # =============================================================================
     # External Functions
     # =============================================================================
 
-    @FuncCreateExternal
     def create_external(env, data_ptr, finalize_cb, finalize_hint, result):
         try:
             external = ctx.create_external(data_ptr)
-            handle = ctx.add_value(external)
+            handle = add_value(external)
             result[0] = handle
-            return napi_status.napi_ok
+            return _OK
         except Exception:
-            return napi_status.napi_generic_failure
+            return _GENERIC_FAILURE
 
-    @FuncGetValueExternal
     def get_value_external(env, value, result):
         try:
-            py_val = ctx.python_value_from_napi(value)
+            py_val = python_value_from_napi(value)
             if ctx.is_external(py_val):
                 result[0] = ctx.get_external_value(py_val)
-                return napi_status.napi_ok
-            return napi_status.napi_invalid_arg
+                return _OK
+            return _INVALID_ARG
         except Exception:
-            return napi_status.napi_generic_failure
+            return _GENERIC_FAILURE
 
     # =============================================================================
     # Additional Error Functions
     # =============================================================================
 
-    @FuncThrowTypeError
     def throw_type_error(env, code, msg):
         env_obj = get_env(env)
         if env_obj:
             msg_str = msg.decode("utf-8") if msg else ""
             env_obj.last_exception = TypeError(msg_str)
-        return napi_status.napi_ok
+        return _OK
 
-    @FuncThrowRangeError
     def throw_range_error(env, code, msg):
         env_obj = get_env(env)
         if env_obj:
             msg_str = msg.decode("utf-8") if msg else ""
             env_obj.last_exception = ValueError(msg_str)
-        return napi_status.napi_ok
+        return _OK
 
-    @FuncCreateTypeError
     def create_type_error(env, code, msg_handle, result):
         try:
-            msg = ctx.python_value_from_napi(msg_handle)
+            msg = python_value_from_napi(msg_handle)
             if not isinstance(msg, str):
-                return napi_status.napi_string_expected
+                return _STRING_EXPECTED
             error = TypeError(msg)
-            handle = ctx.add_value(error)
+            handle = add_value(error)
             result[0] = handle
-            return napi_status.napi_ok
+            return _OK
         except Exception:
-            return napi_status.napi_generic_failure
+            return _GENERIC_FAILURE
 
-    @FuncCreateRangeError
     def create_range_error(env, code, msg_handle, result):
         try:
-            msg = ctx.python_value_from_napi(msg_handle)
+            msg = python_value_from_napi(msg_handle)
             if not isinstance(msg, str):
-                return napi_status.napi_string_expected
+                return _STRING_EXPECTED
             error = ValueError(msg)
-            handle = ctx.add_value(error)
+            handle = add_value(error)
             result[0] = handle
-            return napi_status.napi_ok
+            return _OK
         except Exception:
-            return napi_status.napi_generic_failure
+            return _GENERIC_FAILURE
 
     # =============================================================================
     # Instance Creation
     # =============================================================================
 
-    @FuncNewInstance
     def new_instance(env_id, constructor_handle, argc, argv, result):
         """Create a new instance of a class."""
         env_obj = get_env(env_id)
         if not env_obj:
-            return napi_status.napi_invalid_arg
+            return _INVALID_ARG
 
         try:
             # Get the constructor class
-            constructor = ctx.python_value_from_napi(constructor_handle)
+            constructor = python_value_from_napi(constructor_handle)
 
             if constructor is None:
                 if result:
-                    result[0] = Constant.UNDEFINED
-                return napi_status.napi_invalid_arg
+                    result[0] = _UNDEFINED_HANDLE
+                return _INVALID_ARG
 
             # Get arguments
-            args = []
-            for i in range(argc):
-                if argv:
-                    args.append(ctx.python_value_from_napi(argv[i]))
-                else:
-                    args.append(None)
+            if argv:
+                args = python_values_from_napi(argv[:argc])
+            else:
+                args = [None] * argc
 
             # Create the instance by calling the constructor
             if callable(constructor):
                 instance = constructor(*args)
             else:
                 if result:
-                    result[0] = Constant.UNDEFINED
-                return napi_status.napi_function_expected
+                    result[0] = _UNDEFINED_HANDLE
+                return _FUNCTION_EXPECTED
 
             # Store the instance and return handle
             if result:
-                result[0] = ctx.add_value(instance)
-            return napi_status.napi_ok
+                result[0] = add_value(instance)
+            return _OK
 
         except Exception as e:
             if result:
-                result[0] = Constant.UNDEFINED
-            return napi_status.napi_generic_failure
+                result[0] = _UNDEFINED_HANDLE
+            return _GENERIC_FAILURE
 
-    @FuncFatalException
     def fatal_exception(env_id, err):
         """Handle a fatal exception - just log it for now."""
         # TODO: Proper fatal exception handling
-        return napi_status.napi_ok
+        return _OK
 
-    @FuncGetNewTarget
     def get_new_target(env_id, cbinfo, result):
         """Get the new.target value from callback info."""
         env_obj = get_env(env_id)
         if not env_obj:
-            return napi_status.napi_invalid_arg
+            return _INVALID_ARG
         if not cbinfo:
-            return napi_status.napi_invalid_arg
+            return _INVALID_ARG
         if not result:
-            return napi_status.napi_invalid_arg
+            return _INVALID_ARG
 
         try:
-            cb_info = ctx.get_callback_info(cbinfo)
+            cb_info = get_callback_info(cbinfo)
             thiz = cb_info.thiz
             fn = cb_info.fn
 
@@ -2100,9 +2272,9 @@ def _create_function_table() -> NapiPythonFunctions:
             # thiz == null || thiz.constructor == null ? 0
             #   : thiz instanceof fn ? thiz.constructor : 0
             if thiz is None:
-                result[0] = Constant.UNDEFINED
+                result[0] = _UNDEFINED_HANDLE
             elif not hasattr(thiz, "__class__"):
-                result[0] = Constant.UNDEFINED
+                result[0] = _UNDEFINED_HANDLE
             else:
                 # Check if thiz is an instance of the function/class
                 # In Python, fn might be the class itself or a method
@@ -2111,274 +2283,246 @@ def _create_function_table() -> NapiPythonFunctions:
                 # If fn is callable and thiz is an instance of something fn created
                 if fn is not None and isinstance(thiz, type(thiz)):
                     # Return the constructor (type of thiz)
-                    result[0] = ctx.add_value(thiz_type)
+                    result[0] = add_value(thiz_type)
                 else:
-                    result[0] = Constant.UNDEFINED
+                    result[0] = _UNDEFINED_HANDLE
 
-            return napi_status.napi_ok
+            return _OK
         except Exception:
             if result:
-                result[0] = Constant.UNDEFINED
-            return napi_status.napi_ok
+                result[0] = _UNDEFINED_HANDLE
+            return _OK
 
-    @FuncHasOwnProperty
     def has_own_property(env_id, object_handle, key_handle, result):
         """Check if object has own property."""
         try:
-            py_obj = ctx.python_value_from_napi(object_handle)
-            py_key = ctx.python_value_from_napi(key_handle)
+            py_obj = python_value_from_napi(object_handle)
+            py_key = python_value_from_napi(key_handle)
             if isinstance(py_obj, dict):
                 if result:
                     result[0] = py_key in py_obj
             else:
                 if result:
                     result[0] = hasattr(py_obj, str(py_key))
-            return napi_status.napi_ok
+            return _OK
         except Exception:
             if result:
                 result[0] = False
-            return napi_status.napi_ok
+            return _OK
 
-    @FuncGetAllPropertyNames
     def get_all_property_names(
         env_id, object_handle, key_mode, key_filter, key_conversion, result
     ):
         """Get all property names of an object."""
         try:
-            py_obj = ctx.python_value_from_napi(object_handle)
+            py_obj = python_value_from_napi(object_handle)
             if isinstance(py_obj, dict):
                 names = list(py_obj.keys())
             else:
                 names = dir(py_obj)
             if result:
-                result[0] = ctx.add_value(names)
-            return napi_status.napi_ok
+                result[0] = add_value(names)
+            return _OK
         except Exception:
             if result:
-                result[0] = ctx.add_value([])
-            return napi_status.napi_ok
+                result[0] = add_value([])
+            return _OK
 
-    @FuncGetPropertyNames
     def get_property_names(env_id, object_handle, result):
         """Get property names of an object."""
         try:
-            py_obj = ctx.python_value_from_napi(object_handle)
+            py_obj = python_value_from_napi(object_handle)
             if isinstance(py_obj, dict):
                 names = list(py_obj.keys())
             else:
                 names = [n for n in dir(py_obj) if not n.startswith("_")]
             if result:
-                result[0] = ctx.add_value(names)
-            return napi_status.napi_ok
+                result[0] = add_value(names)
+            return _OK
         except Exception:
             if result:
-                result[0] = ctx.add_value([])
-            return napi_status.napi_ok
+                result[0] = add_value([])
+            return _OK
 
     # =============================================================================
     # Instance Data
     # =============================================================================
 
-    @FuncSetInstanceData
     def set_instance_data(env_id, data, finalize_cb, finalize_hint):
         """Set instance data for environment."""
         env_obj = get_env(env_id)
         if not env_obj:
-            return napi_status.napi_invalid_arg
+            return _INVALID_ARG
         env_obj.set_instance_data(data, finalize_cb, finalize_hint)
-        return napi_status.napi_ok
+        return _OK
 
-    @FuncGetInstanceData
     def get_instance_data(env_id, result):
         """Get instance data for environment."""
         env_obj = get_env(env_id)
         if not env_obj:
             if result:
                 result[0] = 0
-            return napi_status.napi_invalid_arg
+            return _INVALID_ARG
         data = env_obj.get_instance_data()
         if result:
             result[0] = data if data else 0
-        return napi_status.napi_ok
-
-    # Keep references to prevent GC
-    _callback_refs.extend(
-        [
-            get_version,
-            get_undefined,
-            get_null,
-            get_global,
-            get_boolean,
-            create_int32,
-            create_uint32,
-            create_int64,
-            create_double,
-            create_string_utf8,
-            get_value_bool,
-            get_value_int32,
-            get_value_uint32,
-            get_value_int64,
-            get_value_double,
-            get_value_string_utf8,
-            typeof_,
-            is_array,
-            is_typedarray,
-            is_error,
-            create_object,
-            create_array,
-            get_array_length,
-            get_element,
-            set_element,
-            get_property,
-            set_property,
-            get_named_property,
-            set_named_property,
-            get_cb_info,
-            create_function,
-            call_function,
-            define_class,
-            create_reference,
-            delete_reference,
-            get_reference_value,
-            reference_ref,
-            reference_unref,
-            throw_,
-            throw_error,
-            create_error,
-            is_exception_pending,
-            get_and_clear_last_exception,
-            open_handle_scope,
-            close_handle_scope,
-            coerce_to_string,
-            get_typedarray_info,
-            create_promise,
-            resolve_deferred,
-            reject_deferred,
-            is_promise,
-            create_tsfn,
-            call_tsfn,
-            acquire_tsfn,
-            release_tsfn,
-            wrap,
-            unwrap,
-            define_class_impl,
-            create_arraybuffer,
-            get_arraybuffer_info,
-            is_detached_arraybuffer,
-            detach_arraybuffer,
-            is_arraybuffer,
-            create_typedarray,
-            create_dataview,
-            get_dataview_info,
-            is_dataview,
-            create_buffer,
-            create_buffer_copy,
-            get_buffer_info,
-            is_buffer,
-            create_external,
-            get_value_external,
-            throw_type_error,
-            throw_range_error,
-            create_type_error,
-            create_range_error,
-            new_instance,
-            fatal_exception,
-            get_new_target,
-            has_own_property,
-            get_all_property_names,
-            get_property_names,
-            set_instance_data,
-            get_instance_data,
-        ]
-    )
+        return _OK
 
-    return NapiPythonFunctions(
-        get_version=get_version,
-        get_undefined=get_undefined,
-        get_null=get_null,
-        get_global=get_global,
-        get_boolean=get_boolean,
-        create_int32=create_int32,
-        create_uint32=create_uint32,
-        create_int64=create_int64,
-        create_double=create_double,
-        create_string_utf8=create_string_utf8,
-        get_value_bool=get_value_bool,
-        get_value_int32=get_value_int32,
-        get_value_uint32=get_value_uint32,
-        get_value_int64=get_value_int64,
-        get_value_double=get_value_double,
-        get_value_string_utf8=get_value_string_utf8,
-        typeof_=typeof_,
-        is_array=is_array,
-        is_typedarray=is_typedarray,
-        is_error=is_error,
-        create_object=create_object,
-        create_array=create_array,
-        get_array_length=get_array_length,
-        get_element=get_element,
-        set_element=set_element,
-        get_property=get_property,
-        set_property=set_property,
-        get_named_property=get_named_property,
-        set_named_property=set_named_property,
-        get_cb_info=get_cb_info,
-        create_function=create_function,
-        call_function=call_function,
-        define_class=define_class,
-        create_reference=create_reference,
-        delete_reference=delete_reference,
-        get_reference_value=get_reference_value,
-        reference_ref=reference_ref,
-        reference_unref=reference_unref,
-        throw_=throw_,
-        throw_error=throw_error,
-        create_error=create_error,
-        is_exception_pending=is_exception_pending,
-        get_and_clear_last_exception=get_and_clear_last_exception,
-        open_handle_scope=open_handle_scope,
-        close_handle_scope=close_handle_scope,
-        coerce_to_string=coerce_to_string,
-        get_typedarray_info=get_typedarray_info,
-        create_promise=create_promise,
-        resolve_deferred=resolve_deferred,
-        reject_deferred=reject_deferred,
-        is_promise=is_promise,
-        create_tsfn=create_tsfn,
-        call_tsfn=call_tsfn,
-        acquire_tsfn=acquire_tsfn,
-        release_tsfn=release_tsfn,
-        wrap=wrap,
-        unwrap=unwrap,
-        define_class_impl=define_class_impl,
-        create_arraybuffer=create_arraybuffer,
-        get_arraybuffer_info=get_arraybuffer_info,
-        is_detached_arraybuffer=is_detached_arraybuffer,
-        detach_arraybuffer=detach_arraybuffer,
-        is_arraybuffer=is_arraybuffer,
-        create_typedarray=create_typedarray,
-        create_dataview=create_dataview,
-        get_dataview_info=get_dataview_info,
-        is_dataview=is_dataview,
-        create_buffer=create_buffer,
-        create_buffer_copy=create_buffer_copy,
-        get_buffer_info=get_buffer_info,
-        is_buffer=is_buffer,
-        create_external=create_external,
-        get_value_external=get_value_external,
-        throw_type_error=throw_type_error,
-        throw_range_error=throw_range_error,
-        create_type_error=create_type_error,
-        create_range_error=create_range_error,
-        new_instance=new_instance,
-        fatal_exception=fatal_exception,
-        get_new_target=get_new_target,
-        has_own_property=has_own_property,
-        get_all_property_names=get_all_property_names,
-        get_property_names=get_property_names,
-        set_instance_data=set_instance_data,
-        get_instance_data=get_instance_data,
-    )
+    # =============================================================================
+    # Strict Equality
+    # =============================================================================
+
+    def strict_equals(env_id, lhs, rhs, result):
+        """Compare two values with JavaScript === semantics."""
+        if not result:
+            return _INVALID_ARG
+        a = python_value_from_napi(lhs)
+        b = python_value_from_napi(rhs)
+        # Strings and numbers compare by value (NaN !== NaN), everything
+        # else by identity - distinct handles may hold equal primitives
+        if type(a) is str and type(b) is str:
+            result[0] = a == b
+        elif type(a) in (int, float) and type(b) in (int, float):
+            result[0] = a == b
+        else:
+            result[0] = a is b
+        return _OK
+
+    # =============================================================================
+    # Lazy Table Loading
+    # =============================================================================
+
+    def request_function(slot):
+        """Fill in a table entry the shim found missing."""
+        if not 0 <= slot < len(callbacks):
+            return 0
+        materialize(slot)
+        return 1
+
+    # In NapiPythonFunctions field order
+    callbacks = [
+        get_version,
+        get_undefined,
+        get_null,
+        get_global,
+        get_boolean,
+        create_int32,
+        create_uint32,
+        create_int64,
+        create_double,
+        create_string_utf8,
+        get_value_bool,
+        get_value_int32,
+        get_value_uint32,
+        get_value_int64,
+        get_value_double,
+        get_value_string_utf8,
+        typeof_,
+        is_array,
+        is_typedarray,
+        is_error,
+        create_object,
+        create_array,
+        get_array_length,
+        get_element,
+        set_element,
+        get_property,
+        set_property,
+        get_named_property,
+        set_named_property,
+        get_cb_info,
+        create_function,
+        call_function,
+        define_class,
+        create_reference,
+        delete_reference,
+        get_reference_value,
+        reference_ref,
+        reference_unref,
+        throw_,
+        throw_error,
+        create_error,
+        is_exception_pending,
+        get_and_clear_last_exception,
+        open_handle_scope,
+        close_handle_scope,
+        coerce_to_string,
+        get_typedarray_info,
+        create_promise,
+        resolve_deferred,
+        reject_deferred,
+        is_promise,
+        create_tsfn,
+        call_tsfn,
+        acquire_tsfn,
+        release_tsfn,
+        wrap,
+        unwrap,
+        define_class_impl,
+        create_arraybuffer,
+        get_arraybuffer_info,
+        is_detached_arraybuffer,
+        detach_arraybuffer,
+        is_arraybuffer,
+        create_typedarray,
+        create_dataview,
+        get_dataview_info,
+        is_dataview,
+        create_buffer,
+        create_buffer_copy,
+        get_buffer_info,
+        is_buffer,
+        create_external,
+        get_value_external,
+        throw_type_error,
+        throw_range_error,
+        create_type_error,
+        create_range_error,
+        new_instance,
+        fatal_exception,
+        get_new_target,
+        has_own_property,
+        get_all_property_names,
+        get_property_names,
+        set_instance_data,
+        get_instance_data,
+        strict_equals,
+        request_function,
+    ]
+    signatures = [signature for _, signature in _FUNCTION_SIGNATURES]
+
+    # The table is a flat array of function pointers, so entries are filled
+    # in by index rather than through the per-field Structure setters
+    slots = (c_void_p * len(callbacks))()
+    # The ctypes trampolines must outlive the table; a fixed list per slot,
+    # owned by the table itself
+    trampolines: List[Any] = [None] * len(callbacks)
+    # Addon worker threads request entries too (e.g. call_tsfn); only one
+    # trampoline may ever be built per slot, or replacing it in trampolines
+    # frees a thunk another thread already read from the table
+    materialize_lock = threading.Lock()
+
+    def materialize(slot: int) -> None:
+        if slots[slot]:
+            return
+        with materialize_lock:
+            if not slots[slot]:
+                trampoline = CFUNCTYPE(*signatures[slot])(callbacks[slot])
+                trampolines[slot] = trampoline
+                slots[slot] = cast(trampoline, c_void_p).value
+
+    for slot, (name, _) in enumerate(_FUNCTION_SIGNATURES):
+        if not lazy or name in _EAGER_FUNCTIONS:
+            materialize(slot)
+
+    def materialize_all() -> None:
+        for slot in range(len(slots)):
+            materialize(slot)
+
+    table = NapiPythonFunctions.from_buffer(slots)
+    table._trampolines = trampolines
+    table.materialize_all = materialize_all
+    return table
 
 
 class LibcLoadedFunction:
@@ -2466,11 +2610,33 @@ def _load_with_libc_dlopen(path: str):
     return LibcLoadedLibrary(handle, path)
 
 
-def load_addon(path: str) -> ModuleExports:
+def load_addon(
+    path: str, callback_batch_size: Optional[int] = None
+) -> ModuleExports:
     """
     Load a Node-API native addon.
+
+    callback_batch_size bounds how many queued threadsafe function calls
+    are delivered per event loop wakeup (256 unless given). Passing it
+    again for an already loaded addon changes it for TSFNs created later.
     """
-    path = Path(path).resolve()
+    # A .node file is only initialized once per process; later loads of
+    # the same file share its exports (as require() does in Node.js).
+    # Absolute paths are also cached as given, so reloading by the same
+    # spelling skips resolve()'s filesystem walk; relative ones depend on
+    # the working directory and are always resolved
+    requested = os.fspath(path)
+    alias = requested if os.path.isabs(requested) else None
+    cached = _loaded_addons.get(alias) if alias else None
+    if cached is None:
+        path = Path(requested).resolve()
+        cached = _loaded_addons.get(str(path))
+        if cached is not None and alias:
+            _loaded_addons[alias] = cached
+    if cached is not None:
+        if callback_batch_size is not None:
+            cached._env.callback_batch_size = callback_batch_size
+        return cached
 
     if not path.exists():
         raise FileNotFoundError(f"Addon not found: {path}")
@@ -2481,6 +2647,8 @@ def load_addon(path: str) -> ModuleExports:
     # Get context and create environment
     ctx = get_default_context()
     env = ctx.create_env(str(path), NODE_API_DEFAULT_MODULE_API_VERSION)
+    if callback_batch_size is not None:
+        env.callback_batch_size = callback_batch_size
 
     # Load the addon - NAPI symbols will be resolved from our shim (loaded with RTLD_GLOBAL)
     try:
@@ -2530,4 +2698,14 @@ def load_addon(path: str) -> ModuleExports:
     finally:
         ctx.close_scope(env, scope)
 
-    return ModuleExports(exports, ctx, env)
+    module = ModuleExports(exports, ctx, env)
+    _loaded_addons[str(path)] = module
+    if alias:
+        _loaded_addons[alias] = module
+    logger.debug("Loaded addon: %s", path)
+    return module
+
+
+# Build the function table at import so the first load_addon only has to load
+# the shim and register it; the callbacks only depend on the default context
+_func_table = _create_function_table(lazy=True)
@@ -5,6 +5,7 @@ These functions implement the Node-API specification for Python.
 Reference: https://nodejs.org/api/n-api.html
 """
 
+import asyncio
 from typing import Optional, Any, List
 from ctypes import (
     c_void_p,
@@ -355,8 +356,6 @@ def napi_is_object(env: int, value: int, result: POINTER(c_bool)) -> int:
 
 def napi_is_promise(env: int, value: int, result: POINTER(c_bool)) -> int:
     """Check if value is a Promise."""
-    import asyncio
-
     env_obj = _check_env(env)
     if not env_obj:
         return napi_status.napi_invalid_arg
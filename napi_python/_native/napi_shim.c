@@ -12,6 +12,7 @@
 #include <stddef.h>
 #include <stdbool.h>
 #include <stdio.h>
+#include <math.h>
 
 // NAPI types
 typedef struct napi_env__* napi_env;
@@ -208,6 +209,10 @@ typedef struct {
     // Instance data
     napi_status (*set_instance_data)(napi_env env, void* data, napi_finalize finalize_cb, void* finalize_hint);
     napi_status (*get_instance_data)(napi_env env, void** result);
+    // Strict equality
+    napi_status (*strict_equals)(napi_env env, napi_value lhs, napi_value rhs, bool* result);
+    // Lazy table loader: fills in the NULL entry at the given slot index
+    int (*request_function)(size_t slot);
 } NapiPythonFunctions;
 
 // Global function table
@@ -218,16 +223,65 @@ void napi_python_set_functions(NapiPythonFunctions* funcs) {
     g_funcs = funcs;
 }
 
+// Ask Python to fill in a table entry that was left NULL at registration.
+// Returns nonzero if the entry is available afterwards
+int napi_python_request_function(size_t slot) {
+    if (!g_funcs || !g_funcs->request_function) return 0;
+    return g_funcs->request_function(slot);
+}
+
 // Helper macro for checking function table
 #define CHECK_FUNCS() if (!g_funcs) return napi_generic_failure
 
+// Reserved handle IDs - must match Constant in _napi/types.py. The values
+// behind them never change, so operations on them are answered here
+// without calling into Python
+#define HANDLE_UNDEFINED 2
+#define HANDLE_NULL 3
+#define HANDLE_FALSE 4
+#define HANDLE_TRUE 5
+#define HANDLE_GLOBAL 6
+#define HANDLE_EMPTY_STRING 7
+#define IS_CONSTANT_HANDLE(value) \
+    ((uintptr_t)(value) >= HANDLE_UNDEFINED && (uintptr_t)(value) <= HANDLE_EMPTY_STRING)
+
+// Permanent handles for common doubles - must match HandleStore.ZERO_DOUBLE,
+// ONE_DOUBLE and NAN_DOUBLE in _runtime/handle.py
+#define HANDLE_ZERO_DOUBLE 8
+#define HANDLE_ONE_DOUBLE 9
+#define HANDLE_NAN_DOUBLE 10
+#define IS_DOUBLE_HANDLE(value) \
+    ((uintptr_t)(value) >= HANDLE_ZERO_DOUBLE && (uintptr_t)(value) <= HANDLE_NAN_DOUBLE)
+#define IS_WHOLE_DOUBLE_HANDLE(value) \
+    ((uintptr_t)(value) == HANDLE_ZERO_DOUBLE || (uintptr_t)(value) == HANDLE_ONE_DOUBLE)
+#define DOUBLE_HANDLE_VALUE(value) \
+    ((uintptr_t)(value) == HANDLE_ZERO_DOUBLE ? 0.0 : (uintptr_t)(value) == HANDLE_ONE_DOUBLE ? 1.0 : NAN)
+
+// Small integers are encoded in the handle itself - must match SMI_TAG and
+// SMI_BIAS in _runtime/handle.py. Creating and reading them needs no
+// handle store slot, so it never leaves C
+#define SMI_TAG ((uintptr_t)1 << 62)
+#define SMI_BIAS ((int64_t)1 << 39)
+#define IS_SMI_HANDLE(value) (((uintptr_t)(value) & SMI_TAG) != 0)
+#define SMI_FITS(i) ((i) >= -SMI_BIAS && (i) < SMI_BIAS)
+#define SMI_VALUE(value) ((int64_t)((uintptr_t)(value) ^ SMI_TAG) - SMI_BIAS)
+#define SMI_HANDLE(i) ((napi_value)(SMI_TAG | (uintptr_t)((int64_t)(i) + SMI_BIAS)))
+
+// Entry is set, or could be materialized on first use
+#define PY_FUNC(name) \
+    (g_funcs->name || napi_python_request_function(offsetof(NapiPythonFunctions, name) / sizeof(void*)))
+
 // =============================================================================
 // NAPI Function Implementations
 // =============================================================================
 
+// The constant getters are answered here. A table entry is only used if
+// Python registered one up front; these slots are never requested lazily
+
 napi_status napi_get_version(napi_env env, uint32_t* result) {
     CHECK_FUNCS();
     if (g_funcs->get_version) return g_funcs->get_version(env, result);
+    if (!result) return napi_invalid_arg;
     *result = 9;
     return napi_ok;
 }
@@ -235,96 +289,144 @@ napi_status napi_get_version(napi_env env, uint32_t* result) {
 napi_status napi_get_undefined(napi_env env, napi_value* result) {
     CHECK_FUNCS();
     if (g_funcs->get_undefined) return g_funcs->get_undefined(env, result);
-    return napi_generic_failure;
+    if (!result) return napi_invalid_arg;
+    *result = (napi_value)HANDLE_UNDEFINED;
+    return napi_ok;
 }
 
 napi_status napi_get_null(napi_env env, napi_value* result) {
     CHECK_FUNCS();
     if (g_funcs->get_null) return g_funcs->get_null(env, result);
-    return napi_generic_failure;
+    if (!result) return napi_invalid_arg;
+    *result = (napi_value)HANDLE_NULL;
+    return napi_ok;
 }
 
 napi_status napi_get_global(napi_env env, napi_value* result) {
     CHECK_FUNCS();
     if (g_funcs->get_global) return g_funcs->get_global(env, result);
-    return napi_generic_failure;
+    if (!result) return napi_invalid_arg;
+    *result = (napi_value)HANDLE_GLOBAL;
+    return napi_ok;
 }
 
 napi_status napi_get_boolean(napi_env env, bool value, napi_value* result) {
     CHECK_FUNCS();
     if (g_funcs->get_boolean) return g_funcs->get_boolean(env, value, result);
-    return napi_generic_failure;
+    if (!result) return napi_invalid_arg;
+    *result = (napi_value)(value ? HANDLE_TRUE : HANDLE_FALSE);
+    return napi_ok;
 }
 
 napi_status napi_create_int32(napi_env env, int32_t value, napi_value* result) {
     CHECK_FUNCS();
-    if (g_funcs->create_int32) return g_funcs->create_int32(env, value, result);
+    if (result) { *result = SMI_HANDLE(value); return napi_ok; }
+    if (PY_FUNC(create_int32)) return g_funcs->create_int32(env, value, result);
     return napi_generic_failure;
 }
 
 napi_status napi_create_uint32(napi_env env, uint32_t value, napi_value* result) {
     CHECK_FUNCS();
-    if (g_funcs->create_uint32) return g_funcs->create_uint32(env, value, result);
+    if (result) { *result = SMI_HANDLE(value); return napi_ok; }
+    if (PY_FUNC(create_uint32)) return g_funcs->create_uint32(env, value, result);
     return napi_generic_failure;
 }
 
 napi_status napi_create_int64(napi_env env, int64_t value, napi_value* result) {
     CHECK_FUNCS();
-    if (g_funcs->create_int64) return g_funcs->create_int64(env, value, result);
+    if (result && SMI_FITS(value)) { *result = SMI_HANDLE(value); return napi_ok; }
+    if (PY_FUNC(create_int64)) return g_funcs->create_int64(env, value, result);
     return napi_generic_failure;
 }
 
 napi_status napi_create_double(napi_env env, double value, napi_value* result) {
     CHECK_FUNCS();
-    if (g_funcs->create_double) return g_funcs->create_double(env, value, result);
+    if (result) {
+        if (value == 0.0 && !signbit(value)) { *result = (napi_value)HANDLE_ZERO_DOUBLE; return napi_ok; }
+        if (value == 1.0) { *result = (napi_value)HANDLE_ONE_DOUBLE; return napi_ok; }
+        if (isnan(value)) { *result = (napi_value)HANDLE_NAN_DOUBLE; return napi_ok; }
+    }
+    if (PY_FUNC(create_double)) return g_funcs->create_double(env, value, result);
     return napi_generic_failure;
 }
 
 napi_status napi_create_string_utf8(napi_env env, const char* str, size_t length, napi_value* result) {
     CHECK_FUNCS();
-    if (g_funcs->create_string_utf8) return g_funcs->create_string_utf8(env, str, length, result);
+    if (PY_FUNC(create_string_utf8)) return g_funcs->create_string_utf8(env, str, length, result);
     return napi_generic_failure;
 }
 
 napi_status napi_get_value_bool(napi_env env, napi_value value, bool* result) {
     CHECK_FUNCS();
-    if (g_funcs->get_value_bool) return g_funcs->get_value_bool(env, value, result);
+    if (result && (uintptr_t)value == HANDLE_FALSE) { *result = false; return napi_ok; }
+    if (result && (uintptr_t)value == HANDLE_TRUE) { *result = true; return napi_ok; }
+    if (result && IS_SMI_HANDLE(value)) { *result = SMI_VALUE(value) != 0; return napi_ok; }
+    if (PY_FUNC(get_value_bool)) return g_funcs->get_value_bool(env, value, result);
     return napi_generic_failure;
 }
 
 napi_status napi_get_value_int32(napi_env env, napi_value value, int32_t* result) {
     CHECK_FUNCS();
-    if (g_funcs->get_value_int32) return g_funcs->get_value_int32(env, value, result);
+    if (result && IS_SMI_HANDLE(value)) { *result = (int32_t)(uint32_t)SMI_VALUE(value); return napi_ok; }
+    if (result && IS_WHOLE_DOUBLE_HANDLE(value)) { *result = (uintptr_t)value == HANDLE_ONE_DOUBLE; return napi_ok; }
+    if (PY_FUNC(get_value_int32)) return g_funcs->get_value_int32(env, value, result);
     return napi_generic_failure;
 }
 
 napi_status napi_get_value_uint32(napi_env env, napi_value value, uint32_t* result) {
     CHECK_FUNCS();
-    if (g_funcs->get_value_uint32) return g_funcs->get_value_uint32(env, value, result);
+    if (result && IS_SMI_HANDLE(value)) { *result = (uint32_t)SMI_VALUE(value); return napi_ok; }
+    if (result && IS_WHOLE_DOUBLE_HANDLE(value)) { *result = (uintptr_t)value == HANDLE_ONE_DOUBLE; return napi_ok; }
+    if (PY_FUNC(get_value_uint32)) return g_funcs->get_value_uint32(env, value, result);
     return napi_generic_failure;
 }
 
 napi_status napi_get_value_int64(napi_env env, napi_value value, int64_t* result) {
     CHECK_FUNCS();
-    if (g_funcs->get_value_int64) return g_funcs->get_value_int64(env, value, result);
+    if (result && IS_SMI_HANDLE(value)) { *result = SMI_VALUE(value); return napi_ok; }
+    if (result && IS_WHOLE_DOUBLE_HANDLE(value)) { *result = (uintptr_t)value == HANDLE_ONE_DOUBLE; return napi_ok; }
+    if (PY_FUNC(get_value_int64)) return g_funcs->get_value_int64(env, value, result);
     return napi_generic_failure;
 }
 
 napi_status napi_get_value_double(napi_env env, napi_value value, double* result) {
     CHECK_FUNCS();
-    if (g_funcs->get_value_double) return g_funcs->get_value_double(env, value, result);
+    if (result && IS_SMI_HANDLE(value)) { *result = (double)SMI_VALUE(value); return napi_ok; }
+    if (result && IS_DOUBLE_HANDLE(value)) { *result = DOUBLE_HANDLE_VALUE(value); return napi_ok; }
+    if (PY_FUNC(get_value_double)) return g_funcs->get_value_double(env, value, result);
     return napi_generic_failure;
 }
 
 napi_status napi_get_value_string_utf8(napi_env env, napi_value value, char* buf, size_t bufsize, size_t* result) {
     CHECK_FUNCS();
-    if (g_funcs->get_value_string_utf8) return g_funcs->get_value_string_utf8(env, value, buf, bufsize, result);
+    if ((uintptr_t)value == HANDLE_EMPTY_STRING) {
+        if (!buf && !result) return napi_invalid_arg;
+        if (buf && bufsize > 0) buf[0] = '\0';
+        if (result) *result = 0;
+        return napi_ok;
+    }
+    if (PY_FUNC(get_value_string_utf8)) return g_funcs->get_value_string_utf8(env, value, buf, bufsize, result);
     return napi_generic_failure;
 }
 
 napi_status napi_typeof(napi_env env, napi_value value, napi_valuetype* result) {
     CHECK_FUNCS();
-    if (g_funcs->typeof_) {
+    if (result && (IS_SMI_HANDLE(value) || IS_DOUBLE_HANDLE(value))) {
+        *result = napi_number;
+        return napi_ok;
+    }
+    if (result && IS_CONSTANT_HANDLE(value)) {
+        switch ((uintptr_t)value) {
+            case HANDLE_UNDEFINED: *result = napi_undefined; break;
+            case HANDLE_NULL: *result = napi_null; break;
+            case HANDLE_FALSE:
+            case HANDLE_TRUE: *result = napi_boolean; break;
+            case HANDLE_GLOBAL: *result = napi_object; break;
+            case HANDLE_EMPTY_STRING: *result = napi_string; break;
+        }
+        return napi_ok;
+    }
+    if (PY_FUNC(typeof_)) {
         napi_status status = g_funcs->typeof_(env, value, result);
         return status;
     }
@@ -333,67 +435,67 @@ napi_status napi_typeof(napi_env env, napi_value value, napi_valuetype* result)
 
 napi_status napi_is_array(napi_env env, napi_value value, bool* result) {
     CHECK_FUNCS();
-    if (g_funcs->is_array) return g_funcs->is_array(env, value, result);
+    if (PY_FUNC(is_array)) return g_funcs->is_array(env, value, result);
     return napi_generic_failure;
 }
 
 napi_status napi_is_typedarray(napi_env env, napi_value value, bool* result) {
     CHECK_FUNCS();
-    if (g_funcs->is_typedarray) return g_funcs->is_typedarray(env, value, result);
+    if (PY_FUNC(is_typedarray)) return g_funcs->is_typedarray(env, value, result);
     return napi_generic_failure;
 }
 
 napi_status napi_is_error(napi_env env, napi_value value, bool* result) {
     CHECK_FUNCS();
-    if (g_funcs->is_error) return g_funcs->is_error(env, value, result);
+    if (PY_FUNC(is_error)) return g_funcs->is_error(env, value, result);
     return napi_generic_failure;
 }
 
 napi_status napi_create_object(napi_env env, napi_value* result) {
     CHECK_FUNCS();
-    if (g_funcs->create_object) return g_funcs->create_object(env, result);
+    if (PY_FUNC(create_object)) return g_funcs->create_object(env, result);
     return napi_generic_failure;
 }
 
 napi_status napi_create_array(napi_env env, napi_value* result) {
     CHECK_FUNCS();
-    if (g_funcs->create_array) return g_funcs->create_array(env, result);
+    if (PY_FUNC(create_array)) return g_funcs->create_array(env, result);
     return napi_generic_failure;
 }
 
 napi_status napi_get_array_length(napi_env env, napi_value value, uint32_t* result) {
     CHECK_FUNCS();
-    if (g_funcs->get_array_length) return g_funcs->get_array_length(env, value, result);
+    if (PY_FUNC(get_array_length)) return g_funcs->get_array_length(env, value, result);
     return napi_generic_failure;
 }
 
 napi_status napi_get_element(napi_env env, napi_value object, uint32_t index, napi_value* result) {
     CHECK_FUNCS();
-    if (g_funcs->get_element) return g_funcs->get_element(env, object, index, result);
+    if (PY_FUNC(get_element)) return g_funcs->get_element(env, object, index, result);
     return napi_generic_failure;
 }
 
 napi_status napi_set_element(napi_env env, napi_value object, uint32_t index, napi_value value) {
     CHECK_FUNCS();
-    if (g_funcs->set_element) return g_funcs->set_element(env, object, index, value);
+    if (PY_FUNC(set_element)) return g_funcs->set_element(env, object, index, value);
     return napi_generic_failure;
 }
 
 napi_status napi_get_property(napi_env env, napi_value object, napi_value key, napi_value* result) {
     CHECK_FUNCS();
-    if (g_funcs->get_property) return g_funcs->get_property(env, object, key, result);
+    if (PY_FUNC(get_property)) return g_funcs->get_property(env, object, key, result);
     return napi_generic_failure;
 }
 
 napi_status napi_set_property(napi_env env, napi_value object, napi_value key, napi_value value) {
     CHECK_FUNCS();
-    if (g_funcs->set_property) return g_funcs->set_property(env, object, key, value);
+    if (PY_FUNC(set_property)) return g_funcs->set_property(env, object, key, value);
     return napi_generic_failure;
 }
 
 napi_status napi_get_named_property(napi_env env, napi_value object, const char* utf8name, napi_value* result) {
     CHECK_FUNCS();
-    if (g_funcs->get_named_property) {
+    if (PY_FUNC(get_named_property)) {
         napi_status status = g_funcs->get_named_property(env, object, utf8name, result);
         return status;
     }
@@ -402,13 +504,13 @@ napi_status napi_get_named_property(napi_env env, napi_value object, const char*
 
 napi_status napi_set_named_property(napi_env env, napi_value object, const char* utf8name, napi_value value) {
     CHECK_FUNCS();
-    if (g_funcs->set_named_property) return g_funcs->set_named_property(env, object, utf8name, value);
+    if (PY_FUNC(set_named_property)) return g_funcs->set_named_property(env, object, utf8name, value);
     return napi_generic_failure;
 }
 
 napi_status napi_get_cb_info(napi_env env, napi_callback_info cbinfo, size_t* argc, napi_value* argv, napi_value* this_arg, void** data) {
     CHECK_FUNCS();
-    if (g_funcs->get_cb_info) {
+    if (PY_FUNC(get_cb_info)) {
         napi_status result = g_funcs->get_cb_info(env, cbinfo, argc, argv, this_arg, data);
         return result;
     }
@@ -417,13 +519,13 @@ napi_status napi_get_cb_info(napi_env env, napi_callback_info cbinfo, size_t* ar
 
 napi_status napi_create_function(napi_env env, const char* utf8name, size_t length, napi_callback cb, void* data, napi_value* result) {
     CHECK_FUNCS();
-    if (g_funcs->create_function) return g_funcs->create_function(env, utf8name, length, cb, data, result);
+    if (PY_FUNC(create_function)) return g_funcs->create_function(env, utf8name, length, cb, data, result);
     return napi_generic_failure;
 }
 
 napi_status napi_call_function(napi_env env, napi_value recv, napi_value func, size_t argc, const napi_value* argv, napi_value* result) {
     CHECK_FUNCS();
-    if (g_funcs->call_function) {
+    if (PY_FUNC(call_function)) {
         napi_status status = g_funcs->call_function(env, recv, func, argc, argv, result);
         return status;
     }
@@ -432,13 +534,13 @@ napi_status napi_call_function(napi_env env, napi_value recv, napi_value func, s
 
 napi_status napi_define_class(napi_env env, const char* utf8name, size_t length, napi_callback constructor, void* data, size_t property_count, const napi_property_descriptor* properties, napi_value* result) {
     CHECK_FUNCS();
-    if (g_funcs->define_class_impl) return g_funcs->define_class_impl(env, utf8name, length, constructor, data, property_count, properties, result);
+    if (PY_FUNC(define_class_impl)) return g_funcs->define_class_impl(env, utf8name, length, constructor, data, property_count, properties, result);
     return napi_generic_failure;
 }
 
 napi_status napi_create_reference(napi_env env, napi_value value, uint32_t initial_refcount, napi_ref* result) {
     CHECK_FUNCS();
-    if (g_funcs->create_reference) {
+    if (PY_FUNC(create_reference)) {
         napi_status status = g_funcs->create_reference(env, value, initial_refcount, result);
         return status;
     }
@@ -447,13 +549,13 @@ napi_status napi_create_reference(napi_env env, napi_value value, uint32_t initi
 
 napi_status napi_delete_reference(napi_env env, napi_ref ref) {
     CHECK_FUNCS();
-    if (g_funcs->delete_reference) return g_funcs->delete_reference(env, ref);
+    if (PY_FUNC(delete_reference)) return g_funcs->delete_reference(env, ref);
     return napi_generic_failure;
 }
 
 napi_status napi_get_reference_value(napi_env env, napi_ref ref, napi_value* result) {
     CHECK_FUNCS();
-    if (g_funcs->get_reference_value) {
+    if (PY_FUNC(get_reference_value)) {
         napi_status status = g_funcs->get_reference_value(env, ref, result);
         return status;
     }
@@ -462,68 +564,68 @@ napi_status napi_get_reference_value(napi_env env, napi_ref ref, napi_value* res
 
 napi_status napi_reference_ref(napi_env env, napi_ref ref, uint32_t* result) {
     CHECK_FUNCS();
-    if (g_funcs->reference_ref) return g_funcs->reference_ref(env, ref, result);
+    if (PY_FUNC(reference_ref)) return g_funcs->reference_ref(env, ref, result);
     return napi_generic_failure;
 }
 
 napi_status napi_reference_unref(napi_env env, napi_ref ref, uint32_t* result) {
     CHECK_FUNCS();
-    if (g_funcs->reference_unref) return g_funcs->reference_unref(env, ref, result);
+    if (PY_FUNC(reference_unref)) return g_funcs->reference_unref(env, ref, result);
     return napi_generic_failure;
 }
 
 napi_status napi_throw(napi_env env, napi_value error) {
     CHECK_FUNCS();
-    if (g_funcs->throw_) return g_funcs->throw_(env, error);
+    if (PY_FUNC(throw_)) return g_funcs->throw_(env, error);
     return napi_generic_failure;
 }
 
 napi_status napi_throw_error(napi_env env, const char* code, const char* msg) {
     CHECK_FUNCS();
-    if (g_funcs->throw_error) return g_funcs->throw_error(env, code, msg);
+    if (PY_FUNC(throw_error)) return g_funcs->throw_error(env, code, msg);
     return napi_generic_failure;
 }
 
 napi_status napi_create_error(napi_env env, napi_value code, napi_value msg, napi_value* result) {
     CHECK_FUNCS();
-    if (g_funcs->create_error) return g_funcs->create_error(env, code, msg, result);
+    if (PY_FUNC(create_error)) return g_funcs->create_error(env, code, msg, result);
     return napi_generic_failure;
 }
 
 napi_status napi_is_exception_pending(napi_env env, bool* result) {
     CHECK_FUNCS();
-    if (g_funcs->is_exception_pending) return g_funcs->is_exception_pending(env, result);
+    if (PY_FUNC(is_exception_pending)) return g_funcs->is_exception_pending(env, result);
     *result = false;
     return napi_ok;
 }
 
 napi_status napi_get_and_clear_last_exception(napi_env env, napi_value* result) {
     CHECK_FUNCS();
-    if (g_funcs->get_and_clear_last_exception) return g_funcs->get_and_clear_last_exception(env, result);
+    if (PY_FUNC(get_and_clear_last_exception)) return g_funcs->get_and_clear_last_exception(env, result);
     return napi_generic_failure;
 }
 
 napi_status napi_open_handle_scope(napi_env env, napi_handle_scope* result) {
     CHECK_FUNCS();
-    if (g_funcs->open_handle_scope) return g_funcs->open_handle_scope(env, result);
+    if (PY_FUNC(open_handle_scope)) return g_funcs->open_handle_scope(env, result);
     return napi_generic_failure;
 }
 
 napi_status napi_close_handle_scope(napi_env env, napi_handle_scope scope) {
     CHECK_FUNCS();
-    if (g_funcs->close_handle_scope) return g_funcs->close_handle_scope(env, scope);
+    if (PY_FUNC(close_handle_scope)) return g_funcs->close_handle_scope(env, scope);
     return napi_generic_failure;
 }
 
 napi_status napi_coerce_to_string(napi_env env, napi_value value, napi_value* result) {
     CHECK_FUNCS();
-    if (g_funcs->coerce_to_string) return g_funcs->coerce_to_string(env, value, result);
+    if (PY_FUNC(coerce_to_string)) return g_funcs->coerce_to_string(env, value, result);
     return napi_generic_failure;
 }
 
 napi_status napi_get_typedarray_info(napi_env env, napi_value typedarray, napi_typedarray_type* type, size_t* length, void** data, napi_value* arraybuffer, size_t* byte_offset) {
     CHECK_FUNCS();
-    if (g_funcs->get_typedarray_info) return g_funcs->get_typedarray_info(env, typedarray, type, length, data, arraybuffer, byte_offset);
+    if (PY_FUNC(get_typedarray_info)) return g_funcs->get_typedarray_info(env, typedarray, type, length, data, arraybuffer, byte_offset);
     return napi_generic_failure;
 }
 
@@ -533,25 +635,30 @@ napi_status napi_get_typedarray_info(napi_env env, napi_value typedarray, napi_t
 
 napi_status napi_create_promise(napi_env env, napi_deferred* deferred, napi_value* promise) {
     CHECK_FUNCS();
-    if (g_funcs->create_promise) return g_funcs->create_promise(env, deferred, promise);
+    if (PY_FUNC(create_promise)) return g_funcs->create_promise(env, deferred, promise);
     return napi_generic_failure;
 }
 
 napi_status napi_resolve_deferred(napi_env env, napi_deferred deferred, napi_value resolution) {
     CHECK_FUNCS();
-    if (g_funcs->resolve_deferred) return g_funcs->resolve_deferred(env, deferred, resolution);
+    if (PY_FUNC(resolve_deferred)) return g_funcs->resolve_deferred(env, deferred, resolution);
     return napi_generic_failure;
 }
 
 napi_status napi_reject_deferred(napi_env env, napi_deferred deferred, napi_value rejection) {
     CHECK_FUNCS();
-    if (g_funcs->reject_deferred) return g_funcs->reject_deferred(env, deferred, rejection);
+    if (PY_FUNC(reject_deferred)) return g_funcs->reject_deferred(env, deferred, rejection);
     return napi_generic_failure;
 }
 
 napi_status napi_is_promise(napi_env env, napi_value value, bool* is_promise) {
     CHECK_FUNCS();
-    if (g_funcs->is_promise) return g_funcs->is_promise(env, value, is_promise);
+    // Numbers and the constant handles are never promises
+    if (is_promise && (IS_SMI_HANDLE(value) || IS_DOUBLE_HANDLE(value) || IS_CONSTANT_HANDLE(value))) {
+        *is_promise = false;
+        return napi_ok;
+    }
+    if (PY_FUNC(is_promise)) return g_funcs->is_promise(env, value, is_promise);
     if (is_promise) *is_promise = false;
     return napi_ok;
 }
@@ -579,7 +686,7 @@ napi_status napi_remove_env_cleanup_hook(napi_env env, void (*fun)(void* arg), v
 
 napi_status napi_create_array_with_length(napi_env env, size_t length, napi_value* result) {
     CHECK_FUNCS();
-    if (g_funcs->create_array) {
+    if (PY_FUNC(create_array)) {
         napi_status status = g_funcs->create_array(env, result);
         // TODO: Set array length properly
         return status;
@@ -589,7 +696,7 @@ napi_status napi_create_array_with_length(napi_env env, size_t length, napi_valu
 
 napi_status napi_wrap(napi_env env, napi_value js_object, void* native_object, napi_finalize finalize_cb, void* finalize_hint, napi_ref* result) {
     CHECK_FUNCS();
-    if (g_funcs->wrap) {
+    if (PY_FUNC(wrap)) {
         napi_status status = g_funcs->wrap(env, js_object, native_object, finalize_cb, finalize_hint, result);
         return status;
     }
@@ -599,7 +706,7 @@ napi_status napi_wrap(napi_env env, napi_value js_object, void* native_object, n
 
 napi_status napi_unwrap(napi_env env, napi_value js_object, void** result) {
     CHECK_FUNCS();
-    if (g_funcs->unwrap) {
+    if (PY_FUNC(unwrap)) {
         napi_status status = g_funcs->unwrap(env, js_object, result);
         return status;
     }
@@ -610,7 +717,7 @@ napi_status napi_unwrap(napi_env env, napi_value js_object, void** result) {
 napi_status napi_remove_wrap(napi_env env, napi_value js_object, void** result) {
     // For now, just call unwrap
     CHECK_FUNCS();
-    if (g_funcs->unwrap) {
+    if (PY_FUNC(unwrap)) {
         return g_funcs->unwrap(env, js_object, result);
     }
     if (result) *result = NULL;
@@ -633,7 +740,7 @@ napi_status napi_create_threadsafe_function(
     napi_threadsafe_function* result
 ) {
     CHECK_FUNCS();
-    if (g_funcs->create_tsfn) {
+    if (PY_FUNC(create_tsfn)) {
         return g_funcs->create_tsfn(env, func, async_resource, async_resource_name,
             max_queue_size, initial_thread_count, thread_finalize_data, thread_finalize_cb,
             context, (void*)call_js_cb, (void**)result);
@@ -652,7 +759,7 @@ napi_status napi_ref_threadsafe_function(napi_env env, napi_threadsafe_function
 
 napi_status napi_acquire_threadsafe_function(napi_threadsafe_function func) {
     CHECK_FUNCS();
-    if (g_funcs->acquire_tsfn) {
+    if (PY_FUNC(acquire_tsfn)) {
         return g_funcs->acquire_tsfn((void*)func);
     }
     return napi_ok;
@@ -660,7 +767,7 @@ napi_status napi_acquire_threadsafe_function(napi_threadsafe_function func) {
 
 napi_status napi_release_threadsafe_function(napi_threadsafe_function func, int mode) {
     CHECK_FUNCS();
-    if (g_funcs->release_tsfn) {
+    if (PY_FUNC(release_tsfn)) {
         return g_funcs->release_tsfn((void*)func, mode);
     }
     return napi_ok;
@@ -668,7 +775,7 @@ napi_status napi_release_threadsafe_function(napi_threadsafe_function func, int
 
 napi_status napi_call_threadsafe_function(napi_threadsafe_function func, void* data, int is_blocking) {
     CHECK_FUNCS();
-    if (g_funcs->call_tsfn) {
+    if (PY_FUNC(call_tsfn)) {
         return g_funcs->call_tsfn((void*)func, data, is_blocking);
     }
     return napi_ok;
@@ -705,14 +812,22 @@ napi_status napi_delete_element(napi_env env, napi_value object, uint32_t index,
 }
 
 napi_status napi_strict_equals(napi_env env, napi_value lhs, napi_value rhs, bool* result) {
+    CHECK_FUNCS();
+    if (result && IS_SMI_HANDLE(lhs) && IS_SMI_HANDLE(rhs)) {
+        *result = (lhs == rhs);
+        return napi_ok;
+    }
+    if (result && IS_CONSTANT_HANDLE(lhs) && IS_CONSTANT_HANDLE(rhs)) {
+        *result = (lhs == rhs);
+        return napi_ok;
+    }
+    if (PY_FUNC(strict_equals)) return g_funcs->strict_equals(env, lhs, rhs, result);
     if (result) *result = (lhs == rhs);
     return napi_ok;
 }
 
 napi_status napi_get_prototype(napi_env env, napi_value object, napi_value* result) {
-    CHECK_FUNCS();
-    if (g_funcs->get_undefined) return g_funcs->get_undefined(env, result);
-    return napi_generic_failure;
+    return napi_get_undefined(env, result);
 }
 
 napi_status napi_define_properties(napi_env env, napi_value object, size_t property_count, const napi_property_descriptor* properties) {
@@ -722,13 +837,13 @@ napi_status napi_define_properties(napi_env env, napi_value object, size_t prope
 
 napi_status napi_set_instance_data(napi_env env, void* data, napi_finalize finalize_cb, void* finalize_hint) {
     CHECK_FUNCS();
-    if (g_funcs->set_instance_data) return g_funcs->set_instance_data(env, data, finalize_cb, finalize_hint);
+    if (PY_FUNC(set_instance_data)) return g_funcs->set_instance_data(env, data, finalize_cb, finalize_hint);
     return napi_ok;
 }
 
 napi_status napi_get_instance_data(napi_env env, void** data) {
     CHECK_FUNCS();
-    if (g_funcs->get_instance_data) return g_funcs->get_instance_data(env, data);
+    if (PY_FUNC(get_instance_data)) return g_funcs->get_instance_data(env, data);
     if (data) *data = NULL;
     return napi_ok;
 }
@@ -747,32 +862,32 @@ napi_status napi_object_seal(napi_env env, napi_value object) {
 
 napi_status napi_create_arraybuffer(napi_env env, size_t byte_length, void** data, napi_value* result) {
     CHECK_FUNCS();
-    if (g_funcs->create_arraybuffer) return g_funcs->create_arraybuffer(env, byte_length, data, result);
+    if (PY_FUNC(create_arraybuffer)) return g_funcs->create_arraybuffer(env, byte_length, data, result);
     return napi_generic_failure;
 }
 
 napi_status napi_get_arraybuffer_info(napi_env env, napi_value arraybuffer, void** data, size_t* byte_length) {
     CHECK_FUNCS();
-    if (g_funcs->get_arraybuffer_info) return g_funcs->get_arraybuffer_info(env, arraybuffer, data, byte_length);
+    if (PY_FUNC(get_arraybuffer_info)) return g_funcs->get_arraybuffer_info(env, arraybuffer, data, byte_length);
     return napi_generic_failure;
 }
 
 napi_status napi_is_detached_arraybuffer(napi_env env, napi_value arraybuffer, bool* result) {
     CHECK_FUNCS();
-    if (g_funcs->is_detached_arraybuffer) return g_funcs->is_detached_arraybuffer(env, arraybuffer, result);
+    if (PY_FUNC(is_detached_arraybuffer)) return g_funcs->is_detached_arraybuffer(env, arraybuffer, result);
     if (result) *result = false;
     return napi_ok;
 }
 
 napi_status napi_detach_arraybuffer(napi_env env, napi_value arraybuffer) {
     CHECK_FUNCS();
-    if (g_funcs->detach_arraybuffer) return g_funcs->detach_arraybuffer(env, arraybuffer);
+    if (PY_FUNC(detach_arraybuffer)) return g_funcs->detach_arraybuffer(env, arraybuffer);
     return napi_generic_failure;
 }
 
 napi_status napi_is_arraybuffer(napi_env env, napi_value value, bool* result) {
     CHECK_FUNCS();
-    if (g_funcs->is_arraybuffer) return g_funcs->is_arraybuffer(env, value, result);
+    if (PY_FUNC(is_arraybuffer)) return g_funcs->is_arraybuffer(env, value, result);
     if (result) *result = false;
     return napi_ok;
 }
@@ -781,7 +896,7 @@ napi_status napi_create_external_arraybuffer(napi_env env, void* external_data,
     // For now, create a regular arraybuffer and copy the data
     // TODO: Implement proper external arraybuffer with finalize callback
     CHECK_FUNCS();
-    if (g_funcs->create_arraybuffer) {
+    if (PY_FUNC(create_arraybuffer)) {
         void* data = NULL;
         napi_status status = g_funcs->create_arraybuffer(env, byte_length, &data, result);
         if (status == napi_ok && data && external_data && byte_length > 0) {
@@ -801,7 +916,7 @@ napi_status napi_create_external_arraybuffer(napi_env env, void* external_data,
 
 napi_status napi_create_typedarray(napi_env env, napi_typedarray_type type, size_t length, napi_value arraybuffer, size_t byte_offset, napi_value* result) {
     CHECK_FUNCS();
-    if (g_funcs->create_typedarray) return g_funcs->create_typedarray(env, type, length, arraybuffer, byte_offset, result);
+    if (PY_FUNC(create_typedarray)) return g_funcs->create_typedarray(env, type, length, arraybuffer, byte_offset, result);
     return napi_generic_failure;
 }
 
@@ -811,19 +926,19 @@ napi_status napi_create_typedarray(napi_env env, napi_typedarray_type type, size
 
 napi_status napi_create_dataview(napi_env env, size_t byte_length, napi_value arraybuffer, size_t byte_offset, napi_value* result) {
     CHECK_FUNCS();
-    if (g_funcs->create_dataview) return g_funcs->create_dataview(env, byte_length, arraybuffer, byte_offset, result);
+    if (PY_FUNC(create_dataview)) return g_funcs->create_dataview(env, byte_length, arraybuffer, byte_offset, result);
     return napi_generic_failure;
 }
 
 napi_status napi_get_dataview_info(napi_env env, napi_value dataview, size_t* byte_length, void** data, napi_value* arraybuffer, size_t* byte_offset) {
     CHECK_FUNCS();
-    if (g_funcs->get_dataview_info) return g_funcs->get_dataview_info(env, dataview, byte_length, data, arraybuffer, byte_offset);
+    if (PY_FUNC(get_dataview_info)) return g_funcs->get_dataview_info(env, dataview, byte_length, data, arraybuffer, byte_offset);
     return napi_generic_failure;
 }
 
 napi_status napi_is_dataview(napi_env env, napi_value value, bool* result) {
     CHECK_FUNCS();
-    if (g_funcs->is_dataview) return g_funcs->is_dataview(env, value, result);
+    if (PY_FUNC(is_dataview)) return g_funcs->is_dataview(env, value, result);
     if (result) *result = false;
     return napi_ok;
 }
@@ -834,25 +949,25 @@ napi_status napi_is_dataview(napi_env env, napi_value value, bool* result) {
 
 napi_status napi_create_buffer(napi_env env, size_t size, void** data, napi_value* result) {
     CHECK_FUNCS();
-    if (g_funcs->create_buffer) return g_funcs->create_buffer(env, size, data, result);
+    if (PY_FUNC(create_buffer)) return g_funcs->create_buffer(env, size, data, result);
     return napi_generic_failure;
 }
 
 napi_status napi_create_buffer_copy(napi_env env, size_t length, const void* data, void** result_data, napi_value* result) {
     CHECK_FUNCS();
-    if (g_funcs->create_buffer_copy) return g_funcs->create_buffer_copy(env, length, data, result_data, result);
+    if (PY_FUNC(create_buffer_copy)) return g_funcs->create_buffer_copy(env, length, data, result_data, result);
     return napi_generic_failure;
 }
 
 napi_status napi_get_buffer_info(napi_env env, napi_value buffer, void** data, size_t* length) {
     CHECK_FUNCS();
-    if (g_funcs->get_buffer_info) return g_funcs->get_buffer_info(env, buffer, data, length);
+    if (PY_FUNC(get_buffer_info)) return g_funcs->get_buffer_info(env, buffer, data, length);
     return napi_generic_failure;
 }
 
 napi_status napi_is_buffer(napi_env env, napi_value value, bool* result) {
     CHECK_FUNCS();
-    if (g_funcs->is_buffer) return g_funcs->is_buffer(env, value, result);
+    if (PY_FUNC(is_buffer)) return g_funcs->is_buffer(env, value, result);
     if (result) *result = false;
     return napi_ok;
 }
@@ -860,7 +975,7 @@ napi_status napi_is_buffer(napi_env env, napi_value value, bool* result) {
 napi_status napi_create_external_buffer(napi_env env, size_t length, void* data, napi_finalize finalize_cb, void* finalize_hint, napi_value* result) {
     // For now, create a buffer copy
     CHECK_FUNCS();
-    if (g_funcs->create_buffer_copy) {
+    if (PY_FUNC(create_buffer_copy)) {
         return g_funcs->create_buffer_copy(env, length, data, NULL, result);
     }
     return napi_generic_failure;
@@ -878,13 +993,13 @@ napi_status napi_adjust_external_memory(napi_env env, int64_t change_in_bytes, i
 
 napi_status napi_create_external(napi_env env, void* data, napi_finalize finalize_cb, void* finalize_hint, napi_value* result) {
     CHECK_FUNCS();
-    if (g_funcs->create_external) return g_funcs->create_external(env, data, finalize_cb, finalize_hint, result);
+    if (PY_FUNC(create_external)) return g_funcs->create_external(env, data, finalize_cb, finalize_hint, result);
     return napi_generic_failure;
 }
 
 napi_status napi_get_value_external(napi_env env, napi_value value, void** result) {
     CHECK_FUNCS();
-    if (g_funcs->get_value_external) return g_funcs->get_value_external(env, value, result);
+    if (PY_FUNC(get_value_external)) return g_funcs->get_value_external(env, value, result);
     return napi_generic_failure;
 }
 
@@ -894,25 +1009,25 @@ napi_status napi_get_value_external(napi_env env, napi_value value, void** resul
 
 napi_status napi_throw_type_error(napi_env env, const char* code, const char* msg) {
     CHECK_FUNCS();
-    if (g_funcs->throw_type_error) return g_funcs->throw_type_error(env, code, msg);
+    if (PY_FUNC(throw_type_error)) return g_funcs->throw_type_error(env, code, msg);
     return napi_generic_failure;
 }
 
 napi_status napi_throw_range_error(napi_env env, const char* code, const char* msg) {
     CHECK_FUNCS();
-    if (g_funcs->throw_range_error) return g_funcs->throw_range_error(env, code, msg);
+    if (PY_FUNC(throw_range_error)) return g_funcs->throw_range_error(env, code, msg);
     return napi_generic_failure;
 }
 
 napi_status napi_create_type_error(napi_env env, napi_value code, napi_value msg, napi_value* result) {
     CHECK_FUNCS();
-    if (g_funcs->create_type_error) return g_funcs->create_type_error(env, code, msg, result);
+    if (PY_FUNC(create_type_error)) return g_funcs->create_type_error(env, code, msg, result);
     return napi_generic_failure;
 }
 
 napi_status napi_create_range_error(napi_env env, napi_value code, napi_value msg, napi_value* result) {
     CHECK_FUNCS();
-    if (g_funcs->create_range_error) return g_funcs->create_range_error(env, code, msg, result);
+    if (PY_FUNC(create_range_error)) return g_funcs->create_range_error(env, code, msg, result);
     return napi_generic_failure;
 }
 
@@ -922,27 +1037,27 @@ napi_status napi_create_range_error(napi_env env, napi_value code, napi_value ms
 
 napi_status napi_new_instance(napi_env env, napi_value constructor, size_t argc, const napi_value* argv, napi_value* result) {
     CHECK_FUNCS();
-    if (g_funcs->new_instance) return g_funcs->new_instance(env, constructor, argc, argv, result);
+    if (PY_FUNC(new_instance)) return g_funcs->new_instance(env, constructor, argc, argv, result);
     return napi_generic_failure;
 }
 
 napi_status napi_fatal_exception(napi_env env, napi_value err) {
     CHECK_FUNCS();
-    if (g_funcs->fatal_exception) return g_funcs->fatal_exception(env, err);
+    if (PY_FUNC(fatal_exception)) return g_funcs->fatal_exception(env, err);
     // Non-fatal fallback - just log and continue
     return napi_ok;
 }
 
 napi_status napi_get_new_target(napi_env env, napi_callback_info cbinfo, napi_value* result) {
     CHECK_FUNCS();
-    if (g_funcs->get_new_target) return g_funcs->get_new_target(env, cbinfo, result);
+    if (PY_FUNC(get_new_target)) return g_funcs->get_new_target(env, cbinfo, result);
     if (result) *result = NULL;
     return napi_ok;
 }
 
 napi_status napi_has_own_property(napi_env env, napi_value object, napi_value key, bool* result) {
     CHECK_FUNCS();
-    if (g_funcs->has_own_property) return g_funcs->has_own_property(env, object, key, result);
+    if (PY_FUNC(has_own_property)) return g_funcs->has_own_property(env, object, key, result);
     if (result) *result = false;
     return napi_ok;
 }
@@ -968,17 +1083,17 @@ typedef enum {
 
 napi_status napi_get_all_property_names(napi_env env, napi_value object, napi_key_collection_mode key_mode, napi_key_filter key_filter, napi_key_conversion key_conversion, napi_value* result) {
     CHECK_FUNCS();
-    if (g_funcs->get_all_property_names) return g_funcs->get_all_property_names(env, object, key_mode, key_filter, key_conversion, result);
+    if (PY_FUNC(get_all_property_names)) return g_funcs->get_all_property_names(env, object, key_mode, key_filter, key_conversion, result);
     // Return empty array as fallback
-    if (g_funcs->create_array) return g_funcs->create_array(env, result);
+    if (PY_FUNC(create_array)) return g_funcs->create_array(env, result);
     return napi_generic_failure;
 }
 
 napi_status napi_get_property_names(napi_env env, napi_value object, napi_value* result) {
     CHECK_FUNCS();
-    if (g_funcs->get_property_names) return g_funcs->get_property_names(env, object, result);
+    if (PY_FUNC(get_property_names)) return g_funcs->get_property_names(env, object, result);
     // Return empty array as fallback
-    if (g_funcs->create_array) return g_funcs->create_array(env, result);
+    if (PY_FUNC(create_array)) return g_funcs->create_array(env, result);
     return napi_generic_failure;
 }
 
@@ -996,17 +1111,13 @@ napi_status napi_instanceof(napi_env env, napi_value object, napi_value construc
 }
 
 napi_status napi_coerce_to_bool(napi_env env, napi_value value, napi_value* result) {
-    CHECK_FUNCS();
-    if (g_funcs->get_boolean) {
-        // Get the value and convert to bool
-        return g_funcs->get_boolean(env, true, result);
-    }
-    return napi_generic_failure;
+    // Get the value and convert to bool
+    return napi_get_boolean(env, true, result);
 }
 
 napi_status napi_coerce_to_number(napi_env env, napi_value value, napi_value* result) {
     CHECK_FUNCS();
-    if (g_funcs->create_double) {
+    if (PY_FUNC(create_double)) {
         return g_funcs->create_double(env, 0.0, result);
     }
     return napi_generic_failure;
@@ -1014,7 +1125,7 @@ napi_status napi_coerce_to_number(napi_env env, napi_value value, napi_value* re
 
 napi_status napi_coerce_to_object(napi_env env, napi_value value, napi_value* result) {
     CHECK_FUNCS();
-    if (g_funcs->create_object) {
+    if (PY_FUNC(create_object)) {
         return g_funcs->create_object(env, result);
     }
     return napi_generic_failure;
@@ -1041,14 +1152,14 @@ napi_status napi_escape_handle(napi_env env, napi_escapable_handle_scope scope,
 napi_status napi_create_bigint_int64(napi_env env, int64_t value, napi_value* result) {
     CHECK_FUNCS();
     // Use int64 instead
-    if (g_funcs->create_int64) return g_funcs->create_int64(env, value, result);
+    if (PY_FUNC(create_int64)) return g_funcs->create_int64(env, value, result);
     return napi_generic_failure;
 }
 
 napi_status napi_create_bigint_uint64(napi_env env, uint64_t value, napi_value* result) {
     CHECK_FUNCS();
     // Use int64 instead
-    if (g_funcs->create_int64) return g_funcs->create_int64(env, (int64_t)value, result);
+    if (PY_FUNC(create_int64)) return g_funcs->create_int64(env, (int64_t)value, result);
     return napi_generic_failure;
 }
 
@@ -1058,7 +1169,7 @@ napi_status napi_create_bigint_words(napi_env env, int sign_bit, size_t word_cou
 
 napi_status napi_get_value_bigint_int64(napi_env env, napi_value value, int64_t* result, bool* lossless) {
     CHECK_FUNCS();
-    if (g_funcs->get_value_int64) {
+    if (PY_FUNC(get_value_int64)) {
         if (lossless) *lossless = true;
         return g_funcs->get_value_int64(env, value, result);
     }
@@ -1067,7 +1178,7 @@ napi_status napi_get_value_bigint_int64(napi_env env, napi_value value, int64_t*
 
 napi_status napi_get_value_bigint_uint64(napi_env env, napi_value value, uint64_t* result, bool* lossless) {
     CHECK_FUNCS();
-    if (g_funcs->get_value_int64) {
+    if (PY_FUNC(get_value_int64)) {
         int64_t val;
         napi_status status = g_funcs->get_value_int64(env, value, &val);
         if (status == napi_ok && result) *result = (uint64_t)val;
@@ -1085,14 +1196,14 @@ napi_status napi_get_value_bigint_words(napi_env env, napi_value value, int* sig
 napi_status napi_create_symbol(napi_env env, napi_value description, napi_value* result) {
     CHECK_FUNCS();
     // Create a unique object to serve as a symbol
-    if (g_funcs->create_object) return g_funcs->create_object(env, result);
+    if (PY_FUNC(create_object)) return g_funcs->create_object(env, result);
     return napi_generic_failure;
 }
 
 // Date functions
 napi_status napi_create_date(napi_env env, double time, napi_value* result) {
     CHECK_FUNCS();
-    if (g_funcs->create_double) return g_funcs->create_double(env, time, result);
+    if (PY_FUNC(create_double)) return g_funcs->create_double(env, time, result);
     return napi_generic_failure;
 }
 
@@ -1103,7 +1214,7 @@ napi_status napi_is_date(napi_env env, napi_value value, bool* result) {
 
 napi_status napi_get_date_value(napi_env env, napi_value value, double* result) {
     CHECK_FUNCS();
-    if (g_funcs->get_value_double) return g_funcs->get_value_double(env, value, result);
+    if (PY_FUNC(get_value_double)) return g_funcs->get_value_double(env, value, result);
     return napi_generic_failure;
 }
 
@@ -1111,7 +1222,7 @@ napi_status napi_get_date_value(napi_env env, napi_value value, double* result)
 napi_status napi_create_string_utf16(napi_env env, const uint16_t* str, size_t length, napi_value* result) {
     // Convert UTF-16 to UTF-8 for now (simplified)
     CHECK_FUNCS();
-    if (g_funcs->create_string_utf8) return g_funcs->create_string_utf8(env, "", 0, result);
+    if (PY_FUNC(create_string_utf8)) return g_funcs->create_string_utf8(env, "", 0, result);
     return napi_generic_failure;
 }
 
@@ -1122,13 +1233,13 @@ napi_status napi_get_value_string_utf16(napi_env env, napi_value value, uint16_t
 
 napi_status napi_create_string_latin1(napi_env env, const char* str, size_t length, napi_value* result) {
     CHECK_FUNCS();
-    if (g_funcs->create_string_utf8) return g_funcs->create_string_utf8(env, str, length, result);
+    if (PY_FUNC(create_string_utf8)) return g_funcs->create_string_utf8(env, str, length, result);
     return napi_generic_failure;
 }
 
 napi_status napi_get_value_string_latin1(napi_env env, napi_value value, char* buf, size_t bufsize, size_t* result) {
     CHECK_FUNCS();
-    if (g_funcs->get_value_string_utf8) return g_funcs->get_value_string_utf8(env, value, buf, bufsize, result);
+    if (PY_FUNC(get_value_string_utf8)) return g_funcs->get_value_string_utf8(env, value, buf, bufsize, result);
     return napi_generic_failure;
 }
 
@@ -1140,7 +1251,7 @@ napi_status napi_add_finalizer(napi_env env, napi_value js_object, void* finaliz
     // TODO: Implement proper finalizer support
     // For now, just create a reference if result is requested
     CHECK_FUNCS();
-    if (result && g_funcs->create_reference) {
+    if (result && PY_FUNC(create_reference)) {
         return g_funcs->create_reference(env, js_object, 0, result);
     }
     if (result) *result = NULL;
@@ -1167,7 +1278,7 @@ napi_status napi_async_destroy(napi_env env, napi_async_context async_context) {
 napi_status napi_make_callback(napi_env env, napi_async_context async_context, napi_value recv, napi_value func, size_t argc, const napi_value* argv, napi_value* result) {
     // Just call the function directly
     CHECK_FUNCS();
-    if (g_funcs->call_function) return g_funcs->call_function(env, recv, func, argc, argv, result);
+    if (PY_FUNC(call_function)) return g_funcs->call_function(env, recv, func, argc, argv, result);
     return napi_generic_failure;
 }
 
@@ -8,7 +8,7 @@ from .scope_store import ScopeStore
 from .store import ArrayStore, BaseArrayStore
 from .ref_tracker import RefTracker
 from .reference import Reference, ReferenceWithData, ReferenceWithFinalizer, ReferenceOwnership
-from .external import External, is_external, get_external_value
+from .external import External, PointerArray, is_external, get_external_value
 from .disposable import Disposable
 
 __all__ = [
@@ -29,6 +29,7 @@ __all__ = [
     "ReferenceWithFinalizer",
     "ReferenceOwnership",
     "External",
+    "PointerArray",
     "is_external",
     "get_external_value",
     "Disposable",
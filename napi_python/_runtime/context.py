@@ -4,11 +4,12 @@ Global context for the NAPI runtime.
 Reference: https://github.com/toyobayashi/emnapi/blob/main/packages/runtime/src/Context.ts
 """
 
-from typing import Optional, Dict, Any, Callable, List
+from typing import Optional, Dict, Any, Callable, Iterable, List, Sequence, Union
 import asyncio
+import ctypes
 
 from .store import ArrayStore
-from .handle import HandleStore
+from .handle import HandleStore, Undefined, SMI_MIN, SMI_MAX, smi_handle
 from .handle_scope import HandleScope, CallbackInfo
 from .scope_store import ScopeStore
 from .env import Env
@@ -108,8 +109,17 @@ class Context:
         self._next_ref_id = 1
         self._next_deferred_id = 1
 
-        # Callback storage to prevent GC
-        self._callback_refs: List[Any] = []
+        # Callback storage to prevent GC, keyed by id() of the callback
+        self._callback_refs: Dict[int, Any] = {}
+
+        # Native buffers backing bytes-like values handed to addons, keyed by
+        # id() of the value, which is kept alive alongside. An entry lives
+        # while the scope that created it is open or a reference holds the
+        # value; entries are [value, buffer, owned by an open scope]
+        self._buffer_views: Dict[int, List[Any]] = {}
+        # Live references to each bytes-like value, by id(), as
+        # [value, count]; holding the value keeps its id() from being reused
+        self._buffer_refs: Dict[int, List[Any]] = {}
 
     def create_env(
         self,
@@ -149,6 +159,9 @@ class Context:
 
     def close_scope(self, env: Env, scope: Optional[HandleScope] = None) -> None:
         """Close the current handle scope."""
+        buffer_keys = self._scope_store.current_scope.buffer_keys
+        if buffer_keys:
+            self._release_buffers(buffer_keys)
         self._scope_store.close_scope()
         env.open_handle_scopes -= 1
 
@@ -169,27 +182,32 @@ class Context:
 
     # Value operations
 
-    def napi_value_from_python(self, value: Any) -> int:
-        """Convert Python value to napi_value handle."""
-        # Check for constants
+    def _constant_handle(self, value: Any) -> int:
+        """
+        Get the handle for a value that needs no slot in the handle store:
+        a reserved constant or a small integer. Returns 0 otherwise.
+        """
         if value is None:
             return Constant.NULL
         if value is False:
             return Constant.FALSE
         if value is True:
             return Constant.TRUE
+        if type(value) is int and SMI_MIN <= value <= SMI_MAX:
+            return smi_handle(value)
         if value == "":
             return Constant.EMPTY_STRING
-
-        # Check for undefined
-        from .handle import Undefined
-
         if value is Undefined:
             return Constant.UNDEFINED
-
-        # Check for global
         if isinstance(value, dict) and value is self._handle_store.get(Constant.GLOBAL):
             return Constant.GLOBAL
+        return 0
+
+    def napi_value_from_python(self, value: Any) -> int:
+        """Convert Python value to napi_value handle."""
+        handle = self._constant_handle(value)
+        if handle:
+            return handle
 
         # Add to current scope
         return self._scope_store.current_scope.add(value)
@@ -202,6 +220,26 @@ class Context:
         """Add value to current scope (alias for napi_value_from_python)."""
         return self.napi_value_from_python(value)
 
+    def add_values(self, values: Sequence[Any]) -> List[int]:
+        """
+        Convert several Python values to napi_value handles at once.
+
+        Values without a reserved constant handle are added to the current
+        scope as one contiguous block.
+        """
+        constant_handle = self._constant_handle
+        handles = [constant_handle(value) for value in values]
+        fresh = [value for value, handle in zip(values, handles) if not handle]
+        if fresh:
+            ids = iter(self._scope_store.current_scope.add_many(fresh))
+            handles = [handle or next(ids) for handle in handles]
+        return handles
+
+    def python_values_from_napi(self, handles: Iterable[int]) -> List[Any]:
+        """Convert several napi_value handles to Python values."""
+        get = self._handle_store.get
+        return [get(handle) for handle in handles]
+
     # External values
 
     def create_external(self, data: int) -> External:
@@ -216,6 +254,77 @@ class Context:
         """Check if value is an external."""
         return is_external(value)
 
+    def get_buffer_address(self, value: Union[bytes, bytearray, memoryview]) -> int:
+        """
+        Get a stable native address for the contents of a bytes-like value.
+
+        bytes and read-only memoryviews are copied, since addons may write
+        through the pointer; bytearrays and writable memoryviews are exposed
+        in place. The buffer is reused for later calls with the same object
+        and released when the scope that created it closes, unless a
+        reference still holds the value; then it lasts until the last such
+        reference is deleted. Releasing it frees the copy, or the export
+        that stops a bytearray from resizing.
+
+        Raises ValueError for a non-contiguous memoryview.
+        """
+        key = id(value)
+        entry = self._buffer_views.get(key)
+        if entry is None:
+            if isinstance(value, bytes):
+                buf = ctypes.create_string_buffer(value, len(value))
+            else:
+                view = memoryview(value)
+                if not view.c_contiguous:
+                    raise ValueError("buffer is not contiguous")
+                if view.readonly:
+                    buf = (ctypes.c_uint8 * view.nbytes).from_buffer_copy(view)
+                else:
+                    buf = (ctypes.c_uint8 * view.nbytes).from_buffer(view)
+            entry = self._buffer_views[key] = [value, buf, True]
+            self._scope_store.current_scope.buffer_keys.append(key)
+        return ctypes.addressof(entry[1])
+
+    def _release_buffers(self, keys: List[int]) -> None:
+        """Drop the buffers created in a closing scope that no reference holds."""
+        views = self._buffer_views
+        refs = self._buffer_refs
+        for key in keys:
+            if key in refs:
+                entry = views.get(key)
+                if entry is not None:
+                    entry[2] = False
+            else:
+                views.pop(key, None)
+        keys.clear()
+
+    def pin_buffer(self, value: Any) -> int:
+        """
+        Keep the native buffer of a bytes-like value alive for a reference.
+
+        Returns the key to pass to unpin_buffer().
+        """
+        key = id(value)
+        pin = self._buffer_refs.get(key)
+        if pin is None:
+            self._buffer_refs[key] = [value, 1]
+        else:
+            pin[1] += 1
+        return key
+
+    def unpin_buffer(self, key: int) -> None:
+        """Release a reference's hold on a native buffer."""
+        pin = self._buffer_refs.get(key)
+        if pin is None:
+            return
+        pin[1] -= 1
+        if pin[1] > 0:
+            return
+        del self._buffer_refs[key]
+        entry = self._buffer_views.get(key)
+        if entry is not None and not entry[2]:
+            del self._buffer_views[key]
+
     # Reference management
 
     def store_ref(self, ref: Any) -> int:
@@ -289,12 +398,11 @@ class Context:
 
     def add_callback_ref(self, callback: Any) -> None:
         """Add a callback reference to prevent GC."""
-        self._callback_refs.append(callback)
+        self._callback_refs[id(callback)] = callback
 
     def remove_callback_ref(self, callback: Any) -> None:
         """Remove a callback reference."""
-        if callback in self._callback_refs:
-            self._callback_refs.remove(callback)
+        self._callback_refs.pop(id(callback), None)
 
 
 # Global default context
@@ -6,6 +6,7 @@ Reference: https://github.com/toyobayashi/emnapi/blob/main/packages/runtime/src/
 
 from typing import Optional, Any, Callable, Dict, TYPE_CHECKING
 from dataclasses import dataclass, field
+import asyncio
 import weakref
 
 from .disposable import Disposable
@@ -75,6 +76,12 @@ class Env(Disposable):
         # GC finalizer state
         self.in_gc_finalizer: bool = False
 
+        # Threadsafe function delivery: max queued calls drained per loop wakeup
+        self.callback_batch_size: int = 256
+
+        # Event loop promises and TSFNs deliver on when none is running
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+
         # Destruction state
         self.destructing: bool = False
         self.finalization_scheduled: bool = False
@@ -97,6 +104,29 @@ class Env(Disposable):
         if self.refs == 0:
             self.dispose()
 
+    def get_event_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Get the event loop for promises and threadsafe functions.
+
+        A running loop always wins. Otherwise the loop resolved on first use
+        is cached, so later calls skip asyncio's deprecated lookup and the
+        RuntimeError it raises when the thread has no loop.
+        """
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            pass  # No running loop on this thread
+        loop = self.loop
+        if loop is None or loop.is_closed():
+            try:
+                loop = asyncio.get_event_loop()
+            except RuntimeError:
+                # No event loop, create one
+                loop = asyncio.new_event_loop()
+                asyncio.set_event_loop(loop)
+            self.loop = loop
+        return loop
+
     def clear_last_error(self) -> napi_status:
         """Clear the last error."""
         if self.last_error.error_code != napi_status.napi_ok:
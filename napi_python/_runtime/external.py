@@ -4,7 +4,8 @@ External value wrapper for opaque native pointers.
 Reference: https://github.com/toyobayashi/emnapi/blob/main/packages/runtime/src/External.ts
 """
 
-from typing import Any
+from array import array
+from typing import Any, Iterable, Iterator, Union
 import weakref
 
 
@@ -48,3 +49,66 @@ def get_external_value(external: External) -> int:
     if not is_external(external):
         raise TypeError("not external")
     return _external_values[external]
+
+
+class PointerArray:
+    """
+    Compact collection of native pointers.
+
+    Stores raw addresses in an ``array('Q')`` instead of keeping one
+    External wrapper alive per pointer; External objects are only
+    materialized on indexed access or iteration. Pass ``append`` as a
+    threadsafe function callback to collect pointers without allocating
+    a wrapper per call.
+    """
+
+    __slots__ = ("_pointers", "_length")
+
+    def __init__(self, values: Iterable[Union[External, int]] = ()):
+        self._pointers = array("Q")
+        self._length = 0
+        for value in values:
+            self.append(value)
+
+    def reserve(self, capacity: int) -> None:
+        """
+        Preallocate storage for at least capacity pointers.
+
+        Appends up to that size then fill the reserved slots in place
+        instead of repeatedly growing the underlying array.
+        """
+        missing = capacity - len(self._pointers)
+        if missing > 0:
+            self._pointers.frombytes(bytes(missing * self._pointers.itemsize))
+
+    def append(self, value: Union[External, int, None]) -> None:
+        """Append an External or a raw address (None is stored as NULL)."""
+        if isinstance(value, External):
+            value = get_external_value(value)
+        index = self._length
+        if index < len(self._pointers):
+            self._pointers[index] = value or 0
+        else:
+            self._pointers.append(value or 0)
+        self._length = index + 1
+
+    def address(self, index: int) -> int:
+        """Get the raw address at index without creating an External."""
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("PointerArray index out of range")
+        return self._pointers[index]
+
+    def __getitem__(self, index: int) -> External:
+        return External(self.address(index))
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[External]:
+        for address in self._pointers[: self._length]:
+            yield External(address)
+
+    def __repr__(self) -> str:
+        return f"PointerArray(length={self._length})"
@@ -4,7 +4,7 @@ Handle store for mapping integer IDs to Python values.
 Reference: https://github.com/toyobayashi/emnapi/blob/main/packages/runtime/src/Handle.ts
 """
 
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, List
 import weakref
 
 from .store import BaseArrayStore, CountIdAllocator
@@ -12,15 +12,33 @@ from .disposable import Disposable
 from .._napi.types import Constant
 
 
+# Integers in [SMI_MIN, SMI_MAX] are encoded in the handle itself instead of
+# taking a slot in the store, like V8's Smis: SMI_TAG | (value + SMI_BIAS).
+# The shim produces and reads the same encoding, so keep napi_shim.c in sync
+SMI_TAG = 1 << 62
+SMI_BIAS = 1 << 39
+SMI_MIN = -SMI_BIAS
+SMI_MAX = SMI_BIAS - 1
+
+
+def smi_handle(value: int) -> int:
+    """Encode a small integer as a handle."""
+    return SMI_TAG | (value + SMI_BIAS)
+
+
 class HandleStore(BaseArrayStore):
     """
     Maps integer IDs to Python values.
 
     Constants 0-7 are reserved for special values (undefined, null, true, false, etc.)
-    Regular handles start from MIN_ID (8).
+    and 8-10 hold the doubles 0.0, 1.0 and NaN, which addons create constantly.
+    Regular handles start from MIN_ID (11).
     """
 
-    MIN_ID = 8
+    ZERO_DOUBLE = 8
+    ONE_DOUBLE = 9
+    NAN_DOUBLE = 10
+    MIN_ID = 11
 
     def __init__(self):
         super().__init__(self.MIN_ID)
@@ -36,6 +54,9 @@ class HandleStore(BaseArrayStore):
         self._values[Constant.TRUE] = True
         self._values[Constant.GLOBAL] = GlobalObject()
         self._values[Constant.EMPTY_STRING] = ""
+        self._values[self.ZERO_DOUBLE] = 0.0
+        self._values[self.ONE_DOUBLE] = 1.0
+        self._values[self.NAN_DOUBLE] = float("nan")
 
     @property
     def next_id(self) -> int:
@@ -55,12 +76,39 @@ class HandleStore(BaseArrayStore):
         self._values[id] = value
         return id
 
+    def push_many(self, values: List[Any]) -> range:
+        """Add values under consecutive handle IDs and return the ID range."""
+        start = self._allocator.next
+        end = start + len(values)
+        self._allocator.next = end
+        # Grow if needed
+        if end > len(self._values):
+            self._values.extend(
+                [None] * (end - len(self._values) + len(self._values) // 2 + 16)
+            )
+        self._values[start:end] = values
+        return range(start, end)
+
     def get(self, id: int) -> Any:
         """Get value by handle ID."""
         # Handle None or invalid types
         if id is None:
             return None
 
+        # Small integers are encoded in the handle
+        if id & SMI_TAG:
+            return (id ^ SMI_TAG) - SMI_BIAS
+
+        # Scope handles index the value list directly; reference IDs are
+        # far beyond its length, so they never match here
+        values = self._values
+        if 0 <= id < len(values):
+            value = values[id]
+            # Check for weak reference
+            if isinstance(value, weakref.ref) and id >= self._allocator.next:
+                return value()
+            return value
+
         # Check if it's a reference (high bit set)
         if id < 0 or id > 0x7FFFFFFF:
             ref_id = id & 0x7FFFFFFF
@@ -71,13 +119,6 @@ class HandleStore(BaseArrayStore):
             if isinstance(ref, weakref.ref):
                 return ref()
             return ref
-
-        if 0 <= id < len(self._values):
-            value = self._values[id]
-            # Check for weak reference
-            if isinstance(value, weakref.ref) and self.is_out_of_scope(id):
-                return value()
-            return value
         return None
 
     def erase(self, start: int, end: int, weak: bool = False) -> None:
@@ -4,8 +4,8 @@ Handle scope for managing handle lifecycles.
 Reference: https://github.com/toyobayashi/emnapi/blob/main/packages/runtime/src/HandleScope.ts
 """
 
-from typing import Optional, Any, List, TYPE_CHECKING
-from dataclasses import dataclass, field
+from typing import Optional, Any, List, Sequence, TYPE_CHECKING
+from dataclasses import dataclass
 
 from .disposable import Disposable
 
@@ -13,17 +13,30 @@ if TYPE_CHECKING:
     from .handle import HandleStore
 
 
-@dataclass
+@dataclass(slots=True)
 class CallbackInfo:
-    """Information about the current callback invocation."""
+    """
+    Information about the current callback invocation.
+
+    Slotted, since every call into native code writes several fields.
+    """
 
     thiz: Any = None  # 'this' value
     holder: Any = None  # holder object
     data: int = 0  # callback data pointer
-    args: List[Any] = field(default_factory=list)  # arguments
+    args: Sequence[Any] = ()  # arguments, as passed to the call
     fn: Any = None  # the function being called
     new_target: Any = None  # new.target value
 
+    def reset(self) -> None:
+        """Clear the invocation state so the info can be reused."""
+        self.thiz = None
+        self.holder = None
+        self.data = 0
+        self.args = ()
+        self.fn = None
+        self.new_target = None
+
 
 class HandleScope(Disposable):
     """
@@ -60,6 +73,8 @@ class HandleScope(Disposable):
 
         self._escape_called = False
         self.callback_info = CallbackInfo()
+        # id() keys of native buffers created while this scope was current
+        self.buffer_keys: List[int] = []
 
     @classmethod
     def create(
@@ -76,7 +91,7 @@ class HandleScope(Disposable):
         """Reuse this scope with a new parent."""
         self.start = self.end = parent.end
         self._escape_called = False
-        self.callback_info = CallbackInfo()
+        self.callback_info.reset()
 
     def add(self, value: Any) -> int:
         """Add a value to this scope and return its handle ID."""
@@ -84,6 +99,13 @@ class HandleScope(Disposable):
         self.end = handle_id + 1
         return handle_id
 
+    def add_many(self, values: List[Any]) -> range:
+        """Add values to this scope and return their contiguous handle IDs."""
+        ids = self.handle_store.push_many(values)
+        if ids:
+            self.end = ids.stop
+        return ids
+
     def add_external(self, data: int) -> int:
         """Add an external value wrapper."""
         from .external import External
@@ -129,7 +151,7 @@ class HandleScope(Disposable):
 
         if not weak:
             # Clear callback info
-            self.callback_info = CallbackInfo()
+            self.callback_info.reset()
 
         if self.start != self.end:
             self.handle_store.erase(self.start, self.end, weak)
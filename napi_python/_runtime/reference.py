@@ -83,6 +83,12 @@ class Reference(RefTracker):
         # Weak callback data
         self._weak_callback: Optional[Callable] = None
         self._weak_callback_data: Any = None
+
+        # Native buffer handed out for a bytes-like value stays valid
+        # for as long as this reference exists
+        self._buffer_key = 0
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            self._buffer_key = ctx.pin_buffer(value)
         
         # Register in context
         ctx._ref_store[self.id] = self
@@ -178,6 +184,7 @@ class Reference(RefTracker):
         if not self._can_be_weak:
             # Can't make weak, so just clear it
             self._persistent_value = None
+            self._release_buffer()
             return
         
         if self._persistent_value is not None:
@@ -209,6 +216,12 @@ class Reference(RefTracker):
         """Invoke finalizer after GC collection."""
         self.finalize()
     
+    def _release_buffer(self) -> None:
+        """Drop this reference's hold on a native buffer, once."""
+        if self._buffer_key and self.ctx:
+            self.ctx.unpin_buffer(self._buffer_key)
+        self._buffer_key = 0
+
     def refcount(self) -> int:
         """Get current reference count."""
         return self._refcount
@@ -233,6 +246,7 @@ class Reference(RefTracker):
         """Finalize this reference."""
         self._persistent_value = None
         self._weak_ref = None
+        self._release_buffer()
         
         delete_me = self._ownership == ReferenceOwnership.kRuntime
         self.unlink()
@@ -247,6 +261,7 @@ class Reference(RefTracker):
             return
         
         self.unlink()
+        self._release_buffer()
         
         # Remove from context store
         if self.ctx and self.id in self.ctx._ref_store:
@@ -1 +1,8 @@
 """Threading support for NAPI."""
+
+from .completion import notify_waiters, wait_until
+
+__all__ = [
+    "notify_waiters",
+    "wait_until",
+]
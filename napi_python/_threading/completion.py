@@ -0,0 +1,81 @@
+"""
+Completion waiting for threadsafe function activity.
+
+Native addons report progress by calling threadsafe functions from worker
+threads and signal the end of their work by releasing them. Coroutines that
+wait on addon state register here and are woken as soon as queued calls are
+delivered or a threadsafe function is finalized, instead of sleeping on a
+fixed polling interval.
+"""
+
+import asyncio
+from typing import Callable, List, Optional
+
+_waiters: List[asyncio.Future] = []
+
+
+def _wake(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+def notify_waiters() -> None:
+    """
+    Wake every coroutine blocked in wait_until().
+
+    Safe to call from any thread; waiters are resumed on their own loop.
+    """
+    while _waiters:
+        try:
+            future = _waiters.pop()
+        except IndexError:
+            break  # Drained concurrently by another thread
+        try:
+            future.get_loop().call_soon_threadsafe(_wake, future)
+        except RuntimeError:
+            pass  # Waiter's loop is already closed
+
+
+async def wait_until(
+    predicate: Callable[[], bool],
+    timeout: Optional[float] = None,
+    poll_interval: float = 0.05,
+) -> None:
+    """
+    Wait until predicate() returns true.
+
+    The predicate is re-checked after every batch of threadsafe function
+    calls delivered on the loop and whenever a threadsafe function is
+    finalized, and at most every poll_interval seconds for state changes
+    that are not tied to threadsafe function activity.
+
+    Args:
+        predicate: Condition to wait for, evaluated on the event loop thread
+        timeout: Maximum time to wait in seconds, or None to wait forever
+        poll_interval: Fallback re-check interval in seconds
+
+    Raises:
+        asyncio.TimeoutError: If timeout elapses before predicate() is true
+    """
+    loop = asyncio.get_running_loop()
+    deadline = None if timeout is None else loop.time() + timeout
+
+    while not predicate():
+        delay = poll_interval
+        if deadline is not None:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise asyncio.TimeoutError()
+            delay = min(delay, remaining)
+
+        future = loop.create_future()
+        _waiters.append(future)
+        handle = loop.call_later(delay, _wake, future)
+        try:
+            await future
+        finally:
+            handle.cancel()
+            try:
+                _waiters.remove(future)
+            except ValueError:
+                pass  # Already popped by notify_waiters()
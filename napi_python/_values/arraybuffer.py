@@ -21,8 +21,10 @@ from ctypes import (
     POINTER,
     cast,
     c_char,
+    string_at,
 )
 from typing import Optional, Union, Type, Any
+import os
 import struct
 
 from .._napi.types import napi_typedarray_type
@@ -203,6 +205,38 @@ class TypedArray:
             return 0
         return self._buffer.data_ptr + self._byte_offset
 
+    def to_memoryview(self) -> memoryview:
+        """Get a zero-copy byte view of the array's backing memory."""
+        start = self._byte_offset
+        view = memoryview(self._buffer._buffer).cast("B")
+        return view[start : start + self.byte_length]
+
+    def __buffer__(self, flags: int) -> memoryview:
+        # PEP 688 (Python 3.12+): lets memoryview()/file.write() read the
+        # backing memory directly instead of copying through bytes()
+        return self.to_memoryview()
+
+    def write_to_fd(self, fd: int) -> int:
+        """
+        Write the array's bytes to a file descriptor without copying
+        them into a Python bytes object first.
+
+        Returns:
+            Number of bytes written
+        """
+        view = self.to_memoryview()
+        written = 0
+        while written < len(view):
+            written += os.write(fd, view[written:])
+        return written
+
+    def __bytes__(self) -> bytes:
+        # Single memcpy instead of element-wise iteration via __getitem__
+        ptr = self.data_ptr
+        if not ptr:
+            return b""
+        return string_at(ptr, self.byte_length)
+
     def __len__(self) -> int:
         return self._length
 
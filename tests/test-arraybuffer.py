@@ -1,6 +1,7 @@
 """Test ArrayBuffer and TypedArray functionality."""
 
 import sys
+import tempfile
 from pathlib import Path
 
 # Add parent to path
@@ -255,6 +256,26 @@ assert u8[6] == 0xAD, f"Expected 0xAD, got {hex(u8[6])}"
 assert u8[7] == 0xDE, f"Expected 0xDE, got {hex(u8[7])}"
 print("Shared memory tests passed")
 
+print("\n=== Buffer Protocol Tests ===")
+
+buf = ArrayBuffer.from_data(b"\x89PNG\r\n\x1a\nrest")
+u8 = TypedArray(napi_typedarray_type.napi_uint8_array, buf, byte_offset=4, length=6)
+view = u8.to_memoryview()
+assert view.tobytes() == b"\r\n\x1a\nre", f"Unexpected view {view.tobytes()!r}"
+assert bytes(u8) == b"\r\n\x1a\nre", f"Unexpected bytes {bytes(u8)!r}"
+
+# The view aliases the buffer memory rather than copying it
+view[0] = 0x41
+assert buf.to_bytes()[4] == 0x41, "View should write through to the buffer"
+print("TypedArray memoryview/bytes: OK")
+
+with tempfile.TemporaryFile() as f:
+    written = u8.write_to_fd(f.fileno())
+    f.seek(0)
+    assert written == 6, f"Expected 6 bytes written, got {written}"
+    assert f.read() == b"A\n\x1a\nre", "File should hold the view's bytes"
+print("TypedArray write_to_fd: OK")
+
 print("\n=== Zero-Length Buffer Tests ===")
 
 # Test zero-length ArrayBuffer
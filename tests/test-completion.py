@@ -0,0 +1,86 @@
+"""Test wait_until() and notify_waiters()."""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add parent to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from napi_python._threading.completion import wait_until, notify_waiters, _waiters
+
+print("=== Completion Tests ===")
+
+# Predicate already true: returns without registering a waiter
+print("\n--- Immediate predicate ---")
+
+
+async def immediate():
+    calls = []
+
+    def predicate():
+        calls.append(1)
+        return True
+
+    await wait_until(predicate, timeout=1.0)
+    return len(calls)
+
+
+calls = asyncio.run(immediate())
+assert calls == 1, f"Expected 1 predicate call, got {calls}"
+assert not _waiters, f"Expected no waiters left, got {len(_waiters)}"
+print("Immediate predicate: OK")
+
+# Timeout elapses while the predicate stays false
+print("\n--- Timeout ---")
+
+
+async def times_out():
+    start = time.monotonic()
+    try:
+        await wait_until(lambda: False, timeout=0.1, poll_interval=0.02)
+    except asyncio.TimeoutError:
+        return time.monotonic() - start
+    raise AssertionError("Expected asyncio.TimeoutError")
+
+
+elapsed = asyncio.run(times_out())
+print(f"Timed out after {elapsed:.3f}s")
+assert 0.1 <= elapsed < 1.0, f"Unexpected timeout duration {elapsed:.3f}s"
+assert not _waiters, f"Expected no waiters left, got {len(_waiters)}"
+print("Timeout: OK")
+
+# Another thread flips the state and wakes the waiter well before the
+# poll interval would have re-checked it
+print("\n--- Wakeup from another thread ---")
+
+
+async def woken():
+    done = threading.Event()
+
+    def worker():
+        time.sleep(0.05)
+        done.set()
+        notify_waiters()
+
+    thread = threading.Thread(target=worker)
+    start = time.monotonic()
+    thread.start()
+    await wait_until(done.is_set, timeout=5.0, poll_interval=2.0)
+    elapsed = time.monotonic() - start
+    thread.join()
+    return elapsed
+
+
+elapsed = asyncio.run(woken())
+print(f"Woken after {elapsed:.3f}s")
+assert elapsed < 1.0, f"Expected wakeup before the poll interval, took {elapsed:.3f}s"
+assert not _waiters, f"Expected no waiters left, got {len(_waiters)}"
+print("Wakeup from another thread: OK")
+
+# notify_waiters() with nobody waiting is a no-op
+notify_waiters()
+
+print("\n=== All completion tests passed! ===")
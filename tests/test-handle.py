@@ -0,0 +1,217 @@
+"""Test small-integer (SMI) handle encoding and strict equality."""
+
+import ctypes
+import math
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+from ctypes import CFUNCTYPE, byref, c_bool, c_double, c_int64, c_void_p
+from pathlib import Path
+
+# Add parent to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from napi_python._runtime.context import get_default_context
+from napi_python._runtime.handle import (
+    HandleStore,
+    SMI_TAG,
+    SMI_MIN,
+    SMI_MAX,
+    Undefined,
+    smi_handle,
+)
+from napi_python import _loader
+
+print("=== Handle Tests ===")
+
+# Test SMI round-trips through HandleStore.get
+print("\n--- SMI round-trip ---")
+store = HandleStore()
+for value in (0, 1, -1, 3, 2**31 - 1, -(2**31), 2**32, SMI_MIN, SMI_MAX):
+    handle = smi_handle(value)
+    assert handle & SMI_TAG, f"Expected SMI tag on handle for {value}"
+    assert store.get(handle) == value, f"Expected {value}, got {store.get(handle)}"
+    assert type(store.get(handle)) is int, f"Expected int for {value}"
+
+# Boundary values map to the ends of the encoded range
+assert smi_handle(SMI_MIN) == SMI_TAG, f"Unexpected SMI_MIN handle {smi_handle(SMI_MIN):#x}"
+assert smi_handle(SMI_MAX) == SMI_TAG | (2 * (SMI_MAX + 1) - 1)
+print(f"SMI_MIN={SMI_MIN}, SMI_MAX={SMI_MAX}")
+print("SMI round-trip tests: OK")
+
+# Test which values get an SMI handle
+print("\n--- SMI range ---")
+ctx = get_default_context()
+for value in (0, -7, SMI_MIN, SMI_MAX):
+    handle = ctx.napi_value_from_python(value)
+    assert handle == smi_handle(value), f"Expected SMI handle for {value}"
+
+# Out of range integers, floats and bools take regular handles
+for value in (SMI_MIN - 1, SMI_MAX + 1, 2**62, -(2**63), 3.0, True):
+    handle = ctx.napi_value_from_python(value)
+    assert not handle & SMI_TAG, f"Unexpected SMI handle for {value!r}"
+    got = ctx.python_value_from_napi(handle)
+    assert got == value and type(got) is type(value), f"Expected {value!r}, got {got!r}"
+print("SMI range tests: OK")
+
+# Test the table callbacks the shim forwards to
+print("\n--- Function table ---")
+table = _loader._func_table
+table.materialize_all()
+
+
+def table_function(name):
+    signature = dict(_loader._FUNCTION_SIGNATURES)[name]
+    return CFUNCTYPE(*signature)(getattr(table, name))
+
+
+create_int64 = table_function("create_int64")
+create_double = table_function("create_double")
+get_value_int64 = table_function("get_value_int64")
+strict_equals = table_function("strict_equals")
+
+
+def make_int64(value):
+    result = c_void_p()
+    assert create_int64(None, value, byref(result)) == 0
+    return result.value
+
+
+def make_double(value):
+    result = c_void_p()
+    assert create_double(None, value, byref(result)) == 0
+    return result.value
+
+
+def read_int64(handle):
+    result = c_int64()
+    assert get_value_int64(None, handle, byref(result)) == 0
+    return result.value
+
+
+def equals(lhs, rhs):
+    result = c_bool()
+    assert strict_equals(None, lhs, rhs, byref(result)) == 0
+    return result.value
+
+
+# create_int64 outside the SMI range stores the value in the handle store
+for value in (SMI_MAX + 1, SMI_MIN - 1, 2**63 - 1, -(2**63)):
+    handle = make_int64(value)
+    assert not handle & SMI_TAG, f"Unexpected SMI handle for {value}"
+    assert read_int64(handle) == value, f"Expected {value}, got {read_int64(handle)}"
+assert read_int64(make_int64(SMI_MAX)) == SMI_MAX
+
+# 3 === 3.0 holds across an SMI and a double handle
+assert equals(make_int64(3), make_double(3.0)), "Expected 3 === 3.0"
+assert equals(make_double(2.5), make_double(2.5)), "Expected 2.5 === 2.5"
+assert not equals(make_int64(3), make_int64(4)), "Expected 3 !== 4"
+# NaN !== NaN, whether it has the shared handle or not
+nan = make_double(math.nan)
+assert not equals(nan, nan), "Expected NaN !== NaN"
+assert not equals(nan, ctx.napi_value_from_python(math.nan)), "Expected NaN !== NaN"
+assert not equals(make_int64(1), ctx.napi_value_from_python(True)), "Expected 1 !== true"
+print("Function table tests: OK")
+
+# A lazy table leaves everything but the hot entries for the shim to request
+lazy_table = _loader._create_function_table(lazy=True)
+assert lazy_table.create_double, "Expected eager entry to be filled in"
+assert not lazy_table.strict_equals, "Expected lazy entry to be left empty"
+lazy_table.materialize_all()
+assert lazy_table.strict_equals, "Expected materialize_all() to fill in every entry"
+
+# Threads racing to fill in a lazy table leave every entry pointing at
+# the trampoline the table keeps alive
+lazy_table = _loader._create_function_table(lazy=True)
+barrier = threading.Barrier(8)
+
+
+def fill_table():
+    barrier.wait()
+    lazy_table.materialize_all()
+
+
+threads = [threading.Thread(target=fill_table) for _ in range(8)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+for (name, _), trampoline in zip(_loader._FUNCTION_SIGNATURES, lazy_table._trampolines):
+    assert getattr(lazy_table, name) == ctypes.cast(trampoline, c_void_p).value, (
+        f"Entry {name} does not point at its kept trampoline"
+    )
+print("Lazy table tests: OK")
+
+# The shim builds and reads SMI handles itself; check it agrees with
+# handle.py when a C compiler is available to build it
+print("\n--- Shim encoding ---")
+compiler = shutil.which("cc") or shutil.which("gcc")
+if compiler is None:
+    print("No C compiler found, skipping")
+else:
+    source = Path(__file__).parent.parent / "napi_python" / "_native" / "napi_shim.c"
+    with tempfile.TemporaryDirectory() as tmp:
+        lib_path = Path(tmp) / "libnapi_shim.so"
+        subprocess.run(
+            [compiler, "-shared", "-fPIC", "-o", str(lib_path), str(source)],
+            check=True,
+            capture_output=True,
+        )
+        shim = ctypes.CDLL(str(lib_path))
+    shim.napi_python_set_functions(byref(table))
+    shim.napi_create_int64.argtypes = [c_void_p, c_int64, ctypes.POINTER(c_void_p)]
+    shim.napi_create_double.argtypes = [c_void_p, c_double, ctypes.POINTER(c_void_p)]
+    shim.napi_get_value_int64.argtypes = [c_void_p, c_void_p, ctypes.POINTER(c_int64)]
+    shim.napi_strict_equals.argtypes = [c_void_p, c_void_p, c_void_p, ctypes.POINTER(c_bool)]
+
+    def shim_int64(value):
+        result = c_void_p()
+        assert shim.napi_create_int64(None, value, byref(result)) == 0
+        return result.value
+
+    def shim_double(value):
+        result = c_void_p()
+        assert shim.napi_create_double(None, value, byref(result)) == 0
+        return result.value
+
+    def shim_equals(lhs, rhs):
+        result = c_bool()
+        assert shim.napi_strict_equals(None, lhs, rhs, byref(result)) == 0
+        return result.value
+
+    for value in (0, -1, SMI_MIN, SMI_MAX):
+        assert shim_int64(value) == smi_handle(value), f"Shim encodes {value} differently"
+    for value in (SMI_MIN - 1, SMI_MAX + 1):
+        handle = shim_int64(value)
+        assert not handle & SMI_TAG, f"Unexpected SMI handle for {value}"
+        result = c_int64()
+        assert shim.napi_get_value_int64(None, handle, byref(result)) == 0
+        assert result.value == value, f"Expected {value}, got {result.value}"
+
+    assert shim_equals(shim_int64(3), shim_double(3.0)), "Expected 3 === 3.0"
+    assert not shim_equals(shim_double(math.nan), shim_double(math.nan)), "Expected NaN !== NaN"
+
+    # Reserved constants and the permanent doubles are answered in C
+    shim.napi_get_boolean.argtypes = [c_void_p, c_bool, ctypes.POINTER(c_void_p)]
+    shim.napi_is_promise.argtypes = [c_void_p, c_void_p, ctypes.POINTER(c_bool)]
+    result = c_void_p()
+    assert shim.napi_get_undefined(None, byref(result)) == 0
+    assert store.get(result.value) is Undefined, f"Expected undefined, got {store.get(result.value)!r}"
+    assert shim.napi_get_boolean(None, True, byref(result)) == 0
+    assert store.get(result.value) is True, f"Expected true, got {store.get(result.value)!r}"
+    for value in (0.0, 1.0):
+        handle = shim_double(value)
+        assert 0 < handle < HandleStore.MIN_ID, f"Expected permanent handle for {value}"
+        assert store.get(handle) == value, f"Expected {value}, got {store.get(handle)}"
+    assert shim_double(-0.0) >= HandleStore.MIN_ID, "-0.0 must not share the 0.0 handle"
+    assert math.isnan(store.get(shim_double(math.nan)))
+
+    is_promise = c_bool(True)
+    for handle in (shim_int64(3), shim_double(1.0), result.value):
+        assert shim.napi_is_promise(None, handle, byref(is_promise)) == 0
+        assert not is_promise.value, f"Expected no promise for handle {handle:#x}"
+    print("Shim encoding tests: OK")
+
+print("\n=== All handle tests passed! ===")
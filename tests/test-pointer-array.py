@@ -0,0 +1,78 @@
+"""Test PointerArray functionality."""
+
+import sys
+from pathlib import Path
+
+# Add parent to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from napi_python import PointerArray
+from napi_python._runtime.external import External, get_external_value, is_external
+
+print("=== PointerArray Tests ===")
+
+# Test append of External, int and None
+print("\n--- append ---")
+pointers = PointerArray()
+assert len(pointers) == 0, f"Expected empty array, got {len(pointers)}"
+pointers.append(External(0x1000))
+pointers.append(0x2000)
+pointers.append(None)
+print(f"{pointers!r}")
+assert len(pointers) == 3, f"Expected 3, got {len(pointers)}"
+assert pointers.address(0) == 0x1000, f"Expected 0x1000, got {pointers.address(0):#x}"
+assert pointers.address(1) == 0x2000, f"Expected 0x2000, got {pointers.address(1):#x}"
+assert pointers.address(2) == 0, f"Expected NULL, got {pointers.address(2):#x}"
+
+item = pointers[1]
+assert is_external(item), f"Expected an External, got {item!r}"
+assert get_external_value(item) == 0x2000, f"Unexpected value {item!r}"
+
+# Construction from an iterable goes through append
+pointers = PointerArray([External(0x10), 0x20])
+assert [pointers.address(i) for i in range(len(pointers))] == [0x10, 0x20]
+print("append tests: OK")
+
+# Test reserve followed by appends
+print("\n--- reserve ---")
+pointers = PointerArray()
+pointers.reserve(4)
+assert len(pointers) == 0, f"reserve() must not change length, got {len(pointers)}"
+for address in (0x100, 0x200, 0x300, 0x400, 0x500):
+    pointers.append(address)
+assert len(pointers) == 5, f"Expected 5, got {len(pointers)}"
+assert [pointers.address(i) for i in range(5)] == [0x100, 0x200, 0x300, 0x400, 0x500]
+
+# Reserving less than the current capacity keeps existing pointers
+pointers.reserve(2)
+assert len(pointers) == 5, f"Expected 5, got {len(pointers)}"
+assert pointers.address(4) == 0x500, f"Expected 0x500, got {pointers.address(4):#x}"
+print("reserve tests: OK")
+
+# Test negative indexes and bounds
+print("\n--- indexing ---")
+pointers = PointerArray()
+pointers.reserve(8)
+pointers.append(0xA)
+pointers.append(0xB)
+assert pointers.address(-1) == 0xB, f"Expected 0xb, got {pointers.address(-1):#x}"
+assert get_external_value(pointers[-2]) == 0xA, "Expected 0xa at index -2"
+
+# Reserved but unfilled slots are out of range
+for index in (2, 7, -3):
+    try:
+        pointers[index]
+    except IndexError:
+        pass
+    else:
+        raise AssertionError(f"Expected IndexError for index {index}")
+print("indexing tests: OK")
+
+# Test iteration stops at the length, not the reserved capacity
+print("\n--- iteration ---")
+values = [get_external_value(external) for external in pointers]
+assert values == [0xA, 0xB], f"Expected [0xa, 0xb], got {values}"
+assert all(isinstance(external, External) for external in pointers)
+print("iteration tests: OK")
+
+print("\n=== All PointerArray tests passed! ===")
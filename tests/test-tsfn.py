@@ -0,0 +1,145 @@
+"""Test threadsafe function delivery, finalization and id reuse."""
+
+import asyncio
+import ctypes
+import sys
+import threading
+from ctypes import CFUNCTYPE, byref, c_void_p
+from pathlib import Path
+
+# Add parent to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from napi_python import _loader, wait_until
+from napi_python._loader import NapiFinalize, NapiThreadsafeCallJs
+from napi_python._napi.types import napi_status
+from napi_python._runtime.context import get_default_context
+
+print("=== Threadsafe Function Tests ===")
+
+CALLS = 100
+
+ctx = get_default_context()
+env = ctx.create_env("test-tsfn")
+# Small batches, so delivery spans several drains
+env.callback_batch_size = 8
+
+table = _loader._func_table
+table.materialize_all()
+
+
+def table_function(name):
+    signature = dict(_loader._FUNCTION_SIGNATURES)[name]
+    return CFUNCTYPE(*signature)(getattr(table, name))
+
+
+create_tsfn = table_function("create_tsfn")
+call_tsfn = table_function("call_tsfn")
+acquire_tsfn = table_function("acquire_tsfn")
+release_tsfn = table_function("release_tsfn")
+
+
+class Recorder:
+    """Native-style call_js and finalize callbacks recording what they see."""
+
+    def __init__(self):
+        self.delivered = []
+        self.finalized = []
+        self.call_js = NapiThreadsafeCallJs(self._call_js)
+        self.finalize = NapiFinalize(self._finalize)
+
+    def _call_js(self, env_id, js_callback, context, data):
+        # Worker calls are queued and delivered on the loop thread
+        assert threading.current_thread() is threading.main_thread()
+        self.delivered.append(data)
+
+    def _finalize(self, env_id, data, hint):
+        # Record how many calls had been delivered when finalize ran
+        self.finalized.append(len(self.delivered))
+
+    def create(self, max_queue_size=0):
+        result = c_void_p()
+        status = create_tsfn(
+            env.id,
+            None,
+            None,
+            None,
+            max_queue_size,
+            1,
+            None,
+            ctypes.cast(self.finalize, c_void_p),
+            None,
+            ctypes.cast(self.call_js, c_void_p),
+            byref(result),
+        )
+        assert status == napi_status.napi_ok, f"create_tsfn failed: {status}"
+        return result.value
+
+
+def produce(tsfn_id):
+    """Queue CALLS non-blocking calls from a worker thread, then release."""
+    statuses = []
+
+    def worker():
+        for data in range(1, CALLS + 1):
+            statuses.append(call_tsfn(tsfn_id, data, 0))
+        statuses.append(release_tsfn(tsfn_id, 0))
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    return thread, statuses
+
+
+async def deliver(max_queue_size):
+    recorder = Recorder()
+    tsfn_id = recorder.create(max_queue_size)
+    thread, statuses = produce(tsfn_id)
+    await wait_until(lambda: recorder.finalized, timeout=5.0)
+    thread.join()
+    # Give a stray drain or second finalize a chance to run
+    await asyncio.sleep(0.05)
+    assert all(s == napi_status.napi_ok for s in statuses), f"Unexpected statuses {set(statuses)}"
+    return recorder
+
+
+# Test in-order delivery and deferred finalization, for the unbounded
+# (deque) and bounded (Queue) queues
+for max_queue_size in (0, CALLS):
+    kind = "bounded" if max_queue_size else "unbounded"
+    print(f"\n--- Delivery ({kind} queue) ---")
+    recorder = asyncio.run(deliver(max_queue_size))
+    expected = list(range(1, CALLS + 1))
+    assert recorder.delivered == expected, f"Calls delivered out of order or lost: {recorder.delivered[:10]}"
+    assert recorder.finalized == [CALLS], f"Expected one finalize after {CALLS} calls, got {recorder.finalized}"
+    print(f"Delivered {len(recorder.delivered)} calls, finalized once")
+print("Delivery tests: OK")
+
+# Test that a released id stays invalid after its slot is reused
+print("\n--- Stale ids ---")
+
+
+async def reuse():
+    first = Recorder()
+    old_id = first.create()
+    assert release_tsfn(old_id, 0) == napi_status.napi_ok
+    assert first.finalized == [0], f"Expected immediate finalize, got {first.finalized}"
+
+    second = Recorder()
+    new_id = second.create()
+    assert new_id & 0xFFFFFFFF == old_id & 0xFFFFFFFF, "Expected the freed slot to be reused"
+    assert new_id != old_id, "Expected a new generation for the reused slot"
+
+    assert call_tsfn(old_id, 1, 0) == napi_status.napi_invalid_arg
+    assert acquire_tsfn(old_id) == napi_status.napi_invalid_arg
+    # The new TSFN is unaffected by calls through the stale id
+    assert call_tsfn(new_id, 7, 0) == napi_status.napi_ok
+    assert second.delivered == [7], f"Expected [7], got {second.delivered}"
+    assert release_tsfn(new_id, 0) == napi_status.napi_ok
+    assert second.finalized == [1], f"Expected one finalize, got {second.finalized}"
+    assert not first.delivered, f"Stale id reached a TSFN: {first.delivered}"
+
+
+asyncio.run(reuse())
+print("Stale id tests: OK")
+
+print("\n=== All threadsafe function tests passed! ===")